@@ -0,0 +1,85 @@
+"""
+Compare XLSX engines on a single large sheet.
+
+Times a full read of the first sheet with the openpyxl ``XLSXReader``, the
+native engine and the pipelined native engine (inflate and parse on separate
+threads). Without a file argument a workbook is generated first.
+
+Usage:
+    python benchmarks/bench_pipeline.py [FILE.xlsx] [--rows N] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from xlsx2md.readers import get_reader  # noqa: E402
+
+ENGINES = ["openpyxl", "native", "pipelined"]
+
+
+def generate_workbook(path: str, rows: int, cols: int = 12) -> None:
+    """Write a single-sheet workbook with mixed numbers and strings."""
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    sheet.append([f"Column {c}" for c in range(cols)])
+    for r in range(rows):
+        sheet.append(
+            [r * c + 0.5 if c % 2 else f"text {r % 977} {c}" for c in range(cols)]
+        )
+    workbook.save(path)
+
+
+def time_engine(path: str, engine: str, repeat: int) -> float:
+    """Return the median wall time of reading the first sheet."""
+    timings = []
+    for _ in range(repeat):
+        reader = get_reader(path, engine)
+        start = time.perf_counter()
+        data = reader.read(path)
+        timings.append(time.perf_counter() - start)
+        assert data, "no rows read"
+    return statistics.median(timings)
+
+
+def report(path: str, repeat: int) -> None:
+    """Print the median read time and speedup of every engine."""
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"File: {path} ({size_mb:.1f} MB), CPUs: {os.cpu_count()}")
+    print(f"{'engine':<10} {'median s':>9} {'speedup':>8}")
+
+    baseline = None
+    for engine in ENGINES:
+        elapsed = time_engine(path, engine, repeat)
+        baseline = baseline or elapsed
+        print(f"{engine:<10} {elapsed:9.2f} {baseline / elapsed:7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file", nargs="?", help="XLSX file (generated if omitted)")
+    parser.add_argument("--rows", type=int, default=200000, help="Generated rows")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine")
+    args = parser.parse_args()
+
+    if args.file is not None:
+        report(args.file, args.repeat)
+        return
+
+    # The generated workbook is removed with its directory
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.xlsx")
+        print(f"Generating {args.rows} rows in {path} ...")
+        generate_workbook(path, args.rows)
+        report(path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import openpyxl
+import pytest
+from typer.testing import CliRunner
+
+
+@pytest.fixture
+def runner():
+    """CLI runner for invoking the typer app."""
+    return CliRunner()
+
+
+@pytest.fixture
+def make_workbook(tmp_path):
+    """
+    Factory that saves an XLSX workbook built with openpyxl.
+
+    The factory takes a mapping of sheet titles to rows (appended in order,
+    an empty row leaves a blank row), an optional file name and an optional
+    mapping of sheet titles to sheet states, and returns the file path as a
+    string. Saving under the same name again overwrites the file.
+    """
+
+    def make(sheets, name="book.xlsx", states=None):
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+        for title, rows in sheets.items():
+            sheet = workbook.create_sheet(title)
+            for row in rows:
+                sheet.append(row)
+        for title, state in (states or {}).items():
+            workbook[title].sheet_state = state
+        path = tmp_path / name
+        workbook.save(path)
+        return str(path)
+
+    return make
@@ -210,12 +210,10 @@ class TestCLIExcel:
         """Test Excel info functionality."""
         # Mock reader with sheet info
         mock_reader = MagicMock()
-        mock_reader.get_sheet_names.return_value = ["Sheet1", "Sheet2"]
-        mock_reader.get_sheet_info.return_value = {
-            "name": "Sheet1",
-            "nrows": 10,
-            "ncols": 5,
-        }
+        mock_reader.get_workbook_info.return_value = [
+            {"index": 0, "name": "Sheet1", "nrows": 10, "ncols": 5},
+            {"index": 1, "name": "Sheet2", "nrows": 3, "ncols": 2},
+        ]
         mock_get_reader.return_value = mock_reader
 
         with tempfile.NamedTemporaryFile(suffix=".xlsx") as temp_file:
@@ -223,6 +221,9 @@ class TestCLIExcel:
             assert result.exit_code == 0
             assert "File Information" in result.stdout
             assert "Sheet1" in result.stdout
+            assert "10 rows" in result.stdout
+            mock_reader.get_workbook_info.assert_called_once()
+            mock_reader.get_sheet_info.assert_not_called()
 
 
 class TestCLIErrorHandling:
@@ -345,3 +346,30 @@ class TestCLIParameterCombinations:
                 finally:
                     os.unlink(input_file.name)
                     os.unlink(output_file.name)
+
+
+class TestCLIMaxRows:
+    """Tests for --max-rows / --head."""
+
+    def test_head_limits_data_rows(self):
+        """Test that --head keeps the first N non-empty rows."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", delete=False
+        ) as temp_file:
+            temp_file.write("Name,Age\n\nAlice,30\nBob,25\nCharlie,35\n")
+            temp_file.close()
+
+            try:
+                for option in ("--head", "--max-rows"):
+                    result = runner.invoke(app, [temp_file.name, option, "2"])
+                    assert result.exit_code == 0
+                    assert "Alice" in result.stdout
+                    assert "Bob" not in result.stdout
+            finally:
+                os.unlink(temp_file.name)
+
+    def test_head_must_be_positive(self):
+        """Test validation of --head value."""
+        with tempfile.NamedTemporaryFile(suffix=".csv") as temp_file:
+            result = runner.invoke(app, [temp_file.name, "--head", "0"])
+            assert result.exit_code != 0
@@ -0,0 +1,127 @@
+"""
+Tests for CSV metadata from raw bytes.
+"""
+
+import csv
+import io
+import random
+from unittest.mock import patch
+
+import pytest
+
+from xlsx2md.cli import app
+from xlsx2md.readers import CSVReader, read_file
+from xlsx2md.readers.csv_metadata import count_records
+
+TRICKY = (
+    b'id,note\r\n1,"multi\r\nline"\r\n\r\n2,"say ""hi""\nthere",x\r\n'
+    b'3,"""",\n4,"a\nb""\nc"'
+)
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 1024])
+@pytest.mark.parametrize("data", [TRICKY, TRICKY + b"\r\n", b"", b"a\n", b'"\n'])
+def test_count_records_matches_csv_reader(data, block_size):
+    """Test that the byte scan counts the records csv.reader yields."""
+    expected = len(list(csv.reader(io.StringIO(data.decode(), newline=""))))
+    assert count_records(io.BytesIO(data), b'"', block_size=block_size) == expected
+
+
+def test_count_records_without_quotes():
+    """Test carriage-return terminators and literal quote characters."""
+    assert count_records(io.BytesIO(b'a\r"b\rc'), None, b"\r") == 3
+
+
+@pytest.fixture
+def multiline_csv(tmp_path):
+    """CSV file whose quoted fields span lines."""
+    path = tmp_path / "notes.csv"
+    rows = [["id", "note", "value"]]
+    rows += [[str(i), f'line {i}\nnext "{i}"', "x"] for i in range(500)]
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv.writer(file, delimiter=";").writerows(rows)
+    return str(path)
+
+
+def test_get_file_info(multiline_csv):
+    """Test that records, dialect and size come from the metadata scan."""
+    with patch.object(CSVReader, "_iter_csv_records") as parse:
+        info = CSVReader().get_file_info(multiline_csv)
+
+    parse.assert_not_called()
+    assert info["row_count"] == 501
+    assert info["row_count"] == len(read_file(multiline_csv))
+    assert info["record_count"] == info["row_count"]
+    assert info["delimiter"] == ";"
+    assert info["quotechar"] == '"'
+    assert info["lineterminator"] == "\r\n"
+    assert info["ncols"] == 3
+    assert info["exact"] is True
+    assert info["size"] > 0
+
+
+def test_record_count_includes_blank_lines(tmp_path):
+    """Test that records are not the non-empty rows of get_workbook_info."""
+    path = tmp_path / "blank.csv"
+    path.write_text("a,b\n\n1,2\n,\n")
+    reader = CSVReader()
+    assert reader.get_file_info(str(path))["record_count"] == 4
+    assert reader.get_workbook_info(str(path))[0]["nrows"] == 2
+
+
+def test_get_file_info_utf16(tmp_path):
+    """Test that files that cannot be scanned as bytes are parsed."""
+    path = tmp_path / "wide.csv"
+    path.write_text('a,b\n1,"x\ny"\n', encoding="utf-16")
+    info = CSVReader().get_file_info(str(path))
+    assert info["encoding"].startswith("utf-16")
+    assert info["row_count"] == 2
+
+
+def test_get_file_info_empty(tmp_path):
+    """Test that empty files have no records."""
+    path = tmp_path / "empty.csv"
+    path.write_bytes(b"")
+    info = CSVReader().get_file_info(str(path))
+    assert info["row_count"] == 0
+    assert info["ncols"] == 0
+
+
+def test_get_file_info_approx(tmp_path):
+    """Test that the sampled estimate is close to the exact count."""
+    rng = random.Random(1)
+    path = tmp_path / "big.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        for i in range(20000):
+            note = "two\nlines" if i % 4 == 0 else "x" * rng.randint(1, 30)
+            writer.writerow([i, note, rng.random()])
+
+    reader = CSVReader()
+    with patch("xlsx2md.readers.csv_reader.CSV_APPROX_SEGMENT_KB", 4):
+        info = reader.get_file_info(str(path), approx=True)
+    assert info["exact"] is False
+    assert abs(info["row_count"] - 20000) < 20000 * 0.05
+    assert reader.get_file_info(str(path))["row_count"] == 20000
+
+
+def test_sniffed_dialect_keeps_doubled_quotes(tmp_path):
+    """Test that doubled quotes escape quotes when the sample has none."""
+    path = tmp_path / "quotes.csv"
+    path.write_text("a,b\n1,plain\n" * 60 + '2,"say ""hi""\nthere"\n')
+    assert read_file(str(path))[-1] == ["2", 'say "hi" there']
+
+
+def test_cli_info_csv(multiline_csv, runner):
+    """Test that --info shows the CSV metadata and --approx marks estimates."""
+    result = runner.invoke(app, [multiline_csv, "--info"])
+    assert result.exit_code == 0
+    assert "501" in result.stdout
+    assert "';'" in result.stdout
+
+    with patch("xlsx2md.readers.csv_reader.CSV_APPROX_SEGMENT_KB", 1), patch(
+        "xlsx2md.readers.csv_reader.CSV_APPROX_SEGMENTS", 4
+    ):
+        result = runner.invoke(app, [multiline_csv, "--info", "--approx"])
+    assert result.exit_code == 0
+    assert "~" in result.stdout
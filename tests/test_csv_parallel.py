@@ -0,0 +1,100 @@
+"""
+Tests for parallel CSV parsing.
+"""
+
+import csv
+import io
+import random
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from xlsx2md.cli import app
+from xlsx2md.readers import CSVReader, read_file
+from xlsx2md.readers.csv_parallel import (
+    can_split,
+    iter_byte_ranges,
+    parse_byte_range,
+)
+
+runner = CliRunner()
+
+FMTPARAMS = {"delimiter": ",", "quotechar": '"'}
+
+
+def make_rows(count):
+    """Rows with quoted newlines, doubled quotes and delimiters."""
+    rng = random.Random(1)
+    values = ["plain", 'say ""hi""', "multi\nline", "a,b", "cr\r\nlf", "é"]
+    return [[str(i), rng.choice(values), rng.choice(values)] for i in range(count)]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file whose quoted fields contain newlines."""
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerows([["id", "first", "second"]] + make_rows(2000))
+    path = tmp_path / "data.csv"
+    path.write_bytes(buffer.getvalue().encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 333, 4096, 10**6])
+def test_byte_ranges_align_to_records(csv_path, chunk_size):
+    """Test that ranges cover the file and never split a quoted field."""
+    with open(csv_path, "rb") as file:
+        data = file.read()
+        ranges = list(iter_byte_ranges(file, len(data), chunk_size, b'"'))
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    records = [
+        record
+        for start, end in ranges
+        for record in parse_byte_range(csv_path, start, end, "utf-8", FMTPARAMS)
+    ]
+    expected = list(csv.reader(io.StringIO(data.decode(), newline="")))
+    assert records == expected
+
+
+def test_can_split():
+    """Test encodings and dialects that rule out byte ranges."""
+    assert can_split("utf-8", FMTPARAMS)
+    assert can_split("cp1251", FMTPARAMS)
+    assert not can_split("utf-16", FMTPARAMS)
+    assert not can_split("utf-8", dict(FMTPARAMS, escapechar="\\"))
+    assert not can_split("utf-8", dict(FMTPARAMS, doublequote=False))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"max_rows": 7}, {"cell_range": "A5:B9"}])
+def test_read_with_workers(csv_path, kwargs, caplog):
+    """Test that worker processes return the serial result in order."""
+    serial = read_file(csv_path, **kwargs)
+
+    with patch("xlsx2md.readers.csv_reader.CSV_PARALLEL_MIN_MB", 0), patch(
+        "xlsx2md.readers.csv_parallel.CSV_PARALLEL_CHUNK_MB", 0.01
+    ), caplog.at_level("INFO", logger="xlsx2md.readers.csv_parallel"):
+        parallel = read_file(csv_path, jobs=2, **kwargs)
+
+    assert "with 2 workers" in caplog.text
+    assert parallel == serial
+
+
+def test_small_files_are_parsed_serially(csv_path):
+    """Test the fallback below CSV_PARALLEL_MIN_MB."""
+    with patch("xlsx2md.readers.csv_reader.iter_records_parallel") as parallel:
+        data = CSVReader(jobs=4).read(csv_path)
+    parallel.assert_not_called()
+    assert len(data) == 2001
+
+
+def test_cli_jobs_csv(csv_path):
+    """Test --jobs with a CSV file."""
+    serial = runner.invoke(app, [csv_path])
+    with patch("xlsx2md.readers.csv_reader.CSV_PARALLEL_MIN_MB", 0), patch(
+        "xlsx2md.readers.csv_parallel.CSV_PARALLEL_CHUNK_MB", 0.01
+    ):
+        parallel = runner.invoke(app, [csv_path, "--jobs", "2"])
+    assert parallel.exit_code == 0
+    assert parallel.stdout == serial.stdout
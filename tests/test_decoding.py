@@ -0,0 +1,72 @@
+"""
+Tests for single-pass CSV decoding.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+from xlsx2md.readers import CSVReader, read_file
+from xlsx2md.readers.decoding import FallbackDecoder, iter_line_blocks
+
+MIXED = "Zoë;€\n" * 3 + "Имя;Город\r\n"
+MIXED_BYTES = ("Zoë;€\n" * 3).encode("utf-8") + "Имя;Город\r\n".encode("cp1251")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_decoder_switches_at_failure(chunk_size, caplog):
+    """Test that text before the bad byte keeps the original codec."""
+    decoder = FallbackDecoder("utf-8", ["utf-8", "cp1251", "latin-1"])
+    text = "".join(
+        decoder.decode(MIXED_BYTES[i : i + chunk_size])
+        for i in range(0, len(MIXED_BYTES), chunk_size)
+    )
+    text += decoder.decode(b"", final=True)
+
+    assert text == MIXED
+    assert decoder.encoding == "cp1251"
+    assert "Cannot decode byte 27 as utf-8, switching to cp1251" in caplog.text
+
+
+def test_decoder_without_fallback():
+    """Test that the error is raised when no fallback decodes the data."""
+    decoder = FallbackDecoder("utf-8", ["utf-8", "ascii"])
+    with pytest.raises(UnicodeDecodeError):
+        decoder.decode(b"ok \xff", final=True)
+
+
+@pytest.mark.parametrize("chunk_kb", [1, 64])
+def test_line_blocks_split_like_text_files(chunk_kb):
+    """Test that lines match a file opened with newline=''."""
+    # The first \r\n straddles the 1 KB chunk boundary
+    data = b"a,b\r\n" * 204 + b"xyz\r\n" + b'"x\ry",z\r' + b"c\rd\n" * 300 + b"tail"
+    lines = [
+        line
+        for block in iter_line_blocks(
+            io.BytesIO(data), FallbackDecoder("utf-8"), chunk_kb
+        )
+        for line in block
+    ]
+    expected = io.TextIOWrapper(io.BytesIO(data), newline="").readlines()
+    assert lines == expected
+
+
+def test_csv_single_pass(tmp_path):
+    """Test that a late decode error neither re-reads the file nor loses the dialect."""
+    path = tmp_path / "mixed.csv"
+    path.write_bytes(MIXED_BYTES)
+
+    with patch("builtins.open", wraps=open) as opened:
+        data = read_file(str(path), encoding="utf-8")
+
+    assert data == [["Zoë", "€"]] * 3 + [["Имя", "Город"]]
+    assert opened.call_count == 1
+
+
+def test_read_with_delimiter_switches_codec(tmp_path):
+    """Test that explicit delimiters use the same decoding path."""
+    path = tmp_path / "mixed.csv"
+    path.write_bytes(MIXED_BYTES)
+    data = CSVReader().read_with_delimiter(str(path), ";", encoding="utf-8")
+    assert data[-1] == ["Имя", "Город"]
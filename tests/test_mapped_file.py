@@ -0,0 +1,107 @@
+"""
+Tests for memory-mapped input files.
+"""
+
+import io
+import os
+import zipfile
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+
+from xlsx2md.readers import NativeXLSXReader, read_file, XLSReader, XLSXReader
+from xlsx2md.readers.mapped_file import map_file, MappedFile, xlrd_source
+
+
+def test_mapped_file_read_and_seek(tmp_path):
+    """Test file-like behaviour of a mapped file."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"0123456789")
+
+    with MappedFile(str(path)) as mapped:
+        assert len(mapped) == 10
+        assert mapped.read(3) == b"012"
+        assert mapped.tell() == 3
+        assert mapped.seek(-2, io.SEEK_END) == 8
+        assert mapped.read() == b"89"
+        assert mapped.read(5) == b""
+        mapped.seek(2)
+        mapped.seek(3, io.SEEK_CUR)
+        assert mapped.read(1) == b"5"
+        with pytest.raises(ValueError):
+            mapped.seek(-1)
+    assert mapped.closed
+
+
+def test_map_file_falls_back(tmp_path):
+    """Test that unmappable files are opened by path."""
+    empty = tmp_path / "empty.xls"
+    empty.write_bytes(b"")
+    assert map_file(str(empty)) is None
+    assert map_file(str(tmp_path / "missing.xls")) is None
+    assert xlrd_source(str(empty)) == {"filename": str(empty)}
+
+    data = tmp_path / "data.xls"
+    data.write_bytes(b"data")
+    assert "file_contents" in xlrd_source(str(data))
+    with patch("xlsx2md.readers.mapped_file.USE_MMAP", False):
+        assert map_file(str(data)) is None
+
+
+def test_zipfile_over_mapped_file(tmp_path):
+    """Test that zip members can be read from a mapped archive."""
+    path = tmp_path / "data.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("part.xml", "<a>" + "x" * 100000 + "</a>")
+
+    with MappedFile(str(path)) as mapped, zipfile.ZipFile(mapped) as archive:
+        assert archive.read("part.xml").startswith(b"<a>xxx")
+
+
+@pytest.fixture
+def xlsx_path(tmp_path):
+    """Small workbook."""
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["a", "b"])
+    workbook.active.append([1, 2])
+    path = tmp_path / "data.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("reader_class", [XLSXReader, NativeXLSXReader])
+def test_xlsx_workbook_is_mapped_and_unmapped(xlsx_path, reader_class):
+    """Test that XLSX workbooks are read from a mapping closed on close."""
+    reader = reader_class()
+    mapped = []
+
+    def map_and_record(file_path):
+        mapped.append(MappedFile(file_path))
+        return mapped[-1]
+
+    with patch("xlsx2md.readers.mapped_file.MappedFile", side_effect=map_and_record):
+        workbook = reader.open_workbook(xlsx_path)
+        assert reader.read_sheet(workbook) == [["a", "b"], ["1", "2"]]
+        assert not mapped[0].closed
+        reader.close_workbook(workbook)
+
+    assert len(mapped) == 1
+    assert mapped[0].closed
+
+
+def test_xls_read_from_mapping(tmp_path):
+    """Test that XLS workbooks are read from the mapping."""
+    xlwt = pytest.importorskip("xlwt")
+    workbook = xlwt.Workbook()
+    sheet = workbook.add_sheet("First")
+    sheet.write(0, 0, "a")
+    sheet.write(1, 0, 1.5)
+    path = str(tmp_path / "book.xls")
+    workbook.save(path)
+
+    with patch("xlrd.open_workbook", wraps=__import__("xlrd").open_workbook) as opened:
+        assert read_file(path) == [["a"], ["1.5"]]
+    assert "file_contents" in opened.call_args.kwargs
+    assert XLSReader().get_sheet_names(path) == ["First"]
+    assert os.path.exists(path)
@@ -0,0 +1,127 @@
+"""
+Tests for parallel sheet conversion.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from xlsx2md.cli import app
+from xlsx2md.parallel import render_sheet, render_sheets_parallel
+from xlsx2md.readers import open_workbook, read_file
+from xlsx2md.readers.mapped_file import extract_workbook_stream
+
+
+@pytest.fixture
+def workbook_path(make_workbook):
+    """Workbook with several sheets, one of them empty."""
+    sheets = {"Sheet0": [["a", "b"]]}
+    for i in range(1, 5):
+        sheets[f"Sheet{i}"] = [] if i == 2 else [[f"h{i}", "x"], [i, i * 2]]
+    return make_workbook(sheets)
+
+
+def test_render_sheet_placeholders():
+    """Test placeholders for empty and failing sheets."""
+    session = MagicMock()
+    session.read.return_value = []
+    assert render_sheet(session, 0, None, "default", None, "") == (
+        "*No data in this sheet*\n"
+    )
+
+    session.read.side_effect = ValueError("boom")
+    assert render_sheet(session, 0, None, "default", None, "") == (
+        "*Error processing sheet: boom*\n"
+    )
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_render_sheets_parallel_keeps_order(workbook_path, engine):
+    """Test that parallel results match serial rendering order."""
+    with open_workbook(workbook_path, engine) as session:
+        expected = [
+            render_sheet(session, i, None, "default", None, "") for i in range(5)
+        ]
+
+    actual = list(
+        render_sheets_parallel(
+            workbook_path, range(5), None, "default", None, "", engine=engine, jobs=3
+        )
+    )
+    assert actual == expected
+
+
+def test_cli_jobs_output_matches_serial(workbook_path, runner):
+    """Test that --jobs produces the same output as serial processing."""
+    serial = runner.invoke(app, [workbook_path, "--all-sheets"])
+    parallel = runner.invoke(app, [workbook_path, "--all-sheets", "--jobs", "2"])
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert parallel.stdout == serial.stdout
+    assert "*No data in this sheet*" in parallel.stdout
+    assert parallel.stdout.count("\n---\n") == 4
+
+
+@pytest.fixture
+def xls_path(tmp_path):
+    """XLS workbook with several sheets."""
+    xlwt = pytest.importorskip("xlwt")
+    workbook = xlwt.Workbook()
+    for i in range(4):
+        sheet = workbook.add_sheet(f"Sheet{i}")
+        sheet.write(0, 0, f"h{i}")
+        sheet.write(1, 0, i)
+    path = tmp_path / "book.xls"
+    workbook.save(str(path))
+    return str(path)
+
+
+def test_render_xls_sheets_parallel(xls_path):
+    """Test that XLS sheets rendered by workers keep sheet order."""
+    with open_workbook(xls_path) as session:
+        expected = [
+            render_sheet(session, i, None, "default", None, "") for i in range(4)
+        ]
+
+    actual = list(
+        render_sheets_parallel(xls_path, range(4), None, "default", None, "", jobs=2)
+    )
+    assert actual == expected
+    assert "| h3 " in actual[3]
+
+
+def test_fragmented_xls_stream_is_shared(xls_path):
+    """Test that a fragmented workbook stream is copied once for workers."""
+    from xlrd import compdoc
+
+    locate = compdoc.CompDoc.locate_named_stream
+
+    def fragmented(document, name):
+        stream, base, size = locate(document, name)
+        if stream is None:
+            return stream, base, size
+        return bytes(stream[base : base + size]), 0, size
+
+    assert extract_workbook_stream(xls_path) is None
+    with patch.object(compdoc.CompDoc, "locate_named_stream", fragmented):
+        stream_path = extract_workbook_stream(xls_path)
+    try:
+        assert stream_path.endswith(".xls")
+        assert read_file(stream_path, 2) == read_file(xls_path, 2)
+    finally:
+        os.unlink(stream_path)
+
+    with patch(
+        "xlsx2md.parallel.extract_workbook_stream", return_value=stream_path
+    ), patch("xlsx2md.parallel.ProcessPoolExecutor") as executor:
+        executor.return_value.__enter__.return_value.map.return_value = ["body"]
+        with open(stream_path, "wb"):
+            pass
+        result = list(
+            render_sheets_parallel(xls_path, [0], None, "default", None, "", jobs=2)
+        )
+    assert result == ["body"]
+    assert executor.call_args.kwargs["initargs"] == (stream_path, None)
+    assert not os.path.exists(stream_path)
@@ -0,0 +1,74 @@
+"""
+Tests for the pipelined (background inflate) XLSX engine.
+"""
+
+import io
+
+import openpyxl
+import pytest
+
+from xlsx2md.readers import get_reader, NativeXLSXReader, read_file
+from xlsx2md.readers.prefetch import PrefetchStream
+
+
+class _FailingStream(io.BytesIO):
+    """Stream that fails after the first chunk."""
+
+    def read(self, size=-1):
+        if self.tell():
+            raise OSError("inflate failed")
+        return super().read(size)
+
+
+def test_prefetch_stream_returns_all_chunks():
+    """Test that chunks arrive in order followed by end of stream."""
+    payload = bytes(range(256)) * 100
+    source = io.BytesIO(payload)
+    with PrefetchStream(source, chunk_size=1000, queue_chunks=2) as stream:
+        chunks = iter(lambda: stream.read(1000), b"")
+        assert b"".join(chunks) == payload
+        assert stream.read() == b""
+    assert source.closed
+
+
+def test_prefetch_stream_close_stops_producer():
+    """Test that closing early stops a producer blocked on a full queue."""
+    stream = PrefetchStream(io.BytesIO(b"x" * 10000), chunk_size=10, queue_chunks=1)
+    assert stream.read() == b"x" * 10
+    stream.close()
+    assert not stream._thread.is_alive()
+
+
+def test_prefetch_stream_propagates_errors():
+    """Test that read errors of the producer are raised by read()."""
+    with PrefetchStream(_FailingStream(b"abc"), chunk_size=2) as stream:
+        assert stream.read() == b"ab"
+        with pytest.raises(OSError, match="inflate failed"):
+            stream.read()
+        assert stream.read() == b""
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """Workbook large enough to span several XML chunks."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Id", "Name", "Value"])
+    for i in range(3000):
+        sheet.append([i, f"name {i % 50}", i * 0.25])
+    path = tmp_path / "data.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+def test_pipelined_engine_matches_native(workbook_path):
+    """Test that the pipelined engine returns the same data."""
+    reader = get_reader(workbook_path, "pipelined")
+    assert isinstance(reader, NativeXLSXReader) and reader.pipelined
+
+    expected = read_file(workbook_path, engine="native")
+    assert read_file(workbook_path, engine="pipelined") == expected
+    assert read_file(
+        workbook_path, engine="pipelined", cell_range="B10:C20"
+    ) == read_file(workbook_path, engine="native", cell_range="B10:C20")
+    assert read_file(workbook_path, engine="pipelined", max_rows=5) == expected[:5]
@@ -0,0 +1,198 @@
+"""
+Tests for column projection.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from xlsx2md.cli import app
+from xlsx2md.readers import ColumnProjection, read_file, XLSReader
+from xlsx2md.utils import parse_column_list
+
+
+@pytest.fixture
+def xlsx_path(make_workbook):
+    """Workbook with a header row below an empty row."""
+    rows = [
+        [],
+        ["Id", "Name", "Price", "Qty"],
+        [1, "Widget", 9.5, 3],
+        [2, "Gadget", 20, None],
+    ]
+    return make_workbook({"Sheet": rows}, "data.xlsx")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file with a header row."""
+    path = tmp_path / "data.csv"
+    path.write_text("Id,Name,Price,Qty\n1,Widget,9.5,3\n2,Gadget,20,\n")
+    return str(path)
+
+
+def test_parse_column_list():
+    """Test parsing of --columns values."""
+    assert parse_column_list("A, 2, 'Unit Price',") == ["A", 2, "Unit Price"]
+    assert parse_column_list(" , ") == []
+
+
+def test_projection_bounds():
+    """Test that only indexes give known bounds."""
+    assert ColumnProjection([2, 0]).bounds == (0, 2)
+    assert ColumnProjection(["C", 0]).bounds is None
+    assert ColumnProjection(["C", "Price"]).bounds is None
+    assert ColumnProjection(["Price"]).needs_header
+    with pytest.raises(ValueError, match="Invalid column selection"):
+        ColumnProjection([])
+
+
+def test_projection_resolve_header():
+    """Test case-insensitive header lookup and offsets."""
+    projection = ColumnProjection(["price", "B"])
+    projection.resolve(["Name", "Price"], offset=1)
+    assert projection.project(["Widget", 9.5]) == [9.5, "Widget"]
+    assert projection.project(["Gadget"]) == [None, "Gadget"]
+
+    with pytest.raises(ValueError, match="Column not found: A"):
+        ColumnProjection(["A"]).resolve(offset=1)
+    with pytest.raises(ValueError, match="Column not found: Total"):
+        ColumnProjection(["Total"]).resolve(["Name", "Price"])
+
+
+def test_projection_prefers_header_names():
+    """Test that headers that look like column letters are matched by name."""
+    projection = ColumnProjection(["ID", "B", "Sku"])
+    projection.resolve(["Name", "Id", "SKU"])
+    assert projection.positions == [1, 1, 2]
+
+    with pytest.raises(ValueError, match="Column not found: SKU"):
+        ColumnProjection(["SKU"]).resolve(["Name", "Price"])
+    with pytest.raises(ValueError, match="Column not found: D"):
+        ColumnProjection(["D"]).resolve(["Name", "Price"], offset=1)
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+@pytest.mark.parametrize(
+    "columns",
+    [["C", "B"], [2, 1], ["Price", "name"], ["C", "Name"]],
+)
+def test_xlsx_projection(xlsx_path, engine, columns):
+    """Test letters, indexes and header names with both engines."""
+    data = read_file(xlsx_path, columns=columns, engine=engine)
+    assert data == [["Price", "Name"], ["9.5", "Widget"], ["20", "Gadget"]]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_xlsx_projection_with_range(xlsx_path, engine):
+    """Test that projected columns are taken from within the range."""
+    data = read_file(xlsx_path, cell_range="B2:D4", columns=["D", "B"], engine=engine)
+    assert data == [["Qty", "Name"], ["3", "Widget"], ["", "Gadget"]]
+
+    data = read_file(xlsx_path, cell_range="B2:D4", columns=["Qty"], engine=engine)
+    assert data == [["Qty"], ["3"], [""]]
+
+    with pytest.raises(ValueError, match="Column not found"):
+        read_file(xlsx_path, cell_range="B2:D4", columns=["A"], engine=engine)
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_xlsx_projection_missing_header(xlsx_path, engine):
+    """Test error for unknown header name."""
+    with pytest.raises(ValueError, match="Column not found: Total"):
+        read_file(xlsx_path, columns=["Total"], engine=engine)
+
+
+def test_xlsx_projection_with_max_rows(xlsx_path):
+    """Test that max_rows counts projected rows."""
+    data = read_file(xlsx_path, columns=["Qty"], max_rows=2)
+    assert data == [["Qty"], ["3"]]
+
+
+def test_xls_projection_reads_only_bounded_columns():
+    """Test that the XLS reader only reads projected columns."""
+    sheet = MagicMock()
+    sheet.nrows, sheet.ncols = 2, 4
+    sheet.row_values.side_effect = lambda row, start=0, end=None: [
+        f"r{row}c{col}" for col in range(4)
+    ][start:end]
+
+    reader = XLSReader()
+    data = reader._read_all_data(sheet, projection=ColumnProjection([3, 1]))
+
+    assert data == [["r0c3", "r0c1"], ["r1c3", "r1c1"]]
+    assert {call.args[1:] for call in sheet.row_values.call_args_list} == {(1, 4)}
+
+
+def test_xls_projection_by_header():
+    """Test header names with the XLS reader."""
+    workbook = MagicMock()
+    workbook.nsheets = 1
+    sheet = workbook.sheet_by_index.return_value
+    sheet.name = "Sheet1"
+    sheet.nrows, sheet.ncols = 2, 2
+    values = [["Name", "Price"], ["Widget", 9.5]]
+    sheet.row_values.side_effect = lambda row, start=0, end=None: values[row][start:end]
+
+    with patch("xlrd.open_workbook", return_value=workbook), patch(
+        "os.path.exists", return_value=True
+    ):
+        data = read_file("data.xls", columns=["price"])
+
+    assert data == [["Price"], ["9.5"]]
+
+
+@pytest.mark.parametrize("fixture", ["xlsx_path", "csv_path"])
+def test_projection_header_like_letters(request, fixture):
+    """Test that "ID"/"QTY" select headers and unknown names raise."""
+    path = request.getfixturevalue(fixture)
+    assert read_file(path, columns=["ID", "Name"])[:2] == [
+        ["Id", "Name"],
+        ["1", "Widget"],
+    ]
+    assert read_file(path, columns=["QTY"])[:2] == [["Qty"], ["3"]]
+    with pytest.raises(ValueError, match="Column not found: SKU"):
+        read_file(path, columns=["SKU"])
+
+
+def test_xls_range_errors_propagate():
+    """Test that XLS range and projection errors are not swallowed."""
+    sheet = MagicMock()
+    sheet.nrows, sheet.ncols = 3, 2
+    sheet.book.datemode = 0
+    values = [["Name", "Price"], ["Widget", 9.5], ["Gadget", 20]]
+    sheet.row_values.side_effect = lambda row, start=0, end=None: values[row][start:end]
+    sheet.row_types.side_effect = lambda row, start=0, end=None: [1] * len(
+        values[row][start:end]
+    )
+
+    reader = XLSReader()
+    with pytest.raises(ValueError, match="Column not found: City"):
+        reader._read_cell_range(sheet, "A1:B3", projection=ColumnProjection(["City"]))
+    with pytest.raises(ValueError, match="Invalid cell range"):
+        reader._read_cell_range(sheet, "Z9:A1")
+
+
+def test_csv_projection(csv_path):
+    """Test column projection of CSV files."""
+    assert read_file(csv_path, columns=["Qty", 0]) == [
+        ["Qty", "Id"],
+        ["3", "1"],
+        ["", "2"],
+    ]
+    assert read_file(csv_path, cell_range="B1:C3", columns=["C"]) == [
+        ["Price"],
+        ["9.5"],
+        ["20"],
+    ]
+
+
+def test_cli_columns(csv_path, runner):
+    """Test --columns option."""
+    result = runner.invoke(app, [csv_path, "--columns", "Name,D"])
+    assert result.exit_code == 0
+    assert "Widget" in result.stdout
+    assert "Price" not in result.stdout
+
+    result = runner.invoke(app, [csv_path, "--columns", " , "])
+    assert result.exit_code == 1
@@ -111,6 +111,64 @@ class TestBaseReader:
         expected = [["A1", "B1", "C1"], ["", "", "C2"]]
         assert result == expected
 
+    def test_collect_used_rows(self):
+        """Test trimming rows to the used range while collecting."""
+        reader = self.DummyReader()
+        rows = [
+            ("a", None, None, None),
+            (None, None, None, None),
+            ("b", "c", " ", None),
+            (None, None, None, None),
+        ]
+
+        data, used_range = reader._collect_used_rows(iter(rows))
+        assert data == [["a"], ["b", "c"]]
+        assert used_range == (3, 2)
+
+        data, used_range = reader._collect_used_rows(iter(rows), max_rows=1)
+        assert data == [["a"]]
+        assert used_range is None
+
+    def test_collect_used_rows_closes_rows_on_error(self):
+        """Test that the row iterator is closed when a row fails."""
+        reader = self.DummyReader()
+        rows = MagicMock()
+        rows.__iter__.return_value = iter([("a",), 1])
+
+        with pytest.raises(TypeError):
+            reader._collect_used_rows(rows)
+        rows.close.assert_called_once_with()
+
+    def test_clean_data_interns_column_values(self, caplog):
+        """Test that repeated cleaned values share one object per column."""
+        reader = self.DummyReader()
+        data = [[str(i), 10.0, " Open "] for i in range(6)]
+
+        with patch("xlsx2md.readers.base.INTERN_SAMPLE_ROWS", 4), caplog.at_level(
+            "DEBUG", logger="xlsx2md.readers.base"
+        ):
+            result = reader._clean_data(data)
+
+        assert result[0] == ["0", "10.0", "Open"]
+        assert all(row[1] is result[0][1] for row in result)
+        assert all(row[2] is result[0][2] for row in result)
+        # Unique column is no longer interned after the sample rows
+        assert [row[0] for row in result] == [str(i) for i in range(6)]
+        assert "Interned 18 cells into 8 distinct values" in caplog.text
+
+    def test_clean_data_caps_intern_pools(self):
+        """Test that a column stops being interned when its pool is full."""
+        reader = self.DummyReader()
+        data = [[f"{value}{0}"] for value in "aabcaa"]
+
+        with patch("xlsx2md.readers.base.INTERN_MAX_POOL_SIZE", 2):
+            result = reader._clean_data(data)
+
+        assert [row[0] for row in result] == ["a0", "a0", "b0", "c0", "a0", "a0"]
+        assert result[1][0] is result[0][0]
+        # The third distinct value overflowed the pool and stopped interning
+        assert result[5][0] is not result[4][0]
+
     def test_normalize_data(self):
         """Test normalizing data structure."""
         reader = self.DummyReader()
@@ -227,6 +285,39 @@ class TestCSVReader:
             finally:
                 os.unlink(temp_file.name)
 
+    def test_read_csv_max_rows_counts_data_rows(self):
+        """Test that blank lines do not count towards max_rows."""
+        reader = CSVReader()
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", delete=False
+        ) as temp_file:
+            temp_file.write("Name,Age\n\n\nAlice,30\n,\nBob,25\nCharlie,35\n")
+            temp_file.close()
+
+            try:
+                data = reader.read(temp_file.name, max_rows=3)
+                assert data == [["Name", "Age"], ["Alice", "30"], ["Bob", "25"]]
+            finally:
+                os.unlink(temp_file.name)
+
+    def test_collect_rows_stops_and_closes(self):
+        """Test that row collection stops early and closes the generator."""
+        reader = CSVReader()
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield [str(i)] if i % 2 else [""]
+
+        generator = rows()
+        data = reader._collect_rows(generator, max_rows=3)
+
+        assert data == [["1"], ["3"], ["5"]]
+        assert consumed == list(range(6))
+        assert generator.gi_frame is None
+
     def test_detect_delimiter(self):
         """Test delimiter detection."""
         reader = CSVReader()
@@ -279,22 +370,11 @@ class TestXLSXReader:
         mock_sheet.max_row = 3
         mock_sheet.max_column = 3
 
-        # Create mock cell objects with proper value property
-        def create_mock_cell(row, column):
-            mock_cell = MagicMock()
-            if row == 1 and column == 1:
-                mock_cell.value = "Name"
-            elif row == 1 and column == 2:
-                mock_cell.value = "Age"
-            elif row == 2 and column == 1:
-                mock_cell.value = "Alice"
-            elif row == 2 and column == 2:
-                mock_cell.value = 30
-            else:
-                mock_cell.value = None
-            return mock_cell
-
-        mock_sheet.cell.side_effect = create_mock_cell
+        mock_sheet.iter_rows.return_value = [
+            ("Name", "Age", None),
+            ("Alice", 30, None),
+            (None, None, None),
+        ]
 
         mock_workbook = MagicMock()
         mock_workbook.active = mock_sheet
@@ -304,10 +384,10 @@ class TestXLSXReader:
         with tempfile.NamedTemporaryFile(suffix=".xlsx") as temp_file:
             data = reader.read(temp_file.name)
 
-            # Should have 2 rows (header + data)
+            # Should have 2 rows (header + data) without the empty column
             assert len(data) == 2
-            assert data[0] == ["Name", "Age", ""]
-            assert data[1] == ["Alice", "30", ""]
+            assert data[0] == ["Name", "Age"]
+            assert data[1] == ["Alice", "30"]
 
     @patch("xlsx2md.readers.xlsx_reader.openpyxl.load_workbook")
     def test_read_xlsx_with_sheet_name(self, mock_load_workbook):
@@ -320,7 +400,7 @@ class TestXLSXReader:
         mock_sheet.max_row = 2
         mock_sheet.max_column = 2
 
-        mock_sheet.cell.return_value.value = "Test"
+        mock_sheet.iter_rows.return_value = [("Test", "Test"), ("Test", "Test")]
 
         mock_workbook = MagicMock()
         mock_workbook.sheetnames = ["Sheet1", "Sheet2"]
@@ -371,12 +451,14 @@ class TestXLSReader:
             else:
                 return ""
 
-        mock_sheet.cell_value = mock_cell_value
+        mock_sheet.row_values = lambda row, start=0, end=None: [
+            mock_cell_value(row, col) for col in range(2)
+        ][start:end]
 
         mock_workbook = MagicMock()
         mock_workbook.nsheets = 1
         mock_workbook.sheet_by_index.return_value = mock_sheet
-        mock_workbook.sheet_name.return_value = "Sheet1"
+        mock_workbook.sheet_names.return_value = ["Sheet1"]
         mock_open_workbook.return_value = mock_workbook
 
         with tempfile.NamedTemporaryFile(suffix=".xls") as temp_file:
@@ -394,13 +476,126 @@ class TestXLSReader:
         with patch("xlsx2md.readers.xls_reader.xlrd.open_workbook") as mock_open:
             mock_workbook = MagicMock()
             mock_workbook.nsheets = 2
-            mock_workbook.sheet_name.side_effect = ["Sheet1", "Sheet2"]
+            mock_workbook.sheet_names.return_value = ["Sheet1", "Sheet2"]
             mock_open.return_value = mock_workbook
 
             with tempfile.NamedTemporaryFile(suffix=".xls") as temp_file:
                 names = reader.get_sheet_names(temp_file.name)
                 assert names == ["Sheet1", "Sheet2"]
 
+    def test_read_all_data_caches_used_range(self):
+        """Test that blank trailing cells are trimmed and the range cached."""
+        reader = XLSReader()
+        sheet = MagicMock()
+        sheet.nrows, sheet.ncols = 4, 3
+        values = [["a", "", ""], ["b", "c", ""], ["", "", ""], ["", "", " "]]
+        sheet.row_values.side_effect = lambda row, start=0, end=None: values[row][
+            start:end
+        ]
+
+        assert reader._read_all_data(sheet) == [["a"], ["b", "c"]]
+        assert reader._sheet_used_ranges[sheet.book][sheet.number] == (2, 2)
+
+        # An unloaded and reloaded sheet is a new object of the same workbook
+        sheet = MagicMock(book=sheet.book, number=sheet.number, nrows=4, ncols=3)
+        sheet.row_values.side_effect = lambda row, start=0, end=None: values[row][
+            start:end
+        ]
+        assert reader._read_all_data(sheet) == [["a"], ["b", "c"]]
+        assert [call.args for call in sheet.row_values.call_args_list] == [
+            (0, 0, 2),
+            (1, 0, 2),
+        ]
+
+    def test_read_row_slices(self, tmp_path):
+        """Test ranges past the last column and trimming of blank cells."""
+        xlwt = pytest.importorskip("xlwt")
+        workbook = xlwt.Workbook()
+        sheet = workbook.add_sheet("Data")
+        sheet.write(0, 0, "a")
+        sheet.write(0, 1, "b")
+        sheet.write(2, 0, 1.5)
+        sheet.write(2, 3, "")  # Blank cell widening the sheet
+        path = str(tmp_path / "book.xls")
+        workbook.save(path)
+
+        reader = XLSReader()
+        assert reader.read(path) == [["a", "b"], ["1.5", ""]]
+        assert reader.read(path, cell_range="B1:E3") == [
+            ["b", "", "", ""],
+            ["", "", "", ""],
+            ["", "", "", ""],
+        ]
+
+    def test_typed_cell_values(self, tmp_path):
+        """Test that numbers, dates and booleans match the XLSX output."""
+        xlwt = pytest.importorskip("xlwt")
+        import datetime
+
+        workbook = xlwt.Workbook()
+        sheet = workbook.add_sheet("Data")
+        date_style = xlwt.easyxf(num_format_str="YYYY-MM-DD")
+        time_style = xlwt.easyxf(num_format_str="hh:mm")
+        row = [1001, 2.5, True, "text"]
+        for col, value in enumerate(row):
+            sheet.write(0, col, value)
+        sheet.write(0, 4, datetime.datetime(2021, 1, 1), date_style)
+        sheet.write(0, 5, 0.5, time_style)
+        path = str(tmp_path / "book.xls")
+        workbook.save(path)
+
+        assert XLSReader().read(path) == [
+            ["1001", "2.5", "True", "text", "2021-01-01 00:00:00", "12:00:00"]
+        ]
+
+    def test_cell_converters(self):
+        """Test conversions by cell type, including the 1904 date mode."""
+        import datetime
+
+        import xlrd
+
+        from xlsx2md.readers.xls_reader import _cell_converters
+
+        convert = _cell_converters(1)
+        assert convert[xlrd.XL_CELL_TEXT] is None
+        assert convert[xlrd.XL_CELL_NUMBER](3.0) == 3
+        assert isinstance(convert[xlrd.XL_CELL_NUMBER](3.0), int)
+        assert convert[xlrd.XL_CELL_DATE](1.0) == datetime.datetime(1904, 1, 2)
+        assert convert[xlrd.XL_CELL_DATE](1e10) == "#VALUE!"
+        assert convert[xlrd.XL_CELL_BOOLEAN](1) is True
+        assert convert[xlrd.XL_CELL_ERROR](7) == "#DIV/0!"
+        assert _cell_converters(1) is convert
+
+    def test_sheets_loaded_on_demand(self, tmp_path):
+        """Test that only the requested sheet is decoded and then unloaded."""
+        xlwt = pytest.importorskip("xlwt")
+        import xlrd
+
+        workbook = xlwt.Workbook()
+        for index in range(3):
+            workbook.add_sheet(f"Sheet{index}").write(0, 0, f"value {index}")
+        path = str(tmp_path / "book.xls")
+        workbook.save(path)
+
+        reader = XLSReader()
+        loaded = []
+        get_sheet = xlrd.book.Book.get_sheet
+
+        def record(book, index, *args, **kwargs):
+            loaded.append(index)
+            return get_sheet(book, index, *args, **kwargs)
+
+        with patch.object(xlrd.book.Book, "get_sheet", record):
+            assert reader.read(path, "Sheet1") == [["value 1"]]
+            assert loaded == [1]
+
+            book = reader.open_workbook(path)
+            try:
+                assert reader.read_sheet(book, 2) == [["value 2"]]
+                assert not any(book.sheet_loaded(i) for i in range(3))
+            finally:
+                reader.close_workbook(book)
+
 
 class TestReadFileFunction:
     """Tests for read_file function."""
@@ -0,0 +1,108 @@
+"""
+Tests for incremental re-conversion of XLSX workbooks.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from xlsx2md import cli
+from xlsx2md.cli import app
+from xlsx2md.render_cache import RenderCache, sheet_fingerprints
+
+
+@pytest.fixture
+def save_workbook(make_workbook):
+    """Save three sheets; only the second one depends on the value."""
+
+    def save(value):
+        return make_workbook(
+            {"First": [[1, 2]], "Second": [[value, 4]], "Third": [[5, 6]]}
+        )
+
+    return save
+
+
+@pytest.fixture
+def workbook_path(save_workbook):
+    """Workbook with three small sheets."""
+    return save_workbook(3)
+
+
+def test_sheet_fingerprints_change_with_sheet(workbook_path, save_workbook):
+    """Test that only the fingerprint of the edited sheet changes."""
+    before = sheet_fingerprints(workbook_path)
+    assert [name for name, _ in before] == ["First", "Second", "Third"]
+
+    save_workbook(30)
+    after = sheet_fingerprints(workbook_path)
+    assert [a == b for a, b in zip(before, after)] == [True, False, True]
+
+
+def test_render_cache_round_trip(tmp_path, workbook_path):
+    """Test that entries survive a save and depend on the options."""
+    cache = RenderCache(tmp_path / "cache", workbook_path, {"style": "grid"})
+    cache.put("a", "| x |\n")
+    cache.put("b", "| y |\n")
+    cache.save()
+
+    cache = RenderCache(tmp_path / "cache", workbook_path, {"style": "grid"})
+    assert cache.get("a") == "| x |\n"
+    cache.save()
+
+    # Entries not used since loading are dropped
+    assert (
+        RenderCache(tmp_path / "cache", workbook_path, {"style": "grid"}).get("b")
+        is None
+    )
+    other = RenderCache(tmp_path / "cache", workbook_path, {"style": "minimal"})
+    assert other.get("a") is None
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]", "null", '{"sheets": 1}'])
+def test_render_cache_ignores_broken_file(tmp_path, workbook_path, content):
+    """Test that an unreadable or malformed cache file is treated as empty."""
+    cache = RenderCache(tmp_path, workbook_path, {})
+    cache.path.write_text(content)
+    assert RenderCache(tmp_path, workbook_path, {}).get("a") is None
+
+
+def test_cli_incremental_converts_changed_sheets(
+    tmp_path, workbook_path, save_workbook, runner
+):
+    """Test that --incremental re-renders only changed sheets."""
+    args = [
+        workbook_path,
+        "--all-sheets",
+        "--incremental",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    full = runner.invoke(app, [workbook_path, "--all-sheets"])
+
+    with patch.object(cli, "render_sheet", wraps=cli.render_sheet) as rendered:
+        first = runner.invoke(app, args)
+        assert [call.args[1] for call in rendered.call_args_list] == [0, 1, 2]
+
+        rendered.reset_mock()
+        second = runner.invoke(app, args)
+        assert rendered.call_count == 0
+
+        save_workbook(30)
+        third = runner.invoke(app, args)
+        assert [call.args[1] for call in rendered.call_args_list] == [1]
+
+    assert first.exit_code == second.exit_code == third.exit_code == 0
+    assert first.stdout == second.stdout == full.stdout
+    assert "| 30 " in third.stdout
+    assert third.stdout.replace("30", "3 ") == full.stdout
+
+
+def test_cli_incremental_other_formats(tmp_path, runner):
+    """Test that --incremental falls back to a full conversion for CSV."""
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    result = runner.invoke(
+        app, [str(path), "--all-sheets", "--incremental", "--cache-dir", str(tmp_path)]
+    )
+    assert result.exit_code == 0
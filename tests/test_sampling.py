@@ -0,0 +1,112 @@
+"""
+Tests for reservoir-sampled previews.
+"""
+
+import pytest
+
+from xlsx2md.cli import app
+from xlsx2md.readers import read_file, RowSampler
+
+
+def test_row_sampler_keeps_header_and_order():
+    """Test that samples are uniform-size, ordered and reproducible."""
+    sampler = RowSampler(10, seed=42)
+    for i in range(1000):
+        sampler.add(["header"] if i == 0 else [i])
+    rows = sampler.rows()
+
+    assert rows[0] == ["header"]
+    assert len(rows) == 11
+    values = [row[0] for row in rows[1:]]
+    assert values == sorted(values)
+    assert len(set(values)) == 10
+
+    again = RowSampler(10, seed=42)
+    for i in range(1000):
+        again.add(["header"] if i == 0 else [i])
+    assert again.rows() == rows
+
+
+def test_row_sampler_short_input():
+    """Test that inputs shorter than the sample are kept whole."""
+    sampler = RowSampler(5)
+    assert sampler.rows() == []
+    for row in (["h"], [1], [2]):
+        sampler.add(row)
+    assert sampler.rows() == [["h"], [1], [2]]
+
+    sampler.reset()
+    assert sampler.rows() == []
+
+
+def test_row_sampler_rejects_empty_sample():
+    """Test that the sample size must be positive."""
+    with pytest.raises(ValueError, match="positive"):
+        RowSampler(0)
+
+
+@pytest.fixture
+def xlsx_path(make_workbook):
+    """Workbook with a header, an empty row and 200 data rows."""
+    rows = [["Id", "Name"], []] + [[i, f"name {i}"] for i in range(200)]
+    return make_workbook({"Sheet": rows}, "data.xlsx")
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_read_xlsx_sample(xlsx_path, engine):
+    """Test sampling of an XLSX sheet with both engines."""
+    data = read_file(xlsx_path, engine=engine, sample=20, seed=7)
+    assert data[0] == ["Id", "Name"]
+    assert len(data) == 21
+    ids = [int(row[0]) for row in data[1:]]
+    assert ids == sorted(ids)
+    assert all(row[1] == f"name {row[0]}" for row in data[1:])
+
+    assert read_file(xlsx_path, engine="native", sample=20, seed=7) == data
+    projected = read_file(xlsx_path, engine=engine, sample=20, seed=7, columns=["B"])
+    assert projected == [row[1:] for row in data]
+
+
+def test_read_csv_sample(tmp_path):
+    """Test sampling of a CSV file, with and without a cell range."""
+    path = tmp_path / "data.csv"
+    path.write_text("Id,Name\n" + "".join(f"{i},n{i}\n" for i in range(500)))
+
+    data = read_file(str(path), sample=30, seed=3)
+    assert data[0] == ["Id", "Name"]
+    assert len(data) == 31
+    assert data == read_file(str(path), sample=30, seed=3)
+
+    ranged = read_file(str(path), cell_range="A1:A100", sample=10, seed=3)
+    assert ranged[0] == ["Id"]
+    assert len(ranged) == 11
+    assert all(int(row[0]) < 99 for row in ranged[1:])
+
+
+def test_read_xls_sample(tmp_path):
+    """Test sampling of an XLS sheet."""
+    xlwt = pytest.importorskip("xlwt")
+    workbook = xlwt.Workbook()
+    sheet = workbook.add_sheet("Data")
+    sheet.write(0, 0, "Id")
+    for i in range(1, 101):
+        sheet.write(i, 0, i)
+    path = str(tmp_path / "data.xls")
+    workbook.save(path)
+
+    data = read_file(path, sample=5, seed=1)
+    assert data[0] == ["Id"]
+    assert len(data) == 6
+
+
+def test_cli_sample(xlsx_path, runner):
+    """Test --sample and --seed options."""
+    args = [xlsx_path, "--sample", "5", "--seed", "11"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    lines = [line for line in result.stdout.splitlines() if line.startswith("|")]
+    assert len(lines) == 7  # header, separator and five rows
+    assert runner.invoke(app, args).stdout == result.stdout
+
+    result = runner.invoke(app, [xlsx_path, "--sample", "0"])
+    assert result.exit_code != 0
@@ -0,0 +1,60 @@
+"""
+Tests for workbook sessions.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from xlsx2md.cli import app
+from xlsx2md.readers import open_workbook, read_file, XLSXReader
+
+
+@pytest.fixture
+def workbook_path(make_workbook):
+    """Workbook with three small sheets."""
+    return make_workbook(
+        {"First": [["a", "b"], [1, 2]], "Second": [["c"]], "Third": [["d", "e", "f"]]}
+    )
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_session_reads_all_sheets(workbook_path, engine):
+    """Test that a session returns the same data as read_file."""
+    with open_workbook(workbook_path, engine=engine) as session:
+        assert session.sheet_names == ["First", "Second", "Third"]
+        for index, name in enumerate(session.sheet_names):
+            expected = read_file(workbook_path, index)
+            assert session.read(index) == expected
+            assert session.read(name) == expected
+        assert session.read(cell_range="A1:A2") == [["a"], ["1"]]
+    assert session.workbook is None
+
+
+def test_session_sheet_not_found(workbook_path):
+    """Test error message for missing sheet."""
+    with open_workbook(workbook_path) as session:
+        with pytest.raises(ValueError, match="Failed to read XLSX file"):
+            session.read("Missing")
+
+
+def test_session_not_supported_for_csv(tmp_path):
+    """Test that CSV files cannot be opened as workbooks."""
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    with pytest.raises(ValueError, match="not supported"):
+        open_workbook(str(path))
+
+
+def test_cli_all_sheets_opens_workbook_once(workbook_path, runner):
+    """Test that --all-sheets reuses one opened workbook."""
+    with patch.object(
+        XLSXReader, "open_workbook", autospec=True, side_effect=XLSXReader.open_workbook
+    ) as mock_open:
+        result = runner.invoke(app, [workbook_path, "--all-sheets"])
+
+    assert result.exit_code == 0
+    assert mock_open.call_count == 1
+    output = result.stdout
+    assert output.index("# Sheet: First") < output.index("# Sheet: Second")
+    assert output.index("# Sheet: Second") < output.index("# Sheet: Third")
@@ -0,0 +1,78 @@
+"""
+Tests for the lazy shared strings table.
+"""
+
+import io
+
+import openpyxl
+import pytest
+from unittest.mock import patch
+
+from xlsx2md.readers import NativeXLSXReader, XLSXReader
+from xlsx2md.readers.shared_strings import SharedStringTable
+
+SHARED_STRINGS_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b"<si><t>plain</t></si>"
+    b'<si><t xml:space="preserve"> spaced </t></si>'
+    b"<si><t>a &amp; b &lt;c&gt;</t></si>"
+    b"<si><t>line&#10;break</t></si>"
+    b"<si><r><t>rich</t></r><r><rPr><b/></rPr><t> text</t></r></si>"
+    b'<si><t>kanji</t><rPh sb="0" eb="1"><t>phonetic</t></rPh></si>'
+    b"<si><t/></si>"
+    b"<si><t>\xc3\xa9t\xc3\xa9</t></si>"
+    b"</sst>"
+)
+EXPECTED = [
+    "plain",
+    " spaced ",
+    "a & b <c>",
+    "line\nbreak",
+    "rich text",
+    "kanji",
+    "",
+    "été",
+]
+
+
+def test_table_decodes_items():
+    """Test decoding of plain, escaped, rich and phonetic items."""
+    table = SharedStringTable(io.BytesIO(SHARED_STRINGS_XML))
+    try:
+        assert [table[i] for i in range(len(EXPECTED))] == EXPECTED
+        assert len(table) == len(EXPECTED)
+    finally:
+        table.close()
+
+
+def test_table_indexes_only_needed_prefix():
+    """Test that only the part up to the requested item is indexed."""
+    items = b"".join(b"<si><t>item %d</t></si>" % i for i in range(50000))
+    stream = io.BytesIO(b"<sst>" + items + b"</sst>")
+    table = SharedStringTable(stream, cache_size=2)
+    try:
+        assert table[1] == "item 1"
+        assert not table.complete
+        assert table[49999] == "item 49999"
+        assert table[0] == "item 0"
+        with pytest.raises(IndexError):
+            table[50000]
+    finally:
+        table.close()
+
+
+def test_native_reader_with_lazy_table(tmp_path):
+    """Test that lazy and eager shared strings give the same data."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Key", "Value"])
+    for i in range(200):
+        sheet.append([f"key {i % 7}", f"value <{i}> & more"])
+    path = str(tmp_path / "strings.xlsx")
+    workbook.save(path)
+
+    expected = XLSXReader().read(path)
+    with patch("xlsx2md.readers.xlsx_package.SHARED_STRINGS_LAZY_MB", 0):
+        assert NativeXLSXReader().read(path) == expected
+        assert NativeXLSXReader().read(path, cell_range="A1:B3") == expected[:3]
@@ -0,0 +1,149 @@
+"""
+Tests for metadata-only sheet listing.
+"""
+
+import re
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import openpyxl
+import pytest
+
+from xlsx2md.readers import CSVReader, NativeXLSXReader, XLSReader, XLSXReader
+
+
+@pytest.fixture
+def xlsx_path(make_workbook):
+    """Workbook with visible, hidden and very hidden sheets."""
+    return make_workbook(
+        {"Data": [["a", "b"]], "Hidden": [], "Secret": [], "Last": []},
+        states={"Hidden": "hidden", "Secret": "veryHidden"},
+    )
+
+
+@pytest.mark.parametrize("reader_class", [XLSXReader, NativeXLSXReader])
+def test_xlsx_sheet_list(xlsx_path, reader_class):
+    """Test sheet list read without loading the workbook."""
+    with patch("openpyxl.load_workbook", side_effect=AssertionError("loaded")):
+        sheets = reader_class().get_sheet_list(xlsx_path)
+        names = reader_class().get_sheet_names(xlsx_path)
+
+    assert sheets == [
+        {"index": 0, "name": "Data", "state": "visible"},
+        {"index": 1, "name": "Hidden", "state": "hidden"},
+        {"index": 2, "name": "Secret", "state": "veryHidden"},
+        {"index": 3, "name": "Last", "state": "visible"},
+    ]
+    assert names == ["Data", "Hidden", "Secret", "Last"]
+
+
+def test_xlsx_sheet_names_match_openpyxl(xlsx_path):
+    """Test that metadata names match the loaded workbook."""
+    workbook = openpyxl.load_workbook(xlsx_path, read_only=True)
+    assert XLSXReader().get_sheet_names(xlsx_path) == workbook.sheetnames
+    workbook.close()
+
+
+def test_xls_sheet_list(tmp_path):
+    """Test sheet list read from BOUNDSHEET records."""
+    xlwt = pytest.importorskip("xlwt")
+    workbook = xlwt.Workbook()
+    workbook.add_sheet("First").write(0, 0, "a")
+    hidden = workbook.add_sheet("Zweite ü")
+    hidden.write(0, 0, "b")
+    hidden.visibility = 1
+    workbook.add_sheet("Third").write(0, 0, "c")
+    path = str(tmp_path / "book.xls")
+    workbook.save(path)
+
+    with patch("xlrd.open_workbook", side_effect=AssertionError("loaded")):
+        sheets = XLSReader().get_sheet_list(path)
+
+    assert sheets == [
+        {"index": 0, "name": "First", "state": "visible"},
+        {"index": 1, "name": "Zweite ü", "state": "hidden"},
+        {"index": 2, "name": "Third", "state": "visible"},
+    ]
+
+
+@patch("xlsx2md.readers.xls_reader.xlrd.open_workbook")
+def test_xls_sheet_names_fallback(mock_open_workbook, tmp_path):
+    """Test fallback to a full workbook load when metadata is unreadable."""
+    workbook = MagicMock()
+    workbook.nsheets = 1
+    workbook.sheet_names.return_value = ["Only"]
+    mock_open_workbook.return_value = workbook
+    path = tmp_path / "old.xls"
+    path.write_bytes(b"\x09\x00\x04\x00\x02\x00\x10\x00")
+
+    assert XLSReader().get_sheet_names(str(path)) == ["Only"]
+
+
+def _strip_dimensions(path):
+    """Rewrite workbook without <dimension> elements."""
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            if name.startswith("xl/worksheets/"):
+                data = re.sub(rb"<dimension [^>]*/>", b"", data)
+            archive.writestr(name, data)
+
+
+def test_xlsx_workbook_info(xlsx_path):
+    """Test per-sheet dimensions gathered with one package open."""
+    with patch("openpyxl.load_workbook", side_effect=AssertionError("loaded")):
+        info = XLSXReader().get_workbook_info(xlsx_path)
+
+    assert [(i["name"], i["nrows"], i["ncols"], i["state"]) for i in info] == [
+        ("Data", 1, 2, "visible"),
+        ("Hidden", 1, 1, "hidden"),
+        ("Secret", 1, 1, "veryHidden"),
+        ("Last", 1, 1, "visible"),
+    ]
+    assert info[0]["dimensions"] == "A1:B1"
+    assert all(i["exact"] for i in info)
+
+
+def test_xlsx_workbook_info_without_dimension(tmp_path):
+    """Test bounded scan for sheets without a <dimension> element."""
+    workbook = openpyxl.Workbook()
+    for row in range(1, 6):
+        workbook.active.cell(row=row, column=row, value=row)
+    path = str(tmp_path / "nodim.xlsx")
+    workbook.save(path)
+    _strip_dimensions(path)
+
+    info = XLSXReader().get_workbook_info(path)
+    assert (info[0]["nrows"], info[0]["ncols"], info[0]["exact"]) == (5, 5, True)
+
+    with patch("xlsx2md.readers.xlsx_reader.INFO_SCAN_MAX_ROWS", 3):
+        info = XLSXReader().get_workbook_info(path)
+    assert (info[0]["nrows"], info[0]["ncols"], info[0]["exact"]) == (3, 3, False)
+
+
+def test_xls_workbook_info(tmp_path):
+    """Test dimensions read from DIMENSIONS records."""
+    xlwt = pytest.importorskip("xlwt")
+    workbook = xlwt.Workbook()
+    workbook.add_sheet("First").write(2, 1, "a")
+    workbook.add_sheet("Second").write(0, 4, "b")
+    path = str(tmp_path / "book.xls")
+    workbook.save(path)
+
+    with patch("xlrd.open_workbook", side_effect=AssertionError("loaded")):
+        info = XLSReader().get_workbook_info(path)
+
+    assert [(i["name"], i["nrows"], i["ncols"]) for i in info] == [
+        ("First", 3, 2),
+        ("Second", 1, 5),
+    ]
+
+
+def test_csv_workbook_info(tmp_path):
+    """Test CSV row and column counts."""
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2,3\n\n4,5\n")
+
+    info = CSVReader().get_workbook_info(str(path))
+    assert (info[0]["name"], info[0]["nrows"], info[0]["ncols"]) == ("data.csv", 3, 3)
@@ -0,0 +1,104 @@
+"""
+Tests for streaming row iteration.
+"""
+
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from xlsx2md.readers import CSVReader, iter_file, read_file
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file with blank lines and ragged rows."""
+    path = tmp_path / "data.csv"
+    path.write_text("Id,Name,Price\n\n1, Widget ,9.5\n2,Gadget\n,,\n3,Gizmo,4,extra\n")
+    return str(path)
+
+
+def normalize(rows):
+    """Pad rows to the widest row like read_file does."""
+    rows = list(rows)
+    width = max((len(row) for row in rows), default=0)
+    return [row + [""] * (width - len(row)) for row in rows]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"max_rows": 2},
+        {"cell_range": "B2:C3"},
+        {"cell_range": "A1:E9"},
+        {"cell_range": "B1:C4", "columns": ["Price"]},
+        {"columns": ["Name", 0]},
+    ],
+)
+def test_iter_file_matches_read_file(csv_path, kwargs):
+    """Test that streamed rows are the rows of read_file before padding."""
+    rows = list(iter_file(csv_path, **kwargs))
+    assert normalize(rows) == read_file(csv_path, **kwargs)
+
+
+def test_iter_rows_is_lazy(csv_path):
+    """Test that rows are cleaned but not padded and the file is released."""
+    rows = CSVReader().iter_rows(csv_path)
+    assert next(rows) == ["Id", "Name", "Price"]
+    assert next(rows) == ["1", "Widget", "9.5"]
+    assert next(rows) == ["2", "Gadget"]
+    rows.close()
+
+
+def test_iter_rows_bounded_memory(tmp_path):
+    """Test that iterating a large file does not hold its rows."""
+    path = tmp_path / "big.csv"
+    path.write_text("".join(f"{i},name {i},{i * 1.5}\n" for i in range(5000)))
+
+    def peak(function):
+        tracemalloc.start()
+        try:
+            result = function()
+            return result, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    with patch("xlsx2md.readers.decoding.CSV_READ_CHUNK_KB", 16):
+        count, streamed = peak(
+            lambda: sum(1 for _ in iter_file(str(path), encoding="utf-8"))
+        )
+    _, whole = peak(lambda: read_file(str(path), encoding="utf-8"))
+
+    assert count == 5000
+    assert streamed * 4 < whole
+
+
+def test_iter_rows_switches_encoding(tmp_path):
+    """Test that a late decode error resumes with an alternative encoding."""
+    path = tmp_path / "mixed.csv"
+    lines = [f"{i},ascii\n" for i in range(3000)]
+    path.write_bytes("".join(lines).encode() + "3000,привет\n".encode("cp1251"))
+
+    rows = list(iter_file(str(path), encoding="utf-8"))
+    assert len(rows) == 3001
+    assert rows[-1] == ["3000", "привет"]
+    assert read_file(str(path), encoding="utf-8") == rows
+
+
+def test_iter_rows_errors(tmp_path):
+    """Test that errors surface as for read_file."""
+    with pytest.raises(FileNotFoundError):
+        next(CSVReader().iter_rows(str(tmp_path / "missing.csv")))
+
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    with pytest.raises(ValueError, match="Column not found: c"):
+        list(iter_file(str(path), columns=["c"]))
+
+
+def test_iter_file_excel(make_workbook):
+    """Test that Excel files are iterated through read()."""
+    path = make_workbook({"Sheet": [["a", 1], ["b", 2]]}, "data.xlsx")
+
+    assert list(iter_file(path, max_rows=1)) == [["a", "1"]]
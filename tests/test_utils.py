@@ -2,10 +2,15 @@
 Tests for utility functions.
 """
 
+import os
+from unittest.mock import patch
+
 import pytest
 import tempfile
 
+from xlsx2md import utils
 from xlsx2md.utils import (
+    detect_csv_encoding,
     get_file_extension,
     is_supported_format,
     get_file_size_mb,
@@ -172,3 +177,57 @@ class TestDataUtils:
 
         # Test default (left)
         assert format_cell_content("test", 10) == "test      "
+
+
+class TestEncodingDetection:
+    """Tests for CSV encoding detection."""
+
+    @pytest.mark.parametrize(
+        "encoding, expected",
+        [("utf-8-sig", "utf-8-sig"), ("utf-16", "utf-16"), ("utf-32", "utf-32")],
+    )
+    def test_byte_order_mark(self, tmp_path, encoding, expected):
+        """Test that a BOM decides the encoding."""
+        path = tmp_path / "bom.csv"
+        path.write_bytes("a,b\n1,ü\n".encode(encoding))
+        assert detect_csv_encoding(str(path)) == expected
+
+    def test_late_utf8_text(self, tmp_path):
+        """Test that non-ASCII text after a long ASCII prefix is UTF-8."""
+        path = tmp_path / "late.csv"
+        path.write_bytes(b"id,name\n" * 3000 + "1,Zoë\n".encode("utf-8"))
+        with patch("chardet.UniversalDetector") as detector:
+            assert detect_csv_encoding(str(path)) == "utf-8"
+        detector.assert_not_called()
+
+    def test_window_cuts_multibyte_character(self, tmp_path):
+        """Test that a character split by the window end is not an error."""
+        path = tmp_path / "split.csv"
+        path.write_bytes(b"a" * 1023 + "ü,b\n".encode("utf-8"))
+        assert detect_csv_encoding(str(path), window_kb=1) == "utf-8"
+
+    def test_legacy_encoding(self, tmp_path):
+        """Test that non-UTF-8 text is handed to chardet."""
+        path = tmp_path / "cp1251.csv"
+        text = "Имя,Город\nАлексей,Москва\nМария,Санкт-Петербург\n" * 50
+        path.write_bytes(text.encode("cp1251"))
+        encoding = detect_csv_encoding(str(path))
+        assert path.read_bytes().decode(encoding) == text
+
+    def test_result_is_cached(self, tmp_path):
+        """Test that an unchanged file is not inspected twice."""
+        path = tmp_path / "data.csv"
+        path.write_bytes("a,b\n1,ü\n".encode("cp1252"))
+        first = detect_csv_encoding(str(path))
+        hits = utils._detect_encoding.cache_info().hits
+        assert detect_csv_encoding(str(path)) == first
+        assert utils._detect_encoding.cache_info().hits == hits + 1
+
+        # A modified file is detected again
+        path.write_bytes("a,b\n".encode("utf-8"))
+        os.utime(path, ns=(0, 0))
+        assert detect_csv_encoding(str(path)) == "utf-8"
+
+    def test_missing_file(self, tmp_path):
+        """Test fallback for unreadable files."""
+        assert detect_csv_encoding(str(tmp_path / "missing.csv")) == "utf-8"
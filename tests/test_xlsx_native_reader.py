@@ -0,0 +1,138 @@
+"""
+Tests for the native (streaming) XLSX reader.
+"""
+
+import datetime
+import io
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from xlsx2md.readers import get_reader, read_file, NativeXLSXReader, XLSXReader
+from xlsx2md.readers.xlsx_package import SHEET_MAIN_NS, XLSXPackage, _SheetParser
+from xlsx2md.renderer import render_markdown_table
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "docs" / "examples"
+
+
+@pytest.fixture
+def mixed_workbook(tmp_path):
+    """Workbook with shared strings, dates, booleans and gaps."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Mixed"
+    sheet.append(["Name", "When", "Flag", "Num", "Float", "Time", "Delta"])
+    sheet.append(
+        [
+            "Alice",
+            datetime.datetime(2021, 1, 1, 12, 30),
+            True,
+            1001,
+            3.5,
+            datetime.time(10, 5),
+            datetime.timedelta(hours=30),
+        ]
+    )
+    sheet.append([None] * 7)
+    sheet.append(["Bob", datetime.date(2020, 2, 29), False, -5, 1e20])
+    sheet["J10"] = "far"
+
+    second = workbook.create_sheet("Second")
+    second.append(["x", "y"])
+    second.append(["dup", "dup"])
+
+    path = tmp_path / "mixed.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+def test_get_reader_engine_selection(mixed_workbook):
+    """Test engine selection in reader factory."""
+    assert isinstance(get_reader(mixed_workbook), XLSXReader)
+    assert isinstance(get_reader(mixed_workbook, engine="native"), NativeXLSXReader)
+
+
+def test_get_reader_invalid_engine(mixed_workbook):
+    """Test error for unknown engine."""
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        get_reader(mixed_workbook, engine="pandas")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"sheet_name_or_index": "second"},
+        {"sheet_name_or_index": 1},
+        {"cell_range": "B1:D4"},
+        {"cell_range": "C3:Z30"},
+        {"max_rows": 2},
+    ],
+)
+def test_native_matches_openpyxl(mixed_workbook, kwargs):
+    """Test that both engines return identical data."""
+    expected = XLSXReader().read(mixed_workbook, **kwargs)
+    assert NativeXLSXReader().read(mixed_workbook, **kwargs) == expected
+
+
+@pytest.mark.parametrize("path", sorted(EXAMPLES_DIR.glob("*.xlsx")))
+def test_native_markdown_matches_on_examples(path):
+    """Test byte-identical Markdown for the bundled example workbooks."""
+    for index in range(len(XLSXReader().get_sheet_names(str(path)))):
+        expected = read_file(str(path), index)
+        actual = read_file(str(path), index, engine="native")
+        assert render_markdown_table(actual) == render_markdown_table(expected)
+
+
+def test_package_metadata(mixed_workbook):
+    """Test workbook metadata read from the package."""
+    with XLSXPackage(mixed_workbook) as package:
+        assert package.sheetnames == ["Mixed", "Second"]
+        assert package.active.title == "Mixed"
+        assert package.worksheets[0].max_column == 10
+        assert package.worksheets[0].max_row == 10
+
+
+def test_native_sheet_not_found(mixed_workbook):
+    """Test error for missing sheet."""
+    with pytest.raises(ValueError, match="Sheet not found"):
+        NativeXLSXReader().read(mixed_workbook, sheet_name_or_index="Missing")
+
+
+def test_native_invalid_file(tmp_path):
+    """Test error for file that is not a zip package."""
+    path = tmp_path / "broken.xlsx"
+    path.write_text("not a zip")
+    with pytest.raises(ValueError, match="Failed to read XLSX file"):
+        NativeXLSXReader().read(str(path))
+
+
+@pytest.mark.parametrize("reader_class", [XLSXReader, NativeXLSXReader])
+@pytest.mark.parametrize("cell_range", ["B4:A1", "A0:B2", "1A:B2"])
+def test_invalid_range_raises(mixed_workbook, reader_class, cell_range):
+    """Test that invalid ranges fail instead of reading the whole sheet."""
+    with pytest.raises(ValueError, match="Invalid cell range"):
+        reader_class().read(mixed_workbook, cell_range=cell_range)
+
+
+def test_sheet_parser_window():
+    """Test that the parser skips cells outside the window and stops early."""
+    rows = "".join(
+        f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="C{r}"><v>{r * 10}</v></c>'
+        "</row>"
+        for r in range(1, 2001)
+    )
+    xml = (
+        f'<worksheet xmlns="{SHEET_MAIN_NS}"><sheetData>{rows}</sheetData>'
+        "</worksheet>"
+    ).encode()
+    stream = io.BytesIO(xml)
+
+    parser = _SheetParser(stream, min_row=3, max_row=4, min_col=2, max_col=3)
+    assert list(parser.rows()) == [
+        (3, [(3, "n", 0, "30")]),
+        (4, [(3, "n", 0, "40")]),
+        (5, []),
+    ]
+    assert stream.tell() < len(xml)
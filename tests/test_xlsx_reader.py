@@ -18,7 +18,7 @@ def test_corrupted_file_with_none_active_sheet(tmp_path):
     mock_sheet1.title = "Sheet1"
     mock_sheet1.max_row = 2
     mock_sheet1.max_column = 2
-    mock_sheet1.cell.return_value.value = "test"
+    mock_sheet1.iter_rows.return_value = [("test", "test"), ("test", "test")]
 
     mock_workbook.worksheets = [mock_sheet1, Mock()]
 
@@ -30,7 +30,7 @@ def test_corrupted_file_with_none_active_sheet(tmp_path):
 
         # Verify that first sheet was used
         assert len(data) > 0
-        mock_sheet1.cell.assert_called()
+        mock_sheet1.iter_rows.assert_called()
 
 
 def test_corrupted_file_with_no_sheets(tmp_path):
@@ -99,7 +99,7 @@ def test_normal_file_with_active_sheet(tmp_path):
     mock_sheet.title = "ActiveSheet"
     mock_sheet.max_row = 3
     mock_sheet.max_column = 2
-    mock_sheet.cell.return_value.value = "data"
+    mock_sheet.iter_rows.return_value = [("data", "data")] * 3
 
     mock_workbook.active = mock_sheet
     mock_workbook.sheetnames = ["ActiveSheet"]
@@ -113,4 +113,77 @@ def test_normal_file_with_active_sheet(tmp_path):
 
         # Verify that active sheet was used
         assert len(data) > 0
-        mock_sheet.cell.assert_called()
+        mock_sheet.iter_rows.assert_called()
+
+
+def _write_workbook(path, rows):
+    """Write rows to a single-sheet workbook on disk."""
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def test_read_streams_rows_and_skips_empty(tmp_path):
+    """Test streaming read of a real workbook with empty rows and max_rows."""
+    path = tmp_path / "data.xlsx"
+    _write_workbook(path, [["Name", "Age"], [None, None], ["Alice", 30], ["Bob", 25]])
+
+    reader = XLSXReader()
+    assert reader.read(str(path)) == [["Name", "Age"], ["Alice", "30"], ["Bob", "25"]]
+    assert reader.read(str(path), max_rows=2) == [["Name", "Age"], ["Alice", "30"]]
+    assert reader.read(str(path), max_rows=3) == reader.read(str(path))
+
+
+def test_read_cell_range_from_real_workbook(tmp_path):
+    """Test that range bounds are applied while iterating rows."""
+    path = tmp_path / "data.xlsx"
+    _write_workbook(path, [["A", "B", "C"], [1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    data = XLSXReader().read(str(path), cell_range="B2:C3")
+    assert data == [["2", "3"], ["5", "6"]]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "native"])
+def test_read_trims_inflated_dimensions(tmp_path, engine):
+    """Test that formatted empty cells do not widen or lengthen the table."""
+    import openpyxl
+    from openpyxl.styles import Font
+
+    from xlsx2md.readers import open_workbook
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Name", "Age"])
+    sheet.append(["Alice", 30])
+    sheet["XFD1"].font = Font(bold=True)
+    sheet["B5000"].font = Font(bold=True)
+    path = tmp_path / "inflated.xlsx"
+    workbook.save(path)
+
+    with open_workbook(str(path), engine=engine) as session:
+        sheet = session.workbook.worksheets[0]
+        assert session.read() == [["Name", "Age"], ["Alice", "30"]]
+        assert session.reader._used_ranges[sheet] == (2, 2)
+
+        # Later reads are bounded by the cached used range
+        with patch.object(sheet, "iter_rows", wraps=sheet.iter_rows) as iter_rows:
+            assert session.read() == [["Name", "Age"], ["Alice", "30"]]
+        assert iter_rows.call_args.kwargs["max_row"] == 2
+        assert iter_rows.call_args.kwargs["max_col"] == 2
+
+
+def test_read_with_max_rows_does_not_cache_used_range(tmp_path):
+    """Test that partial reads leave the used range unknown."""
+    from xlsx2md.readers import open_workbook
+
+    path = tmp_path / "data.xlsx"
+    _write_workbook(path, [["A", "B"], [1, 2], [3, 4, 5]])
+
+    with open_workbook(str(path)) as session:
+        assert session.read(max_rows=2) == [["A", "B"], ["1", "2"]]
+        assert not session.reader._used_ranges
+        assert session.read()[-1] == ["3", "4", "5"]
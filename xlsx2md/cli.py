@@ -4,17 +4,26 @@ CLI interface for xlsx2md.
 
 import sys
 from pathlib import Path
-from typing import List, Optional, Any, Union
+from typing import Iterable, List, Optional, Any, Union
 import logging
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from .readers import read_file, get_reader
+from .readers import read_file, get_reader, WorkbookSession
 from .renderer import render_markdown_table
-from .utils import get_output_stream
-from .config import VERSION, ERROR_MESSAGES, SUPPORTED_FORMATS
+from .parallel import ERROR_PLACEHOLDER_PREFIX, render_sheet, render_sheets_parallel
+from .render_cache import RenderCache, sheet_fingerprints
+from .utils import get_output_stream, parse_column_list
+from .config import (
+    VERSION,
+    ERROR_MESSAGES,
+    SUPPORTED_FORMATS,
+    DEFAULT_XLSX_ENGINE,
+    DEFAULT_JOBS,
+    DEFAULT_CACHE_DIR,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("xlsx2md.cli")
@@ -100,7 +109,7 @@ def main(
     sheet: Optional[str] = typer.Option(
         None, "--sheet", "-s", help="Sheet name or index (default: first sheet)"
     ),
-    range: Optional[str] = typer.Option(
+    cell_range: Optional[str] = typer.Option(
         None, "--range", "-r", help="Cell range (e.g., A1:B10)"
     ),
     output: Optional[Path] = typer.Option(
@@ -117,10 +126,60 @@ def main(
         False, "--list-sheets", help="List all sheets in Excel file"
     ),
     info: bool = typer.Option(False, "--info", help="Show file information"),
+    approx: bool = typer.Option(
+        False,
+        "--approx",
+        help="With --info, estimate the row count of CSV files from sampled "
+        "segments instead of scanning the whole file",
+    ),
     all_sheets: bool = typer.Option(False, "--all-sheets", help="Process all sheets"),
     sheets: Optional[str] = typer.Option(
         None, "--sheets", help="Process specific sheets (1,3,5 or 'Sheet1,Sheet3')"
     ),
+    engine: str = typer.Option(
+        DEFAULT_XLSX_ENGINE,
+        "--engine",
+        help="XLSX engine: openpyxl, native or pipelined",
+    ),
+    max_rows: Optional[int] = typer.Option(
+        None,
+        "--max-rows",
+        "--head",
+        min=1,
+        help="Read only the first N non-empty rows of each sheet",
+    ),
+    columns: Optional[str] = typer.Option(
+        None,
+        "--columns",
+        help="Columns to keep: letters, 0-based indexes or header names (A,C,Price)",
+    ),
+    sample: Optional[int] = typer.Option(
+        None,
+        "--sample",
+        min=1,
+        help="Keep the header and a random sample of N rows of each sheet",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Random seed for a reproducible --sample"
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for --all-sheets and for parsing large CSV files",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="With --all-sheets, reuse the Markdown of XLSX sheets that did "
+        "not change since the last run",
+    ),
+    cache_dir: Path = typer.Option(
+        Path(DEFAULT_CACHE_DIR),
+        "--cache-dir",
+        help="Directory of the --incremental cache",
+    ),
     version: bool = typer.Option(
         False,
         "--version",
@@ -138,6 +197,14 @@ def main(
         xlsx2md data.xlsx --style grid --align center --empty "-"
         xlsx2md data.xlsx --all-sheets --output tables.md
         xlsx2md data.xlsx --list-sheets
+        xlsx2md data.xlsx --engine native
+        xlsx2md data.xlsx --all-sheets --jobs 4
+        xlsx2md data.xlsx --all-sheets --incremental
+        xlsx2md huge.csv --head 20
+        xlsx2md data.xlsx --columns "A,C,Price"
+        xlsx2md huge.csv --sample 50 --seed 1
+        xlsx2md huge.csv --jobs 4
+        xlsx2md huge.csv --info --approx
     """
     try:
         logger.info(f"Start processing: {file_path}")
@@ -156,8 +223,16 @@ def main(
             )
             sys.exit(1)
 
+        # Parse column selection
+        column_list = None
+        if columns is not None:
+            column_list = parse_column_list(columns)
+            if not column_list:
+                print_error(ERROR_MESSAGES["invalid_columns"].format(columns=columns))
+                sys.exit(1)
+
         # Get reader
-        reader = get_reader(file_path)
+        reader = get_reader(file_path, engine, jobs)
         logger.info(f"Reader selected: {type(reader).__name__}")
 
         # Handle list-sheets option
@@ -189,22 +264,61 @@ def main(
         # Handle info option
         if info:
             logger.info("Show file info...")
-            show_file_info(file_path, reader)
+            show_file_info(file_path, reader, approx)
             return
 
         # Process sheets
         if all_sheets:
             logger.info("Processing all sheets...")
-            process_all_sheets(file_path, reader, range, output, style, align, empty)
+            process_all_sheets(
+                file_path,
+                reader,
+                cell_range,
+                output,
+                style,
+                align,
+                empty,
+                engine,
+                jobs,
+                max_rows,
+                column_list,
+                sample,
+                seed,
+                cache_dir if incremental else None,
+            )
         elif sheets:
             logger.info(f"Processing specific sheets: {sheets}")
             process_specific_sheets(
-                file_path, reader, sheets, range, output, style, align, empty
+                file_path,
+                reader,
+                sheets,
+                cell_range,
+                output,
+                style,
+                align,
+                empty,
+                max_rows,
+                column_list,
+                sample,
+                seed,
             )
         else:
             logger.info(f"Processing single sheet: {sheet}")
             process_single_sheet(
-                file_path, reader, sheet, range, output, style, align, empty
+                file_path,
+                reader,
+                sheet,
+                cell_range,
+                output,
+                style,
+                align,
+                empty,
+                engine,
+                max_rows,
+                column_list,
+                sample,
+                seed,
+                jobs,
             )
 
     except Exception as e:
@@ -213,80 +327,110 @@ def main(
         sys.exit(1)
 
 
-def show_file_info(file_path: str, reader: Any) -> None:
+def show_file_info(file_path: str, reader: Any, approx: bool = False) -> None:
     """
     Display detailed information about the input file.
 
     Shows file size, type, number of sheets, and sheet details including
-    row and column counts for each sheet.
+    row and column counts for each sheet. All sheet dimensions are gathered
+    with a single reader call. CSV files show their record count, column
+    count, encoding and delimiter from the reader's metadata scan, which
+    does not parse the file.
 
     Args:
         file_path: Path to the input file
-        reader: File reader instance with sheet information methods
+        reader: File reader instance with get_workbook_info method (Excel)
+            or get_file_info method (CSV)
+        approx: Estimate the row count of CSV files from sampled segments
     """
     try:
         # Basic file info
         file_path_obj = Path(file_path)
         size_mb = file_path_obj.stat().st_size / (1024 * 1024)
 
+        properties = [
+            ("File", file_path),
+            ("Type", file_path_obj.suffix.upper()),
+            ("Size", f"{size_mb:.2f} MB"),
+        ]
+
+        # Sheet info
+        if hasattr(reader, "get_sheet_names"):
+            sheets_info = reader.get_workbook_info(file_path)
+            properties.append(("Sheets", str(len(sheets_info))))
+            for sheet_info in sheets_info:
+                details = (
+                    f"{format_count(sheet_info, 'nrows')} rows, "
+                    f"{format_count(sheet_info, 'ncols')} cols"
+                )
+                if sheet_info.get("state", "visible") != "visible":
+                    details += f", {sheet_info['state']}"
+                properties.append(
+                    (
+                        f"  Sheet {sheet_info['index']}",
+                        f"{sheet_info['name']} ({details})",
+                    )
+                )
+        else:
+            csv_info = reader.get_file_info(file_path, approx=approx)
+            if csv_info:
+                rows = str(csv_info["row_count"])
+                if not csv_info["exact"]:
+                    rows = f"~{rows}"
+                properties.append(("Rows", rows))
+                properties.append(("Columns", str(csv_info["ncols"])))
+                properties.append(("Encoding", csv_info["encoding"]))
+                properties.append(("Delimiter", repr(csv_info["delimiter"])))
+
         console = get_console()
         if console:
             info_table = Table(title="File Information")
             info_table.add_column("Property", style="cyan")
             info_table.add_column("Value", style="green")
-
-            info_table.add_row("File", file_path)
-            info_table.add_row("Type", file_path_obj.suffix.upper())
-            info_table.add_row("Size", f"{size_mb:.2f} MB")
-
-            # Sheet info if available
-            if hasattr(reader, "get_sheet_names"):
-                sheet_names = reader.get_sheet_names(file_path)
-                if sheet_names:
-                    info_table.add_row("Sheets", str(len(sheet_names)))
-                    for i, name in enumerate(sheet_names):
-                        sheet_info = reader.get_sheet_info(file_path, i)
-                        if sheet_info:
-                            info_table.add_row(
-                                f"  Sheet {i}",
-                                f"{name} ({sheet_info.get('nrows', '?')} rows, "
-                                f"{sheet_info.get('ncols', '?')} cols)",
-                            )
-
+            for name, value in properties:
+                info_table.add_row(name, value)
             console.print(info_table)
         else:
             print("File Information:")
-            print(f"File: {file_path}")
-            print(f"Type: {file_path_obj.suffix.upper()}")
-            print(f"Size: {size_mb:.2f} MB")
-
-            # Sheet info if available
-            if hasattr(reader, "get_sheet_names"):
-                sheet_names = reader.get_sheet_names(file_path)
-                if sheet_names:
-                    print(f"Sheets: {len(sheet_names)}")
-                    for i, name in enumerate(sheet_names):
-                        sheet_info = reader.get_sheet_info(file_path, i)
-                        if sheet_info:
-                            print(
-                                f"  Sheet {i}: {name} "
-                                f"({sheet_info.get('nrows', '?')} rows, "
-                                f"{sheet_info.get('ncols', '?')} cols)"
-                            )
+            for name, value in properties:
+                print(f"{name}: {value}")
 
     except Exception as e:
         print_error(f"Error getting file info: {str(e)}")
 
 
+def format_count(sheet_info: dict, key: str) -> str:
+    """
+    Format row or column count, marking lower bounds from partial scans.
+
+    Args:
+        sheet_info: Sheet information from get_workbook_info
+        key: "nrows" or "ncols"
+
+    Returns:
+        str: Count, with a trailing "+" if it is a lower bound
+    """
+    count = str(sheet_info.get(key, "?"))
+    if not sheet_info.get("exact", True):
+        count += "+"
+    return count
+
+
 def process_single_sheet(
     file_path: str,
     reader: Any,
     sheet: Optional[str],
-    range: Optional[str],
+    cell_range: Optional[str],
     output: Optional[Path],
     style: str,
     align: Optional[List[str]],
     empty: str,
+    engine: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    columns: Optional[List[Union[str, int]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    jobs: int = DEFAULT_JOBS,
 ) -> None:
     """Process a single sheet."""
     try:
@@ -299,7 +443,17 @@ def process_single_sheet(
                 sheet_param = sheet
 
         # Read data
-        data = read_file(file_path, sheet_param, range, max_rows=None)
+        data = read_file(
+            file_path,
+            sheet_param,
+            cell_range,
+            max_rows=max_rows,
+            engine=engine,
+            columns=columns,
+            sample=sample,
+            seed=seed,
+            jobs=jobs,
+        )
 
         if not data:
             print_warning("No data found")
@@ -327,62 +481,200 @@ def process_single_sheet(
 def process_all_sheets(
     file_path: str,
     reader: Any,
-    range: Optional[str],
+    cell_range: Optional[str],
     output: Optional[Path],
     style: str,
     align: Optional[List[str]],
     empty: str,
+    engine: Optional[str] = None,
+    jobs: int = DEFAULT_JOBS,
+    max_rows: Optional[int] = None,
+    columns: Optional[List[Union[str, int]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
 ) -> None:
-    """Process all sheets in file."""
+    """
+    Process all sheets in file, optionally in worker processes.
+
+    With a cache directory, XLSX sheets whose fingerprint is unchanged since
+    the previous run are taken from the cache instead of being converted.
+    """
     try:
         if not hasattr(reader, "get_sheet_names"):
             print_warning("Multiple sheets not supported for this file type")
             return
 
-        sheet_names = reader.get_sheet_names(file_path)
-        if not sheet_names:
-            print_warning("No sheets found")
-            return
-
-        with get_output_stream(str(output) if output else None) as stream:
-            for i, sheet_name in enumerate(sheet_names):
-                # Sheet header
-                if i > 0:
-                    stream.write("\n\n---\n\n")
-                stream.write(f"# Sheet: {sheet_name}\n\n")
-
-                # Process sheet
-                try:
-                    data = read_file(file_path, i, range, max_rows=None)
-                    if data:
-                        markdown = render_markdown_table(
-                            data,
-                            style=style,  # type: ignore
-                            align=align,  # type: ignore
-                            empty_cell=empty,
-                        )
-                        stream.write(markdown)
-                    else:
-                        stream.write("*No data in this sheet*\n")
-                except Exception as e:
-                    stream.write(f"*Error processing sheet: {str(e)}*\n")
+        if cache_dir is not None:
+            if Path(file_path).suffix.lower() == ".xlsx":
+                options = {
+                    "cell_range": cell_range,
+                    "style": style,
+                    "align": align,
+                    "empty": empty,
+                    "engine": engine,
+                    "max_rows": max_rows,
+                    "columns": columns,
+                    "sample": sample,
+                    "seed": seed,
+                }
+                process_all_sheets_incremental(
+                    file_path,
+                    reader,
+                    output,
+                    RenderCache(cache_dir, file_path, options),
+                    jobs,
+                )
+                return
+            print_warning("Incremental conversion is only supported for XLSX files")
+
+        with WorkbookSession(file_path, reader) as session:
+            sheet_names = session.sheet_names
+            if not sheet_names:
+                print_warning("No sheets found")
+                return
+
+            sheet_indexes = list(range(len(sheet_names)))
+            if jobs > 1 and len(sheet_indexes) > 1:
+                # Workers open their own copy of the workbook
+                session.close()
+                bodies = render_sheets_parallel(
+                    file_path,
+                    sheet_indexes,
+                    cell_range,
+                    style,
+                    align,
+                    empty,
+                    engine=engine,
+                    jobs=jobs,
+                    max_rows=max_rows,
+                    columns=columns,
+                    sample=sample,
+                    seed=seed,
+                )
+            else:
+                bodies = (
+                    render_sheet(
+                        session,
+                        i,
+                        cell_range,
+                        style,
+                        align,
+                        empty,
+                        max_rows,
+                        columns,
+                        sample,
+                        seed,
+                    )
+                    for i in sheet_indexes
+                )
 
-                stream.write("\n")
+            write_sheet_sections(output, sheet_names, bodies)
 
     except Exception as e:
         print_error(f"Error processing all sheets: {str(e)}")
         raise
 
 
+def process_all_sheets_incremental(
+    file_path: str,
+    reader: Any,
+    output: Optional[Path],
+    cache: RenderCache,
+    jobs: int = DEFAULT_JOBS,
+) -> None:
+    """
+    Process all sheets of an XLSX file, converting only changed sheets.
+
+    Sheets are fingerprinted from zip metadata. Sheets found in the cache are
+    spliced in without opening the workbook; the others are converted with
+    the options of the cache and stored in it. Sheets that failed to convert
+    are not cached.
+    """
+    options = cache.options
+    fingerprints = sheet_fingerprints(file_path)
+    if not fingerprints:
+        print_warning("No sheets found")
+        return
+
+    bodies = [cache.get(fingerprint) for _, fingerprint in fingerprints]
+    stale = [i for i, body in enumerate(bodies) if body is None]
+    logger.info(f"{len(stale)} of {len(bodies)} sheets changed since the last run")
+
+    render_args = (
+        options["cell_range"],
+        options["style"],
+        options["align"],
+        options["empty"],
+    )
+    if jobs > 1 and len(stale) > 1:
+        rendered = list(
+            render_sheets_parallel(
+                file_path,
+                stale,
+                *render_args,
+                engine=options["engine"],
+                jobs=jobs,
+                max_rows=options["max_rows"],
+                columns=options["columns"],
+                sample=options["sample"],
+                seed=options["seed"],
+            )
+        )
+    elif stale:
+        with WorkbookSession(file_path, reader) as session:
+            rendered = [
+                render_sheet(
+                    session,
+                    i,
+                    *render_args,
+                    options["max_rows"],
+                    options["columns"],
+                    options["sample"],
+                    options["seed"],
+                )
+                for i in stale
+            ]
+    else:
+        rendered = []
+
+    fresh = dict(zip(stale, rendered))
+    for i, body in fresh.items():
+        if not body.startswith(ERROR_PLACEHOLDER_PREFIX):
+            cache.put(fingerprints[i][1], body)
+    cache.save()
+
+    sections = [fresh[i] if body is None else body for i, body in enumerate(bodies)]
+    write_sheet_sections(output, [name for name, _ in fingerprints], sections)
+
+
+def write_sheet_sections(
+    output: Optional[Path], sheet_names: List[str], bodies: Iterable[str]
+) -> None:
+    """Write rendered sheets under "# Sheet:" headings separated by rules."""
+    with get_output_stream(str(output) if output else None) as stream:
+        for i, (sheet_name, body) in enumerate(zip(sheet_names, bodies)):
+            # Sheet header
+            if i > 0:
+                stream.write("\n\n---\n\n")
+            stream.write(f"# Sheet: {sheet_name}\n\n")
+            stream.write(body)
+            stream.write("\n")
+
+
 def process_specific_sheets(
     file_path: str,
     reader: Any,
     sheets: str,
-    range: Optional[str],
+    cell_range: Optional[str],
     output: Optional[Path],
     style: str,
     align: Optional[List[str]],
     empty: str,
+    max_rows: Optional[int] = None,
+    columns: Optional[List[Union[str, int]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
 ) -> None:
     """Process specific sheets."""
     try:
@@ -399,9 +691,10 @@ def process_specific_sheets(
             except ValueError:
                 sheet_list.append(item)
 
-        sheet_names = reader.get_sheet_names(file_path)
-
-        with get_output_stream(str(output) if output else None) as stream:
+        with WorkbookSession(file_path, reader) as session, get_output_stream(
+            str(output) if output else None
+        ) as stream:
+            sheet_names = session.sheet_names
             for i, sheet_param in enumerate(sheet_list):
                 # Sheet header
                 if i > 0:
@@ -420,21 +713,20 @@ def process_specific_sheets(
                 stream.write(f"# Sheet: {sheet_name}\n\n")
 
                 # Process sheet
-                try:
-                    data = read_file(file_path, sheet_param, range, max_rows=None)
-                    if data:
-                        markdown = render_markdown_table(
-                            data,
-                            style=style,  # type: ignore
-                            align=align,  # type: ignore
-                            empty_cell=empty,
-                        )
-                        stream.write(markdown)
-                    else:
-                        stream.write("*No data in this sheet*\n")
-                except Exception as e:
-                    stream.write(f"*Error processing sheet: {str(e)}*\n")
-
+                stream.write(
+                    render_sheet(
+                        session,
+                        sheet_param,
+                        cell_range,
+                        style,
+                        align,
+                        empty,
+                        max_rows,
+                        columns,
+                        sample,
+                        seed,
+                    )
+                )
                 stream.write("\n")
 
     except Exception as e:
@@ -28,8 +28,57 @@ SUPPORTED_FORMATS_STR = ", ".join(SUPPORTED_FORMATS)
 DEFAULT_ENCODING = "utf-8"
 CSV_ENCODINGS = ["utf-8", "cp1251", "latin-1", "iso-8859-1"]
 MAX_FILE_SIZE_MB = 100
+
+# CSV encoding detection: bytes validated as strict UTF-8 before falling back
+# to chardet, and chunk size fed to chardet's incremental detector
+ENCODING_DETECT_WINDOW_KB = 1024
+ENCODING_DETECT_CHUNK_KB = 64
+
+# Raw bytes read and decoded at a time when parsing CSV files
+CSV_READ_CHUNK_KB = 1024
+
+# With --jobs, CSV files of at least CSV_PARALLEL_MIN_MB are split into byte
+# ranges of about CSV_PARALLEL_CHUNK_MB that worker processes parse
+CSV_PARALLEL_MIN_MB = 32
+CSV_PARALLEL_CHUNK_MB = 8
+
+# --info --approx estimates the CSV record count from CSV_APPROX_SEGMENTS
+# segments of CSV_APPROX_SEGMENT_KB spread over the file
+CSV_APPROX_SEGMENTS = 16
+CSV_APPROX_SEGMENT_KB = 256
 MAX_ROWS_TO_READ = 10000
 
+# XLSX reading engines
+XLSX_ENGINES = ["openpyxl", "native", "pipelined"]
+DEFAULT_XLSX_ENGINE = "openpyxl"
+
+# Cleaned cell values are interned per column; a column stops being interned
+# when more than this share of its first INTERN_SAMPLE_ROWS values is distinct,
+# or when its pool of raw and cleaned strings grows past INTERN_MAX_POOL_SIZE
+INTERN_SAMPLE_ROWS = 1000
+INTERN_MAX_DISTINCT_RATIO = 0.5
+INTERN_MAX_POOL_SIZE = 100_000
+
+# Serve XLSX zip members and XLS BIFF streams from memory maps
+USE_MMAP = True
+
+# Worksheet XML chunks inflated ahead of the parser by the pipelined engine
+PIPELINE_QUEUE_CHUNKS = 16
+
+# Shared strings tables larger than this (uncompressed) are indexed lazily
+SHARED_STRINGS_LAZY_MB = 8
+SHARED_STRINGS_CACHE_SIZE = 4096  # Decoded strings kept in the LRU cache
+SHARED_STRINGS_SPOOL_MB = 64  # In-memory buffer before spilling to disk
+
+# Rows scanned by --info for sheets without a stored dimension
+INFO_SCAN_MAX_ROWS = 100000
+
+# Worker processes used for --all-sheets (1 = convert sheets sequentially)
+DEFAULT_JOBS = 1
+
+# Rendered sheets kept by --incremental
+DEFAULT_CACHE_DIR = ".xlsx2md-cache"
+
 # CLI settings
 DEFAULT_OUTPUT_FORMAT = "markdown"
 ENABLE_COLORS = True
@@ -78,6 +127,10 @@ ERROR_MESSAGES = {
     "invalid_output_path": "Invalid output path: {output_path}",
     "file_path_not_specified": "File path not specified",
     "invalid_style": "Invalid table style: {style}",
+    "invalid_engine": "Unsupported engine: {engine}. Supported engines: {supported}",
+    "invalid_columns": "Invalid column selection: {columns}",
+    "column_not_found": "Column not found: {column}",
+    "invalid_sample": "Sample size must be a positive integer: {size}",
     "empty_file": "File is empty or contains no data",
     "encoding_error": ("File encoding error. Try specifying encoding explicitly."),
     "permission_error": "No access to file: {file_path}",
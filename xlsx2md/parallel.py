@@ -0,0 +1,184 @@
+"""
+Sheet conversion shared by serial and parallel multi-sheet processing.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+import logging
+import os
+
+from .readers import open_workbook, WorkbookSession
+from .readers.mapped_file import extract_workbook_stream
+from .readers.projection import ColumnSpec
+from .renderer import render_markdown_table
+
+logger = logging.getLogger(__name__)
+
+# Start of the placeholder rendered for sheets that failed to convert
+ERROR_PLACEHOLDER_PREFIX = "*Error processing sheet:"
+
+# Workbook opened once per worker process by _init_worker
+_worker_session: Optional[WorkbookSession] = None
+
+
+def render_sheet(
+    session: WorkbookSession,
+    sheet_name_or_index: Union[str, int],
+    cell_range: Optional[str],
+    style: str,
+    align: Optional[List[str]],
+    empty: str,
+    max_rows: Optional[int] = None,
+    columns: Optional[Sequence[ColumnSpec]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> str:
+    """
+    Render one sheet of an opened workbook as a Markdown section body.
+
+    Errors are rendered as a placeholder instead of being raised, so that
+    one broken sheet does not stop the remaining ones.
+
+    Args:
+        session: Opened workbook session
+        sheet_name_or_index: Sheet name or index
+        cell_range: Cell range in A1:B10 format
+        style: Table style
+        align: Column alignment
+        empty: Value for empty cells
+        max_rows: Maximum number of non-empty rows to read
+        columns: Column letters, 0-based indices or header names to keep
+        sample: Number of rows to sample after the header
+        seed: Random seed for the sample
+
+    Returns:
+        str: Markdown table or placeholder text
+    """
+    try:
+        data = session.read(
+            sheet_name_or_index,
+            cell_range,
+            max_rows=max_rows,
+            columns=columns,
+            sample=sample,
+            seed=seed,
+        )
+        if not data:
+            return "*No data in this sheet*\n"
+        return render_markdown_table(
+            data,
+            style=style,  # type: ignore
+            align=align,  # type: ignore
+            empty_cell=empty,
+        )
+    except Exception as e:
+        return f"{ERROR_PLACEHOLDER_PREFIX} {str(e)}*\n"
+
+
+def _init_worker(file_path: str, engine: Optional[str]) -> None:
+    """Open the workbook in a worker process."""
+    global _worker_session
+    _worker_session = open_workbook(file_path, engine)
+
+
+def _render_worker_sheet(
+    sheet_index: int,
+    cell_range: Optional[str],
+    style: str,
+    align: Optional[List[str]],
+    empty: str,
+    max_rows: Optional[int],
+    columns: Optional[Sequence[ColumnSpec]],
+    sample: Optional[int],
+    seed: Optional[int],
+) -> str:
+    """Render one sheet with the workbook opened by _init_worker."""
+    assert _worker_session is not None
+    return render_sheet(
+        _worker_session,
+        sheet_index,
+        cell_range,
+        style,
+        align,
+        empty,
+        max_rows,
+        columns,
+        sample,
+        seed,
+    )
+
+
+def render_sheets_parallel(
+    file_path: str,
+    sheet_indexes: Sequence[int],
+    cell_range: Optional[str],
+    style: str,
+    align: Optional[List[str]],
+    empty: str,
+    engine: Optional[str] = None,
+    jobs: int = 1,
+    max_rows: Optional[int] = None,
+    columns: Optional[Sequence[ColumnSpec]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Render sheets in worker processes.
+
+    Each worker opens the workbook once and converts the sheets it is given.
+    Results are yielded in the order of ``sheet_indexes`` as soon as they
+    are available.
+
+    XLS workbooks are opened on demand from a memory map, so each worker
+    decodes only the workbook globals and its own sheets, and all workers
+    share the file's pages. A workbook stream that is fragmented inside the
+    compound file is assembled once into a temporary file that the workers
+    map instead of each building its own copy.
+
+    Args:
+        file_path: Path to the Excel file
+        sheet_indexes: Indexes of sheets to render
+        cell_range: Cell range in A1:B10 format
+        style: Table style
+        align: Column alignment
+        empty: Value for empty cells
+        engine: XLSX engine
+        jobs: Number of worker processes
+        max_rows: Maximum number of non-empty rows to read per sheet
+        columns: Column letters, 0-based indices or header names to keep
+        sample: Number of rows to sample after the header
+        seed: Random seed for the sample
+
+    Yields:
+        str: Markdown table or placeholder text for each sheet
+    """
+    workers = max(1, min(jobs, len(sheet_indexes)))
+    logger.info(f"Rendering {len(sheet_indexes)} sheets with {workers} workers")
+
+    shared_stream = None
+    if Path(file_path).suffix.lower() == ".xls":
+        shared_stream = extract_workbook_stream(file_path)
+
+    count = len(sheet_indexes)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared_stream or file_path, engine),
+        ) as executor:
+            yield from executor.map(
+                _render_worker_sheet,
+                sheet_indexes,
+                [cell_range] * count,
+                [style] * count,
+                [align] * count,
+                [empty] * count,
+                [max_rows] * count,
+                [columns] * count,
+                [sample] * count,
+                [seed] * count,
+            )
+    finally:
+        if shared_stream is not None:
+            os.unlink(shared_stream)
@@ -2,35 +2,44 @@
 File readers package for xlsx2md.
 """
 
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Sequence, Union
 import logging
 
 from .base import BaseReader
 from .xlsx_reader import XLSXReader
+from .xlsx_native_reader import NativeXLSXReader
 from .xls_reader import XLSReader
 from .csv_reader import CSVReader
+from .projection import ColumnProjection, ColumnSpec
+from .sampling import RowSampler
+from .session import WorkbookSession
+from ..config import DEFAULT_XLSX_ENGINE, ERROR_MESSAGES, XLSX_ENGINES
 
 logger = logging.getLogger(__name__)
 
 
-def get_reader(file_path: str) -> BaseReader:
+def get_reader(
+    file_path: str, engine: Optional[str] = None, jobs: int = 1
+) -> BaseReader:
     """
     Factory function to get appropriate reader for file type.
 
     Automatically selects the correct reader based on file extension:
-    - .xlsx files -> XLSXReader
+    - .xlsx files -> XLSXReader (or NativeXLSXReader with engine="native")
     - .xls files -> XLSReader
     - .csv files -> CSVReader
 
     Args:
         file_path: Path to the file to read
+        engine: XLSX engine, "openpyxl", "native" or "pipelined" (default: openpyxl)
+        jobs: Worker processes parsing large CSV files
 
     Returns:
         BaseReader: Appropriate reader instance for the file type
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file format is not supported
+        ValueError: If file format or engine is not supported
 
     Examples:
         >>> reader = get_reader("data.xlsx")
@@ -39,6 +48,14 @@ def get_reader(file_path: str) -> BaseReader:
     """
     import os
 
+    engine = engine or DEFAULT_XLSX_ENGINE
+    if engine not in XLSX_ENGINES:
+        raise ValueError(
+            ERROR_MESSAGES["invalid_engine"].format(
+                engine=engine, supported=", ".join(XLSX_ENGINES)
+            )
+        )
+
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -47,11 +64,15 @@ def get_reader(file_path: str) -> BaseReader:
 
     # Create appropriate reader
     if ext == ".xlsx":
+        if engine == "native":
+            return NativeXLSXReader()
+        if engine == "pipelined":
+            return NativeXLSXReader(pipelined=True)
         return XLSXReader()
     elif ext == ".xls":
         return XLSReader()
     elif ext == ".csv":
-        return CSVReader()
+        return CSVReader(jobs)
     else:
         raise ValueError(f"Unsupported file format: {ext}")
 
@@ -62,6 +83,11 @@ def read_file(
     cell_range: Optional[str] = None,
     encoding: Optional[str] = None,
     max_rows: Optional[int] = None,
+    engine: Optional[str] = None,
+    columns: Optional[Sequence[ColumnSpec]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    jobs: int = 1,
 ) -> List[List[str]]:
     """
     Read data from file using appropriate reader.
@@ -75,6 +101,14 @@ def read_file(
         cell_range: Cell range in A1:B10 format (e.g., "A1:C10")
         encoding: File encoding (for CSV files only, e.g., "utf-8", "cp1251")
         max_rows: Maximum number of rows to read (None for all rows)
+        engine: XLSX engine, "openpyxl", "native" or "pipelined" (default: openpyxl)
+        columns: Column letters, 0-based indices or header names to keep
+            (None for all columns)
+        sample: Keep the header and a uniform random sample of this many of
+            the following rows (None for all rows)
+        seed: Random seed for a reproducible sample
+        jobs: Worker processes parsing large CSV files (split into byte
+            ranges); smaller files and other formats are read serially
 
     Returns:
         List[List[str]]: 2D list where each inner list represents a row
@@ -87,16 +121,102 @@ def read_file(
         >>> data = read_file("data.xlsx", sheet_name_or_index="Sheet1")
         >>> data = read_file("data.csv", encoding="utf-8", max_rows=100)
         >>> data = read_file("data.xlsx", cell_range="A1:C10")
+        >>> data = read_file("data.xlsx", engine="native")
+        >>> data = read_file("data.xlsx", columns=["A", "Price"])
+        >>> data = read_file("data.csv", sample=100, seed=1)
+        >>> data = read_file("huge.csv", jobs=4)
+    """
+    reader = get_reader(file_path, engine, jobs)
+    return reader.read(
+        file_path,
+        sheet_name_or_index,
+        cell_range,
+        encoding,
+        max_rows,
+        columns,
+        sample,
+        seed,
+    )
+
+
+def iter_file(
+    file_path: str,
+    sheet_name_or_index: Optional[Union[str, int]] = None,
+    cell_range: Optional[str] = None,
+    encoding: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    engine: Optional[str] = None,
+    columns: Optional[Sequence[ColumnSpec]] = None,
+    jobs: int = 1,
+) -> Iterator[List[str]]:
+    """
+    Iterate over the rows of a file.
+
+    Streaming variant of :func:`read_file`: CSV files are parsed lazily in
+    bounded memory, Excel sheets are read whole and then iterated. Rows are
+    cleaned like those of read_file but not padded to a common width.
+
+    Args:
+        file_path: Path to the file to read
+        sheet_name_or_index: Sheet name or index (for Excel files only)
+        cell_range: Cell range in A1:B10 format (e.g., "A1:C10")
+        encoding: File encoding (for CSV files only, e.g., "utf-8", "cp1251")
+        max_rows: Maximum number of rows to read (None for all rows)
+        engine: XLSX engine, "openpyxl", "native" or "pipelined" (default: openpyxl)
+        columns: Column letters, 0-based indices or header names to keep
+            (None for all columns)
+        jobs: Worker processes parsing large CSV files
+
+    Returns:
+        Iterator[List[str]]: Row iterator
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is not supported or parameters are invalid
+
+    Examples:
+        >>> for row in iter_file("huge.csv", columns=["id", "total"]):
+        ...     process(row)
+    """
+    reader = get_reader(file_path, engine, jobs)
+    return reader.iter_rows(
+        file_path, sheet_name_or_index, cell_range, encoding, max_rows, columns
+    )
+
+
+def open_workbook(file_path: str, engine: Optional[str] = None) -> WorkbookSession:
+    """
+    Open workbook once for reading several sheets.
+
+    Args:
+        file_path: Path to the Excel file (xlsx or xls)
+        engine: XLSX engine, "openpyxl", "native" or "pipelined" (default: openpyxl)
+
+    Returns:
+        WorkbookSession: Session exposing sheet names and per-sheet reads
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format has no sheets or is not supported
+
+    Examples:
+        >>> with open_workbook("data.xlsx") as session:
+        ...     tables = [session.read(i) for i in range(len(session.sheet_names))]
     """
-    reader = get_reader(file_path)
-    return reader.read(file_path, sheet_name_or_index, cell_range, encoding, max_rows)
+    return WorkbookSession(file_path, get_reader(file_path, engine))
 
 
 __all__ = [
     "BaseReader",
     "XLSXReader",
+    "NativeXLSXReader",
     "XLSReader",
     "CSVReader",
     "get_reader",
     "read_file",
+    "iter_file",
+    "open_workbook",
+    "WorkbookSession",
+    "ColumnProjection",
+    "RowSampler",
 ]
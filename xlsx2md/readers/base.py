@@ -3,15 +3,41 @@ Base reader class for file reading operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import logging
-
-from ..utils import clean_cell_value, parse_cell_range
-from ..config import MAX_ROWS_TO_READ
+import weakref
+
+from .projection import ColumnProjection, ColumnSpec
+from .sampling import RowSampler
+from ..utils import clean_cell_value, index_to_column, parse_cell_range
+from ..config import (
+    INTERN_MAX_DISTINCT_RATIO,
+    INTERN_MAX_POOL_SIZE,
+    INTERN_SAMPLE_ROWS,
+    MAX_ROWS_TO_READ,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class UsedRange(NamedTuple):
+    """Last row and column holding a value (1-based, 0 for empty sheets)."""
+
+    nrows: int
+    ncols: int
+
+
 class BaseReader(ABC):
     """
     Abstract base class for all file readers.
@@ -28,6 +54,12 @@ class BaseReader(ABC):
         Sets maximum rows to read from configuration.
         """
         self.max_rows = MAX_ROWS_TO_READ
+        # Used ranges detected by complete reads, keyed by sheet object: they
+        # live as long as the loaded workbook (one WorkbookSession), and a
+        # workbook loaded again detects them again
+        self._used_ranges: "weakref.WeakKeyDictionary[Any, UsedRange]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     @abstractmethod
     def read(
@@ -37,6 +69,9 @@ class BaseReader(ABC):
         cell_range: Optional[str] = None,
         encoding: Optional[str] = None,
         max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> List[List[str]]:
         """
         Read data from file.
@@ -51,6 +86,11 @@ class BaseReader(ABC):
             cell_range: Cell range in A1:B10 format (e.g., "A1:C10")
             encoding: File encoding (for CSV files only)
             max_rows: Maximum number of rows to read (None for all rows)
+            columns: Column letters, 0-based indices or header names to keep
+                (None for all columns)
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
 
         Returns:
             List[List[str]]: 2D list where each inner list represents a row
@@ -61,6 +101,162 @@ class BaseReader(ABC):
         """
         pass
 
+    def iter_rows(
+        self,
+        file_path: str,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        encoding: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+    ) -> Iterator[List[str]]:
+        """
+        Iterate over the cleaned rows of a file.
+
+        Readers that can parse their format incrementally override this to
+        produce rows lazily in bounded memory; unlike :meth:`read`, rows are
+        then not padded to a common width. This default reads the whole
+        sheet with :meth:`read`.
+
+        Args:
+            file_path: Path to the file to read
+            sheet_name_or_index: Sheet name or index (for Excel files only)
+            cell_range: Cell range in A1:B10 format (e.g., "A1:C10")
+            encoding: File encoding (for CSV files only)
+            max_rows: Maximum number of rows to read (None for all rows)
+            columns: Column letters, 0-based indices or header names to keep
+                (None for all columns)
+
+        Returns:
+            Iterator[List[str]]: Row iterator
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If parameters are invalid or file is corrupted
+        """
+        return iter(
+            self.read(
+                file_path, sheet_name_or_index, cell_range, encoding, max_rows, columns
+            )
+        )
+
+    def open_workbook(self, file_path: str) -> Any:
+        """
+        Open workbook once for reading several sheets.
+
+        Implemented by readers of multi-sheet formats; used by WorkbookSession.
+
+        Args:
+            file_path: Path to the file to open
+
+        Returns:
+            Any: Reader-specific workbook handle
+
+        Raises:
+            ValueError: If the file format has no sheets
+        """
+        raise ValueError(
+            f"Workbook sessions are not supported by {type(self).__name__}"
+        )
+
+    def close_workbook(self, workbook: Any) -> None:
+        """
+        Release workbook handle returned by open_workbook.
+
+        Args:
+            workbook: Workbook handle
+        """
+        raise NotImplementedError
+
+    def get_workbook_sheet_names(self, workbook: Any) -> List[str]:
+        """
+        Get sheet names of an opened workbook.
+
+        Args:
+            workbook: Workbook handle
+
+        Returns:
+            List[str]: List of sheet names
+        """
+        raise NotImplementedError
+
+    def read_sheet(
+        self,
+        workbook: Any,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Read one sheet of an opened workbook.
+
+        Args:
+            workbook: Workbook handle
+            sheet_name_or_index: Sheet name or index
+            cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
+
+        Returns:
+            List[List[str]]: Data as list of rows
+        """
+        raise NotImplementedError
+
+    def get_workbook_info(self, file_path: str) -> List[dict]:
+        """
+        Get dimensions of every sheet in one pass over the file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            List[dict]: One entry per sheet, see :meth:`_make_sheet_info`
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _make_sheet_info(
+        index: int,
+        name: str,
+        nrows: int,
+        ncols: int,
+        state: str = "visible",
+        exact: bool = True,
+    ) -> dict:
+        """
+        Build sheet information entry shared by all readers.
+
+        Args:
+            index: Sheet index
+            name: Sheet name
+            nrows: Number of rows up to the last used one
+            ncols: Number of columns up to the last used one
+            state: Sheet visibility ("visible", "hidden" or "veryHidden")
+            exact: False if the counts are a lower bound from a partial scan
+
+        Returns:
+            dict: Sheet information with index, name, state, nrows, ncols,
+            dimensions and exact keys
+        """
+        dimensions = ""
+        if nrows and ncols:
+            dimensions = f"A1:{index_to_column(ncols - 1)}{nrows}"
+        return {
+            "index": index,
+            "name": name,
+            "state": state,
+            "nrows": nrows,
+            "ncols": ncols,
+            "dimensions": dimensions,
+            "exact": exact,
+        }
+
     def _apply_cell_range(
         self, data: List[List[str]], cell_range: str
     ) -> List[List[str]]:
@@ -106,6 +302,218 @@ class BaseReader(ABC):
             logger.warning(f"Invalid cell range '{cell_range}': {e}")
             return data
 
+    def _iter_cell_range(
+        self, rows: Iterable[List[Any]], cell_range: str
+    ) -> Iterator[List[Any]]:
+        """
+        Yield the part of each row inside a cell range.
+
+        Streaming counterpart of :meth:`_apply_cell_range`: rows are cut to
+        the range columns but not padded, since the width of the data is not
+        known until all rows have been read. The source is closed after the
+        last row of the range.
+
+        Args:
+            rows: Row iterator
+            cell_range: Cell range in A1:B10 format
+
+        Yields:
+            List[Any]: Rows of the range
+        """
+        try:
+            (start_row, start_col), (end_row, end_col) = parse_cell_range(cell_range)
+        except ValueError as e:
+            logger.warning(f"Invalid cell range '{cell_range}': {e}")
+            yield from rows
+            return
+
+        try:
+            for number, row in enumerate(rows):
+                if number > end_row:
+                    break
+                if number >= start_row:
+                    yield row[start_col : end_col + 1]
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _is_empty_row(row: Sequence[Any]) -> bool:
+        """Check whether a row has no non-blank cells."""
+        return not any(cell is not None and str(cell).strip() for cell in row)
+
+    def _collect_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        max_rows: Optional[int] = None,
+        skip_empty: bool = True,
+        projection: Optional[ColumnProjection] = None,
+        offset: int = 0,
+        sampler: Optional[RowSampler] = None,
+    ) -> List[List[Any]]:
+        """
+        Collect rows from a row iterator, stopping after max_rows data rows.
+
+        See :meth:`_iter_collected_rows` for row limits and projection.
+
+        With a sampler, non-empty rows are offered to it instead of being
+        collected and the result is its sample; empty rows are dropped. The
+        sampler is reset first, so a retried read starts a fresh sample.
+
+        Args:
+            rows: Row iterator
+            max_rows: Maximum number of non-empty rows (None for all rows)
+            skip_empty: Drop empty rows instead of keeping them in place
+            projection: Columns to keep
+            offset: Sheet column of the first value in each row
+            sampler: Row sampler
+
+        Returns:
+            List[List[Any]]: Collected rows
+        """
+        if sampler is None:
+            return list(
+                self._iter_collected_rows(
+                    rows, max_rows, skip_empty, projection, offset
+                )
+            )
+
+        sampler.reset()
+        for row in self._iter_collected_rows(rows, max_rows, True, projection, offset):
+            sampler.add(row)
+        return sampler.rows()
+
+    def _iter_collected_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        max_rows: Optional[int] = None,
+        skip_empty: bool = True,
+        projection: Optional[ColumnProjection] = None,
+        offset: int = 0,
+    ) -> Iterator[List[Any]]:
+        """
+        Yield rows from a row iterator, stopping after max_rows data rows.
+
+        Only non-empty rows count towards ``max_rows``, so exactly
+        ``max_rows`` data rows are produced whenever the source has that
+        many. Generators are closed as soon as the limit is reached or this
+        iterator is closed, which releases the underlying file stream
+        without reading the rest of it.
+
+        With a projection, each row is cut down to the selected columns as
+        soon as it is produced; header names are resolved against the first
+        non-empty row. Emptiness is judged on the projected values.
+
+        Args:
+            rows: Row iterator
+            max_rows: Maximum number of non-empty rows (None for all rows)
+            skip_empty: Drop empty rows instead of keeping them in place
+            projection: Columns to keep
+            offset: Sheet column of the first value in each row
+
+        Yields:
+            List[Any]: Collected rows
+        """
+        # Empty rows seen before the header row resolved the projection
+        pending: List[Sequence[Any]] = []
+        count = 0
+        if projection is not None and not projection.needs_header:
+            projection.resolve(offset=offset)
+
+        try:
+            for row in rows:
+                if projection is not None:
+                    if not projection.resolved:
+                        if self._is_empty_row(row):
+                            if not skip_empty:
+                                pending.append(row)
+                            continue
+                        projection.resolve(row, offset)
+                        for empty in pending:
+                            yield projection.project(empty)
+                        pending = []
+                    row = projection.project(row)
+
+                if self._is_empty_row(row):
+                    if not skip_empty:
+                        yield list(row)
+                    continue
+
+                yield list(row)
+                count += 1
+                if max_rows and count >= max_rows:
+                    break
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    def _collect_used_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        max_rows: Optional[int] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> Tuple[List[List[Any]], Optional[UsedRange]]:
+        """
+        Collect non-empty rows trimmed to the used range of the sheet.
+
+        Sheet dimensions are often inflated by formatted but empty cells, and
+        row iterators pad every row to that width. Trailing blank cells are
+        cut off each row as it is produced, so the result (and the padding
+        added by :meth:`_normalize_data`) only spans columns that hold values.
+
+        Args:
+            rows: Row iterator starting at the first sheet row
+            max_rows: Maximum number of non-empty rows (None for all rows)
+            sampler: Row sampler offered the trimmed rows instead
+
+        Returns:
+            Tuple[List[List[Any]], Optional[UsedRange]]: Collected (or
+            sampled) rows and
+            the used range, which is None if reading stopped at max_rows
+        """
+        data = []
+        width = 0
+        last_row = 0
+        count = 0
+        used_range: Optional[UsedRange] = None
+        try:
+            for number, row in enumerate(rows, 1):
+                # Padding cells are None, so the common case is a C-level count
+                tail = row[width:]
+                if tail.count(None) != len(tail):
+                    end = len(row)
+                    while end > width and not self._is_used_cell(row[end - 1]):
+                        end -= 1
+                    width = end
+                trimmed = list(row[:width])
+                if self._is_empty_row(trimmed):
+                    continue
+
+                if sampler is not None:
+                    sampler.add(trimmed)
+                else:
+                    data.append(trimmed)
+                last_row = number
+                count += 1
+                if max_rows and count >= max_rows:
+                    break
+            else:
+                used_range = UsedRange(last_row, width)
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+        if sampler is not None:
+            data = sampler.rows()
+        return data, used_range
+
+    @staticmethod
+    def _is_used_cell(cell: Any) -> bool:
+        """Check whether a cell holds a non-blank value."""
+        return cell is not None and bool(str(cell).strip())
+
     def _limit_rows(
         self, data: List[List[str]], max_rows: Optional[int] = None
     ) -> List[List[str]]:
@@ -131,6 +539,8 @@ class BaseReader(ABC):
         """
         Clean and normalize data.
 
+        See :meth:`_iter_clean_rows` for value interning.
+
         Args:
             data: Raw data
 
@@ -139,13 +549,69 @@ class BaseReader(ABC):
         """
         if not data:
             return []
+        return list(self._iter_clean_rows(data))
 
-        cleaned_data = []
-        for row in data:
-            cleaned_row = [clean_cell_value(cell) for cell in row]
-            cleaned_data.append(cleaned_row)
+    def _iter_clean_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[List[str]]:
+        """
+        Clean rows one at a time.
+
+        Cleaned values are interned per column, so repeated values (e.g. a
+        "Status" column) share one string object, and repeated raw strings
+        are cleaned only once. Columns whose first ``INTERN_SAMPLE_ROWS``
+        values are mostly distinct are not interned, and a column whose pool
+        grows past ``INTERN_MAX_POOL_SIZE`` entries stops being interned, so
+        the pools stay bounded on long files. The resulting dedup ratio
+        (cells per distinct string object) is logged at DEBUG level once the
+        rows are exhausted.
 
-        return cleaned_data
+        Args:
+            rows: Raw rows
+
+        Yields:
+            List[str]: Cleaned rows
+        """
+        # Per column: raw or cleaned string -> shared cleaned string
+        pools: List[Optional[Dict[str, str]]] = []
+        cells = 0
+        created = 0
+        for row_number, row in enumerate(rows, 1):
+            if len(row) > len(pools):
+                pools.extend({} for _ in range(len(row) - len(pools)))
+
+            cleaned_row = []
+            for column, cell in enumerate(row):
+                pool = pools[column]
+                if pool is None:
+                    value = clean_cell_value(cell)
+                    created += 1
+                elif type(cell) is str and cell in pool:
+                    value = pool[cell]
+                else:
+                    value = clean_cell_value(cell)
+                    interned = pool.setdefault(value, value)
+                    if interned is value:
+                        created += 1
+                    value = interned
+                    if type(cell) is str:
+                        pool[cell] = value
+                    if len(pool) > INTERN_MAX_POOL_SIZE:
+                        pools[column] = None
+                cleaned_row.append(value)
+            cells += len(row)
+            yield cleaned_row
+
+            if row_number == INTERN_SAMPLE_ROWS:
+                limit = INTERN_MAX_DISTINCT_RATIO * row_number
+                pools = [
+                    None if pool is None or len(pool) > limit else pool
+                    for pool in pools
+                ]
+
+        if cells:
+            logger.debug(
+                f"Interned {cells} cells into {created} distinct values "
+                f"(dedup ratio {cells / max(created, 1):.1f})"
+            )
 
     def _validate_data(self, data: List[List[str]]) -> None:
         """
@@ -0,0 +1,137 @@
+"""
+CSV record counting from raw bytes with a quote-aware newline scan.
+"""
+
+from typing import Optional, Protocol, Tuple
+
+# Bytes scanned at a time when counting records
+_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+class ByteSource(Protocol):
+    """Seekable binary input: a file opened in binary mode or a mapped file."""
+
+    def read(self, __size: int = -1) -> bytes: ...
+
+    def seek(self, __offset: int, __whence: int = 0) -> int: ...
+
+
+def count_newlines(
+    block: bytes, quotechar: Optional[bytes], newline: bytes, inside: bool
+) -> Tuple[int, bool]:
+    """
+    Count the newlines of a block that are not inside a quoted field.
+
+    Splitting the block at quote characters alternates between text outside
+    and inside quotes, so only every other part is counted; doubled quotes
+    inside a quoted field leave an empty part and keep the parity. Blocks
+    without quote characters are counted with a single ``bytes.count``.
+
+    Args:
+        block: Raw bytes
+        quotechar: Quote character, or None if quotes are literal characters
+        newline: Record terminator byte (``\\n``, or ``\\r`` for old Mac files)
+        inside: Whether the block starts inside a quoted field
+
+    Returns:
+        Tuple[int, bool]: Newlines outside quotes, and whether the block ends
+        inside a quoted field
+    """
+    if quotechar is None or quotechar not in block:
+        return (0 if inside else block.count(newline)), inside
+    parts = block.split(quotechar)
+    count = sum(part.count(newline) for part in parts[1 if inside else 0 :: 2])
+    return count, inside != bool((len(parts) - 1) % 2)
+
+
+def count_records(
+    file: ByteSource,
+    quotechar: Optional[bytes],
+    newline: bytes = b"\n",
+    block_size: Optional[int] = None,
+) -> int:
+    """
+    Count the records of a CSV file without decoding it.
+
+    A record ends at a newline outside quoted fields; a last record without
+    a trailing newline is counted too. Blank lines count as (empty) records,
+    like the records of ``csv.reader``. The encoding must be ASCII-compatible
+    and quotes escaped by doubling (see :func:`~.csv_parallel.can_split`).
+
+    Args:
+        file: File opened in binary mode, or a mapped file
+        quotechar: Quote character, or None if quotes are literal characters
+        newline: Record terminator byte
+        block_size: Bytes scanned at a time
+
+    Returns:
+        int: Number of records
+    """
+    block_size = block_size or _BLOCK_SIZE
+    records = 0
+    inside = False
+    last = b""
+    while True:
+        block = file.read(block_size)
+        if not block:
+            break
+        count, inside = count_newlines(block, quotechar, newline, inside)
+        records += count
+        last = block[-1:]
+    if last and (inside or last != newline):
+        records += 1
+    return records
+
+
+def estimate_records(
+    file: ByteSource,
+    size: int,
+    quotechar: Optional[bytes],
+    newline: bytes,
+    segments: int,
+    segment_size: int,
+) -> int:
+    """
+    Estimate the number of records of a CSV file from sampled segments.
+
+    The first segment is counted exactly, as it starts outside quotes. The
+    others are spread evenly over the file and start at an unknown quote
+    parity: of the two possible counts (newlines outside or inside quotes),
+    the one whose bytes per record is closer to the first segment's is
+    used. The estimate is the file size divided by the average bytes per
+    record of all segments.
+
+    Args:
+        file: File opened in binary mode, or a mapped file
+        size: File size in bytes
+        quotechar: Quote character, or None if quotes are literal characters
+        newline: Record terminator byte
+        segments: Number of segments read
+        segment_size: Bytes per segment
+
+    Returns:
+        int: Estimated number of records
+    """
+    file.seek(0)
+    head = file.read(segment_size)
+    records, _ = count_newlines(head, quotechar, newline, False)
+    sampled = len(head)
+    head_length = len(head) / records if records else None
+
+    step = (size - segment_size) // max(segments - 1, 1)
+    for index in range(1, segments):
+        file.seek(index * step)
+        block = file.read(segment_size)
+        count, _ = count_newlines(block, quotechar, newline, False)
+        if head_length is not None:
+            other = block.count(newline) - count
+            if other and (
+                not count
+                or abs(len(block) / other - head_length)
+                < abs(len(block) / count - head_length)
+            ):
+                count = other
+        records += count
+        sampled += len(block)
+
+    return max(round(size * records / sampled), 1)
@@ -0,0 +1,221 @@
+"""
+Parallel CSV parsing of byte ranges aligned to record boundaries.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
+import codecs
+import csv
+import io
+import logging
+import os
+
+from .decoding import FallbackDecoder
+from ..config import CSV_ENCODINGS, CSV_PARALLEL_CHUNK_MB
+
+logger = logging.getLogger(__name__)
+
+# Dialect attributes passed to csv.reader in the workers
+DIALECT_ATTRIBUTES = (
+    "delimiter",
+    "quotechar",
+    "escapechar",
+    "doublequote",
+    "skipinitialspace",
+    "quoting",
+    "strict",
+)
+
+# Bytes read at a time when looking for a record boundary
+_SCAN_SIZE = 64 * 1024
+
+
+def dialect_params(dialect: Any) -> Dict[str, Any]:
+    """
+    Get the csv.reader parameters of a dialect as a picklable dict.
+
+    ``csv.Sniffer`` reports ``doublequote=False`` whenever the sample has no
+    doubled quotes; without an ``escapechar`` a quote inside a quoted field
+    can then only be a doubled quote, so ``doublequote`` is set back to True.
+
+    Args:
+        dialect: Dialect class or instance
+
+    Returns:
+        Dict[str, Any]: Format parameters
+    """
+    params = {
+        name: getattr(dialect, name)
+        for name in DIALECT_ATTRIBUTES
+        if hasattr(dialect, name)
+    }
+    if not params.get("escapechar"):
+        params["doublequote"] = True
+    return params
+
+
+def can_split(encoding: str, fmtparams: Dict[str, Any]) -> bool:
+    """
+    Check whether record boundaries can be found in the raw bytes.
+
+    Newlines and quote characters must be single ASCII bytes that cannot
+    occur inside other characters, and quoted fields must escape quotes by
+    doubling them, so that quote parity tells whether a newline is inside a
+    quoted field.
+
+    Args:
+        encoding: File encoding
+        fmtparams: csv.reader format parameters
+
+    Returns:
+        bool: True if the file can be split into byte ranges
+    """
+    try:
+        name = codecs.lookup(encoding).name
+        newline = "\n".encode(encoding)
+        quote = fmtparams.get("quotechar", '"').encode(encoding)
+    except (AttributeError, LookupError, UnicodeEncodeError):
+        return False
+    return (
+        not name.startswith(("utf-16", "utf-32"))
+        and newline == b"\n"
+        and len(quote) == 1
+        and quote < b"\x80"
+        and not fmtparams.get("escapechar")
+        and fmtparams.get("doublequote", True)
+    )
+
+
+def iter_byte_ranges(
+    file: BinaryIO, size: int, chunk_size: int, quotechar: Optional[bytes]
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on record boundaries.
+
+    Each range ends after the first newline, ``chunk_size`` bytes or more
+    into the range, that is not inside a quoted field. A range starts
+    outside quotes, so a newline is outside quotes when the number of quote
+    characters between the start of the range and the newline is even;
+    doubled quotes inside quoted fields do not change the parity. The file
+    is scanned once, one range ahead of the parsing.
+
+    Args:
+        file: File opened in binary mode
+        size: File size in bytes
+        chunk_size: Approximate range size in bytes
+        quotechar: Quote character, or None if quotes are literal characters
+
+    Yields:
+        Tuple[int, int]: Start and end offset of each range
+    """
+
+    def count(data: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        if quotechar is None:
+            return 0
+        return data.count(quotechar, start, len(data) if end is None else end)
+
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        file.seek(start)
+        quotes = count(file.read(end - start))
+        while end < size:
+            block = file.read(_SCAN_SIZE)
+            if not block:
+                end = size
+                break
+            position = 0
+            newline = block.find(b"\n")
+            while newline != -1:
+                quotes += count(block, position, newline)
+                if not quotes % 2:
+                    break
+                position = newline + 1
+                newline = block.find(b"\n", position)
+            if newline != -1:
+                end += newline + 1
+                break
+            quotes += count(block, position)
+            end += len(block)
+        yield start, end
+        start = end
+
+
+def parse_byte_range(
+    file_path: str, start: int, end: int, encoding: str, fmtparams: Dict[str, Any]
+) -> List[List[str]]:
+    """
+    Parse the records of one byte range of a CSV file.
+
+    Runs in a worker process. The range is decoded on its own, switching
+    to a fallback encoding where it cannot be decoded (see
+    :class:`FallbackDecoder`).
+
+    Args:
+        file_path: Path to the CSV file
+        start: Offset of the first byte of the range
+        end: Offset after the last byte of the range
+        encoding: File encoding
+        fmtparams: csv.reader format parameters
+
+    Returns:
+        List[List[str]]: Records of the range
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    text = FallbackDecoder(encoding, CSV_ENCODINGS).decode(data, final=True)
+    return list(csv.reader(io.StringIO(text, newline=""), **fmtparams))
+
+
+def iter_records_parallel(
+    file_path: str,
+    encoding: str,
+    fmtparams: Dict[str, Any],
+    jobs: int,
+    chunk_mb: Optional[float] = None,
+) -> Iterator[List[str]]:
+    """
+    Parse a CSV file in worker processes, yielding records in file order.
+
+    Byte ranges are handed to the workers as the boundary scan finds them.
+    At most two ranges per worker are in flight, so memory stays bounded and
+    closing the iterator early (e.g. at ``max_rows``) cancels the ranges not
+    yet started.
+
+    Args:
+        file_path: Path to the CSV file
+        encoding: File encoding, see :func:`can_split`
+        fmtparams: csv.reader format parameters
+        jobs: Number of worker processes
+        chunk_mb: Approximate range size in MB (default: CSV_PARALLEL_CHUNK_MB)
+
+    Yields:
+        List[str]: Raw records
+    """
+    size = os.path.getsize(file_path)
+    chunk_size = int((chunk_mb or CSV_PARALLEL_CHUNK_MB) * 1024 * 1024)
+    quotechar = None
+    if fmtparams.get("quoting") != csv.QUOTE_NONE:
+        quotechar = fmtparams.get("quotechar", '"').encode(encoding)
+    logger.info(
+        f"Parsing {size} bytes in ranges of {chunk_size} bytes with {jobs} workers"
+    )
+
+    pending: Deque["Future[List[List[str]]]"] = deque()
+    with open(file_path, "rb") as file, ProcessPoolExecutor(jobs) as executor:
+        try:
+            for start, end in iter_byte_ranges(file, size, chunk_size, quotechar):
+                pending.append(
+                    executor.submit(
+                        parse_byte_range, file_path, start, end, encoding, fmtparams
+                    )
+                )
+                if len(pending) >= 2 * jobs:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
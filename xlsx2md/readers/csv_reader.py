@@ -2,20 +2,61 @@
 CSV file reader implementation.
 """
 
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import csv
-from typing import List, Optional, Union
+import io
+import itertools
 import logging
+import os
 
 from .base import BaseReader
-from ..utils import detect_csv_encoding
-from ..config import ERROR_MESSAGES, CSV_ENCODINGS
+from .csv_metadata import count_records, estimate_records
+from .csv_parallel import can_split, dialect_params, iter_records_parallel
+from .decoding import FallbackDecoder, iter_line_blocks
+from .mapped_file import map_file
+from .projection import ColumnProjection, ColumnSpec
+from .sampling import RowSampler
+from ..utils import detect_csv_encoding, parse_cell_range
+from ..config import (
+    CSV_APPROX_SEGMENT_KB,
+    CSV_APPROX_SEGMENTS,
+    CSV_ENCODINGS,
+    CSV_PARALLEL_MIN_MB,
+    ERROR_MESSAGES,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bytes read for the dialect and column count of get_file_info
+_INFO_HEAD_SIZE = 64 * 1024
+
 
 class CSVReader(BaseReader):
     """Reader for CSV files."""
 
+    def __init__(self, jobs: int = 1):
+        """
+        Initialize CSV reader.
+
+        Args:
+            jobs: Worker processes parsing files of at least
+                ``CSV_PARALLEL_MIN_MB`` (1 parses in this process)
+        """
+        super().__init__()
+        self.jobs = jobs
+
     def read(
         self,
         file_path: str,
@@ -23,6 +64,9 @@ class CSVReader(BaseReader):
         cell_range: Optional[str] = None,
         encoding: Optional[str] = None,
         max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> List[List[str]]:
         """
         Read data from CSV file.
@@ -33,6 +77,10 @@ class CSVReader(BaseReader):
             cell_range: Cell range in A1:B10 format
             encoding: File encoding (auto-detected if not specified)
             max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
 
         Returns:
             List[List[str]]: Data as list of rows
@@ -41,26 +89,14 @@ class CSVReader(BaseReader):
             FileNotFoundError: If file doesn't exist
             ValueError: If invalid parameters or encoding issues
         """
-        try:
+        with self._read_errors(file_path):
             logger.info(f"Reading CSV file: {file_path}")
 
-            # Determine encoding
-            if encoding is None:
-                encoding = detect_csv_encoding(file_path)
-                logger.info(f"Auto-detected encoding: {encoding}")
-            else:
-                logger.info(f"Using specified encoding: {encoding}")
-
-            # Read data
-            data = self._read_csv_data(file_path, encoding, max_rows)
-
-            # Apply cell range if specified
-            if cell_range:
-                data = self._apply_cell_range(data, cell_range)
-
-            # Clean and normalize data
-            data = self._clean_data(data)
-            data = self._normalize_data(data)
+            sampler = RowSampler(sample, seed) if sample else None
+            rows = self._iter_csv_rows(
+                file_path, cell_range, encoding, max_rows, columns, sampler
+            )
+            data = self._normalize_data(list(rows))
 
             # Validate data
             self._validate_data(data)
@@ -68,6 +104,57 @@ class CSVReader(BaseReader):
             logger.info(f"Successfully read {len(data)} rows from CSV file")
             return data
 
+    def iter_rows(
+        self,
+        file_path: str,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        encoding: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+    ) -> Iterator[List[str]]:
+        """
+        Iterate over the cleaned rows of a CSV file in bounded memory.
+
+        Records are parsed, projected and cleaned one at a time, so only the
+        current row is held regardless of file size. Rows are not padded to
+        a common width. The file is opened on the first ``next()`` and closed
+        when the iterator is exhausted or closed.
+
+        Args:
+            file_path: Path to the CSV file
+            sheet_name_or_index: Not used for CSV files
+            cell_range: Cell range in A1:B10 format
+            encoding: File encoding (auto-detected if not specified)
+            max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+
+        Yields:
+            List[str]: Cleaned rows
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If invalid parameters or encoding issues
+        """
+        with self._read_errors(file_path):
+            yield from self._iter_csv_rows(
+                file_path, cell_range, encoding, max_rows, columns
+            )
+
+    @contextmanager
+    def _read_errors(self, file_path: str) -> Iterator[None]:
+        """
+        Translate errors raised while reading a CSV file.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: For encoding and any other reading errors
+        """
+        try:
+            yield
         except FileNotFoundError:
             raise FileNotFoundError(
                 ERROR_MESSAGES["file_not_found"].format(file_path=file_path)
@@ -79,86 +166,159 @@ class CSVReader(BaseReader):
             logger.error(f"Error reading CSV file {file_path}: {e}")
             raise ValueError(f"Failed to read CSV file: {e}")
 
-    def _read_csv_data(
-        self, file_path: str, encoding: str, max_rows: Optional[int] = None
-    ) -> List[List[str]]:
+    def _iter_csv_rows(
+        self,
+        file_path: str,
+        cell_range: Optional[str] = None,
+        encoding: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> Iterator[List[str]]:
         """
-        Read data from CSV file.
+        Build the row pipeline of a CSV file.
+
+        Rows are projected while parsing unless a range has to be cut out of
+        the full rows first; a range counts non-empty records only.
 
         Args:
             file_path: Path to the CSV file
-            encoding: File encoding
+            cell_range: Cell range in A1:B10 format
+            encoding: File encoding (auto-detected if not specified)
             max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sampler: Row sampler; the sample is produced once all rows have
+                been offered to it
 
-        Returns:
-            List[List[str]]: Raw data from CSV file
+        Yields:
+            List[str]: Cleaned rows
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(file_path)
+
+        # Determine encoding
+        if encoding is None:
+            encoding = detect_csv_encoding(file_path)
+            logger.info(f"Auto-detected encoding: {encoding}")
+        else:
+            logger.info(f"Using specified encoding: {encoding}")
+
+        projection = ColumnProjection(columns) if columns else None
+        records = self._iter_csv_records(file_path, encoding)
+        if cell_range:
+            rows = self._iter_cell_range(
+                self._iter_collected_rows(records, max_rows), cell_range
+            )
+            if projection is not None:
+                try:
+                    (_, offset), _ = parse_cell_range(cell_range)
+                except ValueError:
+                    # The whole file is kept
+                    offset = 0
+                rows = self._iter_collected_rows(
+                    rows, skip_empty=False, projection=projection, offset=offset
+                )
+        else:
+            rows = self._iter_collected_rows(records, max_rows, projection=projection)
+
+        if sampler is not None:
+            rows = iter(self._collect_rows(rows, sampler=sampler))
+        yield from self._iter_clean_rows(rows)
+
+    def _iter_csv_records(
+        self, file_path: str, encoding: str, **fmtparams: Any
+    ) -> Iterator[List[str]]:
         """
-        data = []
+        Parse records of a CSV file in a single pass over its bytes.
 
-        try:
-            with open(file_path, "r", encoding=encoding, newline="") as csvfile:
-                # Try to detect delimiter
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
+        The file is read in ``CSV_READ_CHUNK_KB`` chunks and decoded
+        incrementally. If a byte cannot be decoded with ``encoding``, decoding
+        switches at that byte to the first alternative in ``CSV_ENCODINGS``
+        that can decode the rest of the chunk (see :class:`FallbackDecoder`),
+        so the file is never re-read.
 
-                # Use csv.Sniffer to detect dialect
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                    logger.info(
-                        f"Detected CSV dialect: delimiter='{dialect.delimiter}', "
-                        f"quotechar='{dialect.quotechar}'"
-                    )
-                except csv.Error:
-                    # Fallback to default dialect
-                    dialect = csv.excel
-                    logger.info("Using default CSV dialect")
-
-                # Read CSV
-                reader = csv.reader(csvfile, dialect=dialect)
-
-                row_count = 0
-                for row in reader:
-                    if max_rows and row_count >= max_rows:
-                        break
-
-                    # Skip empty rows
-                    if any(cell.strip() for cell in row):
-                        data.append(row)
-
-                    row_count += 1
-
-        except UnicodeDecodeError:
-            # Try alternative encodings
-            for alt_encoding in CSV_ENCODINGS:
-                if alt_encoding == encoding:
-                    continue
+        With ``jobs`` > 1, large files are split into byte ranges parsed by
+        worker processes instead (see :func:`iter_records_parallel`).
 
-                try:
-                    logger.info(f"Trying alternative encoding: {alt_encoding}")
-                    with open(
-                        file_path, "r", encoding=alt_encoding, newline=""
-                    ) as csvfile:
-                        reader = csv.reader(csvfile)
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding
+            **fmtparams: Delimiter and quoting parameters of ``csv.reader``;
+                the dialect is sniffed from the first 1024 characters if none
+                are given
 
-                        row_count = 0
-                        for row in reader:
-                            if max_rows and row_count >= max_rows:
-                                break
+        Yields:
+            List[str]: Raw records
+        """
+        with open(file_path, "rb") as file:
+            decoder = FallbackDecoder(encoding, CSV_ENCODINGS)
+            blocks = iter_line_blocks(file, decoder)
+            first = next(blocks, io.StringIO())
+            sample = first.read(1024)
+            first.seek(0)
+            if not fmtparams:
+                fmtparams = dialect_params(self._sniff_dialect(sample))
+
+            if self._use_workers(file_path, encoding, fmtparams):
+                blocks.close()
+                yield from iter_records_parallel(
+                    file_path, encoding, fmtparams, self.jobs
+                )
+                return
+
+            lines = itertools.chain(first, itertools.chain.from_iterable(blocks))
+            yield from csv.reader(lines, **fmtparams)
+
+        if decoder.encoding != encoding:
+            logger.info(f"Finished reading with encoding: {decoder.encoding}")
+
+    def _use_workers(
+        self, file_path: str, encoding: str, fmtparams: Dict[str, Any]
+    ) -> bool:
+        """
+        Check whether a CSV file is parsed by worker processes.
 
-                            if any(cell.strip() for cell in row):
-                                data.append(row)
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding
+            fmtparams: csv.reader format parameters
 
-                            row_count += 1
+        Returns:
+            bool: True for large files that can be split into byte ranges
+        """
+        if self.jobs <= 1:
+            return False
+        if os.path.getsize(file_path) < CSV_PARALLEL_MIN_MB * 1024 * 1024:
+            logger.info("CSV file is small, parsing it serially")
+            return False
+        if not can_split(encoding, fmtparams):
+            logger.info(
+                f"Cannot split {encoding} CSV with this dialect, parsing serially"
+            )
+            return False
+        return True
 
-                    logger.info(f"Successfully read with encoding: {alt_encoding}")
-                    break
+    def _sniff_dialect(self, sample: str) -> Type[csv.Dialect]:
+        """
+        Detect the dialect of a CSV file from its first characters.
 
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise ValueError("Failed to read CSV file with any supported encoding")
+        Args:
+            sample: Start of the file
 
-        return data
+        Returns:
+            Type[csv.Dialect]: Detected dialect, or ``csv.excel``
+        """
+        try:
+            dialect = csv.Sniffer().sniff(sample)
+            logger.info(
+                f"Detected CSV dialect: delimiter='{dialect.delimiter}', "
+                f"quotechar='{dialect.quotechar}'"
+            )
+            return dialect
+        except csv.Error:
+            # Fallback to default dialect
+            logger.info("Using default CSV dialect")
+            return csv.excel
 
     def read_with_delimiter(
         self,
@@ -191,20 +351,10 @@ class CSVReader(BaseReader):
             if encoding is None:
                 encoding = detect_csv_encoding(file_path)
 
-            data = []
-
-            with open(file_path, "r", encoding=encoding, newline="") as csvfile:
-                reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
-
-                row_count = 0
-                for row in reader:
-                    if max_rows and row_count >= max_rows:
-                        break
-
-                    if any(cell.strip() for cell in row):
-                        data.append(row)
-
-                    row_count += 1
+            records = self._iter_csv_records(
+                file_path, encoding, delimiter=delimiter, quotechar=quotechar
+            )
+            data = self._collect_rows(records, max_rows)
 
             # Clean and normalize data
             data = self._clean_data(data)
@@ -241,42 +391,97 @@ class CSVReader(BaseReader):
             logger.warning(f"Failed to detect delimiter: {e}")
             return ","
 
-    def get_file_info(self, file_path: str, encoding: Optional[str] = None) -> dict:
+    def get_workbook_info(self, file_path: str) -> List[dict]:
         """
-        Get information about CSV file.
+        Get row and column counts of the CSV file in one pass.
+
+        Rows are counted the way :meth:`read` keeps them (empty records are
+        skipped); the column count is the width of the widest record.
 
         Args:
             file_path: Path to the CSV file
-            encoding: File encoding
 
         Returns:
-            dict: File information
+            List[dict]: Single entry describing the file as one sheet
+        """
+        encoding = detect_csv_encoding(file_path)
+        nrows = ncols = 0
+        for row in self._iter_csv_records(file_path, encoding):
+            if any(cell.strip() for cell in row):
+                nrows += 1
+                ncols = max(ncols, len(row))
+
+        return [self._make_sheet_info(0, Path(file_path).name, nrows, ncols)]
+
+    def get_file_info(
+        self, file_path: str, encoding: Optional[str] = None, approx: bool = False
+    ) -> dict:
+        """
+        Get the metadata of a CSV file without parsing it.
+
+        The dialect and column count come from the first 64 KB. Records are
+        counted on a memory map of the raw bytes by a quote-aware newline
+        scan (see :func:`count_records`), so newlines inside quoted fields do
+        not start a record and the file is never decoded. Files that cannot
+        be scanned as bytes (UTF-16/32, dialects with an ``escapechar``) are
+        parsed instead.
+
+        Args:
+            file_path: Path to the CSV file
+            encoding: File encoding (auto-detected if not specified)
+            approx: Estimate the record count from ``CSV_APPROX_SEGMENTS``
+                sampled segments instead of scanning the whole file
+
+        Returns:
+            dict: ``encoding``, ``delimiter``, ``quotechar``,
+            ``lineterminator``, ``size`` (bytes), ``ncols`` (widest record of
+            the first 64 KB), ``row_count`` and ``record_count`` (both the
+            records, including the header and blank lines) and ``exact``
+            (False for an estimate); empty if the file cannot be read
         """
         try:
             if encoding is None:
                 encoding = detect_csv_encoding(file_path)
 
-            with open(file_path, "r", encoding=encoding) as csvfile:
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-
-                # Count rows
-                row_count = sum(1 for _ in csvfile)
+            size = os.path.getsize(file_path)
+            with open(file_path, "rb") as file:
+                head = file.read(_INFO_HEAD_SIZE)
+            text = FallbackDecoder(encoding, CSV_ENCODINGS).decode(
+                head, final=len(head) == size
+            )
+            fmtparams = dialect_params(self._sniff_dialect(text[:1024]))
+            if len(head) < size:
+                # Keep complete lines only
+                text = text[: max(text.rfind("\n"), text.rfind("\r")) + 1]
+            records = csv.reader(io.StringIO(text, newline=""), **fmtparams)
+            ncols = max((len(record) for record in records), default=0)
+
+            if "\n" in text:
+                lineterminator = "\r\n" if "\r\n" in text else "\n"
+            else:
+                lineterminator = "\r" if "\r" in text else "\n"
 
-                # Detect dialect
-                try:
-                    dialect = csv.Sniffer().sniff(sample)
-                    delimiter = dialect.delimiter
-                    quotechar = dialect.quotechar
-                except csv.Error:
-                    delimiter = ","
-                    quotechar = '"'
+            exact = True
+            if can_split(encoding, fmtparams):
+                row_count, exact = self._count_records(
+                    file_path, size, fmtparams, lineterminator[-1].encode(), approx
+                )
+            else:
+                logger.info(f"Cannot scan {encoding} CSV as bytes, parsing it")
+                row_count = sum(
+                    1 for _ in self._iter_csv_records(file_path, encoding, **fmtparams)
+                )
 
             info = {
                 "encoding": encoding,
-                "delimiter": delimiter,
-                "quotechar": quotechar,
+                "delimiter": fmtparams["delimiter"],
+                "quotechar": fmtparams["quotechar"],
+                "lineterminator": lineterminator,
+                "size": size,
+                "ncols": ncols,
                 "row_count": row_count,
+                "record_count": row_count,
+                "exact": exact,
             }
 
             return info
@@ -284,3 +489,40 @@ class CSVReader(BaseReader):
         except Exception as e:
             logger.error(f"Error getting CSV file info from {file_path}: {e}")
             return {}
+
+    def _count_records(
+        self,
+        file_path: str,
+        size: int,
+        fmtparams: Dict[str, Any],
+        newline: bytes,
+        approx: bool,
+    ) -> Tuple[int, bool]:
+        """
+        Count or estimate the records of a CSV file from its raw bytes.
+
+        Args:
+            file_path: Path to the CSV file
+            size: File size in bytes
+            fmtparams: csv.reader format parameters
+            newline: Record terminator byte
+            approx: Estimate the count from sampled segments
+
+        Returns:
+            Tuple[int, bool]: Record count, and whether it is exact
+        """
+        quotechar = None
+        if fmtparams.get("quoting") != csv.QUOTE_NONE:
+            quotechar = fmtparams.get("quotechar", '"').encode("ascii")
+        segment_size = CSV_APPROX_SEGMENT_KB * 1024
+        approx = approx and size > CSV_APPROX_SEGMENTS * segment_size
+
+        mapped = map_file(file_path)
+        with mapped or open(file_path, "rb") as file:
+            if approx:
+                count = estimate_records(
+                    file, size, quotechar, newline, CSV_APPROX_SEGMENTS, segment_size
+                )
+                logger.info(f"Estimated {count} records of {file_path}")
+                return count, False
+            return count_records(file, quotechar, newline), True
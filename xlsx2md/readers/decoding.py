@@ -0,0 +1,127 @@
+"""
+Single-pass decoding of CSV bytes with a codec switch on decode errors.
+"""
+
+from typing import BinaryIO, Generator, Optional, Sequence
+import codecs
+import io
+import logging
+
+from ..config import CSV_READ_CHUNK_KB
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackDecoder:
+    """
+    Incremental decoder that switches codec where decoding fails.
+
+    Text before the first undecodable byte keeps the original encoding; from
+    that byte on, the first fallback encoding that can decode the rest of the
+    current chunk is used. The file is therefore read once, however late the
+    error occurs, instead of being re-read once per candidate encoding.
+    """
+
+    def __init__(self, encoding: str, fallbacks: Sequence[str] = ()):
+        """
+        Initialize decoder.
+
+        Args:
+            encoding: Encoding to start with
+            fallbacks: Encodings tried in order after a decode error
+        """
+        self.encoding = encoding
+        self._fallbacks = list(fallbacks)
+        self._tried = {codecs.lookup(encoding).name}
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._offset = 0
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        """
+        Decode the next chunk of bytes.
+
+        Args:
+            data: Bytes following the previous chunk
+            final: Whether this is the last chunk
+
+        Returns:
+            str: Decoded text
+
+        Raises:
+            UnicodeDecodeError: If no fallback encoding can decode the data
+        """
+        parts = []
+        while True:
+            try:
+                parts.append(self._decoder.decode(data, final))
+                self._offset += len(data)
+                return "".join(parts)
+            except UnicodeDecodeError as e:
+                # e.object is the decoder's buffered bytes followed by data;
+                # the buffer is unchanged, so only the rest of the good
+                # prefix is passed to finish it
+                buffered = len(e.object) - len(data)
+                if e.start > buffered:
+                    good = e.object[buffered : e.start]
+                    parts.append(self._decoder.decode(good, True))
+                data = e.object[e.start :]
+                self._offset += e.start - buffered
+                self._switch(data, final, e)
+
+    def _switch(self, data: bytes, final: bool, error: UnicodeDecodeError) -> None:
+        """Switch to the first fallback encoding that decodes data."""
+        for encoding in self._fallbacks:
+            name = codecs.lookup(encoding).name
+            if name in self._tried:
+                continue
+            self._tried.add(name)
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(data, final)
+            except UnicodeDecodeError:
+                continue
+
+            logger.warning(
+                f"Cannot decode byte {self._offset} as {self.encoding}, "
+                f"switching to {encoding}"
+            )
+            self.encoding = encoding
+            self._decoder = codecs.getincrementaldecoder(encoding)()
+            return
+        raise error
+
+
+def iter_line_blocks(
+    file: BinaryIO, decoder: FallbackDecoder, chunk_kb: Optional[int] = None
+) -> Generator[io.StringIO, None, None]:
+    """
+    Read a binary file once and yield its decoded lines in blocks.
+
+    Each block is a text stream of complete lines. Iterating it yields the
+    lines with their line endings, split like the lines of a file opened
+    with ``newline=""``, so the blocks can be chained into ``csv.reader``.
+
+    Args:
+        file: File opened in binary mode
+        decoder: Decoder of the file's bytes
+        chunk_kb: Bytes read at a time, in KB (default: CSV_READ_CHUNK_KB)
+
+    Yields:
+        io.StringIO: Lines decoded from one chunk
+    """
+    chunk_size = (chunk_kb or CSV_READ_CHUNK_KB) * 1024
+    pending = ""
+    while True:
+        chunk = file.read(chunk_size)
+        final = not chunk
+        text = pending + decoder.decode(chunk, final)
+        if final:
+            end = len(text)
+        else:
+            # A trailing \r may be the first half of \r\n
+            limit = len(text) - 1 if text.endswith("\r") else len(text)
+            end = max(text.rfind("\n", 0, limit), text.rfind("\r", 0, limit)) + 1
+        pending = text[end:]
+        if end:
+            yield io.StringIO(text[:end], newline="")
+        if final:
+            return
@@ -0,0 +1,196 @@
+"""
+Memory-mapped access to workbook files.
+"""
+
+from typing import Any, Dict, Optional
+import logging
+import mmap
+import os
+import tempfile
+
+from ..config import USE_MMAP
+
+logger = logging.getLogger(__name__)
+
+
+class MappedFile:
+    """
+    Read-only memory map of a file with a seekable file-like interface.
+
+    Used as the file object of ``zipfile.ZipFile`` so that zip members are
+    read straight from the page cache instead of through a buffered file.
+    The mapping is shared: worker processes mapping the same file use the
+    same physical pages.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Map file into memory.
+
+        Args:
+            file_path: Path to the file
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is empty
+        """
+        with open(file_path, "rb") as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = file_path
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the mapping has been closed."""
+        return self.mapping.closed
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read bytes from the current position.
+
+        Args:
+            size: Number of bytes to read (-1 for the rest of the file)
+
+        Returns:
+            bytes: Data read
+        """
+        start = self._position
+        end = len(self.mapping) if size is None or size < 0 else start + size
+        data = self.mapping[start:end]
+        self._position = start + len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Move the current position.
+
+        Args:
+            offset: Offset relative to ``whence``
+            whence: os.SEEK_SET, os.SEEK_CUR or os.SEEK_END
+
+        Returns:
+            int: New position
+
+        Raises:
+            ValueError: If the resulting position is negative
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self.mapping)
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.mapping.close()
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def map_file(file_path: str) -> Optional[MappedFile]:
+    """
+    Map file into memory if possible.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Optional[MappedFile]: Mapped file, or None if mapping is disabled or
+        the file cannot be mapped (missing or empty files, pipes); callers
+        then open the file by path
+    """
+    if not USE_MMAP:
+        return None
+    try:
+        return MappedFile(file_path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Not memory-mapping {file_path}: {e}")
+        return None
+
+
+def xlrd_source(file_path: str) -> Dict[str, Any]:
+    """
+    Build the xlrd arguments that select the input file.
+
+    xlrd reads ``file_contents`` by slicing it like bytes, so the mapping
+    itself is passed (xlrd closes it in ``release_resources``).
+
+    Args:
+        file_path: Path to the XLS file
+
+    Returns:
+        Dict[str, Any]: ``file_contents`` with the mapping, or ``filename``
+    """
+    mapped = map_file(file_path)
+    if mapped is None:
+        return {"filename": file_path}
+    return {"file_contents": mapped.mapping}
+
+
+def extract_workbook_stream(file_path: str) -> Optional[str]:
+    """
+    Copy a fragmented XLS workbook stream into a file of its own.
+
+    The BIFF workbook stream of an XLS (OLE2 compound) file may be scattered
+    over non-contiguous sectors; xlrd then assembles a private copy of the
+    whole stream in every process that opens the file. Writing the assembled
+    stream once to a temporary ``.xls`` file, which xlrd reads as a raw BIFF
+    stream, lets worker processes map one shared copy instead.
+
+    Args:
+        file_path: Path to the XLS file
+
+    Returns:
+        Optional[str]: Path of the temporary stream file (to be deleted by
+        the caller), or None if the stream is already contiguous in the file
+        or the file cannot be mapped or parsed
+    """
+    from xlrd import compdoc
+
+    mapped = map_file(file_path)
+    if mapped is None:
+        return None
+    try:
+        if mapped.mapping[:8] != compdoc.SIGNATURE:
+            return None
+        with open(os.devnull, "w") as logfile:
+            document = compdoc.CompDoc(mapped.mapping, logfile=logfile)
+            for name in ("Workbook", "Book"):
+                stream, base, size = document.locate_named_stream(name)
+                if stream:
+                    break
+            else:
+                return None
+        if stream is mapped.mapping:
+            return None
+
+        fd, stream_path = tempfile.mkstemp(prefix="xlsx2md-", suffix=".xls")
+        with os.fdopen(fd, "wb") as file:
+            file.write(stream[base : base + size])
+        logger.info(f"Copied fragmented workbook stream ({size} bytes) to share")
+        return stream_path
+    except Exception as e:
+        logger.debug(f"Not sharing workbook stream of {file_path}: {e}")
+        return None
+    finally:
+        mapped.close()
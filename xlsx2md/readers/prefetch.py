@@ -0,0 +1,116 @@
+"""
+Read-ahead of package parts on a background thread.
+"""
+
+from queue import Empty, Full, Queue
+from typing import Any, BinaryIO, Optional, Union
+import logging
+import threading
+
+from ..config import PIPELINE_QUEUE_CHUNKS
+
+logger = logging.getLogger(__name__)
+
+# How often a blocked producer checks whether the consumer has gone away
+_PUT_TIMEOUT = 0.1
+
+
+class PrefetchStream:
+    """
+    Binary stream whose chunks are read by a producer thread.
+
+    Reading a zip member inflates it; zlib releases the GIL while doing so,
+    which lets decompression of the next chunks overlap with parsing of the
+    current one. At most ``queue_chunks`` chunks are buffered, so a producer
+    that runs ahead blocks until the consumer catches up.
+
+    ``read()`` returns whole chunks as produced (of at most ``chunk_size``
+    bytes) and ``b""`` at the end of the stream.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        chunk_size: int,
+        queue_chunks: int = PIPELINE_QUEUE_CHUNKS,
+    ):
+        """
+        Start reading the stream in the background.
+
+        Args:
+            stream: Source stream, owned and closed by the prefetcher
+            chunk_size: Bytes requested from the source per read
+            queue_chunks: Maximum number of chunks read ahead
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._queue: "Queue[Union[bytes, Exception]]" = Queue(
+            maxsize=max(1, queue_chunks)
+        )
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._produce, name="xlsx2md-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self) -> None:
+        """Read chunks into the queue until end of stream or close()."""
+        try:
+            while not self._stop.is_set():
+                chunk = self._stream.read(self._chunk_size)
+                if not self._put(chunk) or not chunk:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item: Union[bytes, Exception]) -> bool:
+        """Queue an item, giving up if the consumer closed the stream."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Return the next chunk.
+
+        Args:
+            size: Ignored; chunks have the size given to the constructor
+
+        Returns:
+            bytes: Next chunk, or ``b""`` at the end of the stream
+
+        Raises:
+            Exception: Error raised while reading the source stream
+        """
+        if self._done:
+            return b""
+        item = self._queue.get()
+        if isinstance(item, Exception):
+            self._done = True
+            raise item
+        if not item:
+            self._done = True
+        return item
+
+    def close(self) -> None:
+        """Stop the producer thread and close the source stream."""
+        self._stop.set()
+        # Unblock a producer waiting for free space
+        try:
+            while True:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+        self._thread.join()
+        self._stream.close()
+
+    def __enter__(self) -> "PrefetchStream":
+        return self
+
+    def __exit__(self, *exc_info: Optional[Any]) -> None:
+        self.close()
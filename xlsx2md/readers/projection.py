@@ -0,0 +1,137 @@
+"""
+Column projection applied by readers while rows are parsed.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+import logging
+import re
+
+from ..utils import clean_cell_value, column_to_index, normalize_sheet_name
+from ..config import ERROR_MESSAGES
+
+logger = logging.getLogger(__name__)
+
+_COLUMN_LETTERS = re.compile(r"^[A-Z]{1,3}$")
+
+ColumnSpec = Union[str, int]
+
+
+class ColumnProjection:
+    """
+    Selection of output columns by letter, index or header name.
+
+    0-based indices (``2``) refer to sheet columns (``0`` is column A) and
+    are known before reading, so readers can skip the other columns while
+    parsing. Strings are resolved against the first non-empty row, using the
+    same case-insensitive matching as sheet names; a string that matches no
+    header but looks like a column letter (``"C"``) selects that sheet
+    column, so headers such as ``"ID"`` or ``"SKU"`` stay selectable by
+    name. Columns are returned in the requested order.
+    """
+
+    def __init__(self, columns: Sequence[ColumnSpec]):
+        """
+        Initialize projection.
+
+        Args:
+            columns: Column letters, 0-based indices or header names
+
+        Raises:
+            ValueError: If no columns are given or an index is negative
+        """
+        if not columns:
+            raise ValueError(ERROR_MESSAGES["invalid_columns"].format(columns=""))
+
+        self.columns = list(columns)
+        # Sheet columns known before reading (indices only)
+        self._indexes: List[Optional[int]] = []
+        # Sheet columns of strings that look like letters, used when no
+        # header matches
+        self._letters: List[Optional[int]] = []
+        for column in self.columns:
+            if isinstance(column, int):
+                if column < 0:
+                    raise ValueError(
+                        ERROR_MESSAGES["invalid_columns"].format(columns=column)
+                    )
+                self._indexes.append(column)
+                self._letters.append(None)
+            else:
+                self._indexes.append(None)
+                self._letters.append(
+                    column_to_index(column) if _COLUMN_LETTERS.match(column) else None
+                )
+
+        self.positions: Optional[List[int]] = None
+
+    @property
+    def needs_header(self) -> bool:
+        """Whether some columns are selected by header name."""
+        return any(index is None for index in self._indexes)
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int]]:
+        """
+        First and last selected sheet column (0-based).
+
+        Returns:
+            Optional[Tuple[int, int]]: Bounds, or None if strings are used
+        """
+        if self.needs_header:
+            return None
+        indexes = [index for index in self._indexes if index is not None]
+        return min(indexes), max(indexes)
+
+    @property
+    def resolved(self) -> bool:
+        """Whether row positions are known."""
+        return self.positions is not None
+
+    def resolve(self, header: Sequence[Any] = (), offset: int = 0) -> None:
+        """
+        Compute row positions of the selected columns.
+
+        Args:
+            header: First non-empty row (used for header names)
+            offset: Sheet column of the first value in each row
+
+        Raises:
+            ValueError: If a string matches neither a header name nor a column
+                of the header row, or an index lies left of the first column
+                read
+        """
+        names = [normalize_sheet_name(clean_cell_value(cell)) for cell in header]
+        positions = []
+        for column, index, letter in zip(self.columns, self._indexes, self._letters):
+            if index is None:
+                name = normalize_sheet_name(str(column))
+                if name in names:
+                    positions.append(names.index(name))
+                elif letter is not None and offset <= letter < offset + len(names):
+                    positions.append(letter - offset)
+                else:
+                    raise ValueError(
+                        ERROR_MESSAGES["column_not_found"].format(column=column)
+                    )
+            elif index < offset:
+                raise ValueError(
+                    ERROR_MESSAGES["column_not_found"].format(column=column)
+                )
+            else:
+                positions.append(index - offset)
+        self.positions = positions
+        logger.info(f"Projecting columns {self.columns} to positions {positions}")
+
+    def project(self, row: Sequence[Any]) -> List[Any]:
+        """
+        Select the projected values of a row.
+
+        Args:
+            row: Row values
+
+        Returns:
+            List[Any]: Values of the selected columns (None past the row end)
+        """
+        assert self.positions is not None
+        size = len(row)
+        return [row[i] if i < size else None for i in self.positions]
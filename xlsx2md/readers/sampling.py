@@ -0,0 +1,79 @@
+"""
+Uniform row sampling applied by readers while rows are streamed.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+import logging
+import random
+
+from ..config import ERROR_MESSAGES
+
+logger = logging.getLogger(__name__)
+
+
+class RowSampler:
+    """
+    Header plus a uniform random sample of the following rows.
+
+    The first row offered is kept as the header. Of the remaining rows,
+    ``size`` are kept by reservoir sampling (Algorithm R), so memory stays
+    O(size) however long the sheet is. Sampled rows are returned in their
+    original order.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        """
+        Initialize sampler.
+
+        Args:
+            size: Number of data rows to keep
+            seed: Random seed for a reproducible sample
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size < 1:
+            raise ValueError(ERROR_MESSAGES["invalid_sample"].format(size=size))
+
+        self.size = size
+        self.seed = seed
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget offered rows and restart the random sequence."""
+        self.header: Optional[List[Any]] = None
+        self.seen = 0
+        self._random = random.Random(self.seed)
+        self._reservoir: List[Tuple[int, List[Any]]] = []
+
+    def add(self, row: Sequence[Any]) -> None:
+        """
+        Offer the next non-empty row.
+
+        Args:
+            row: Row values (copied only if the row is kept)
+        """
+        if self.header is None:
+            self.header = list(row)
+            return
+
+        self.seen += 1
+        if len(self._reservoir) < self.size:
+            self._reservoir.append((self.seen, list(row)))
+            return
+
+        slot = self._random.randrange(self.seen)
+        if slot < self.size:
+            self._reservoir[slot] = (self.seen, list(row))
+
+    def rows(self) -> List[List[Any]]:
+        """
+        Get the header and the sampled rows in original order.
+
+        Returns:
+            List[List[Any]]: Sampled rows
+        """
+        if self.header is None:
+            return []
+        logger.info(f"Sampled {len(self._reservoir)} of {self.seen} rows")
+        return [self.header] + [row for _, row in sorted(self._reservoir)]
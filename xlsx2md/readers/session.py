@@ -0,0 +1,99 @@
+"""
+Workbook sessions for reading several sheets from one opened file.
+"""
+
+from typing import Any, List, Optional, Sequence, Union
+import logging
+
+from .base import BaseReader
+from .projection import ColumnSpec
+
+logger = logging.getLogger(__name__)
+
+
+class WorkbookSession:
+    """
+    Workbook opened once and shared by all sheet reads.
+
+    Reading sheets through a session avoids reopening the file (unzipping,
+    parsing shared strings and styles, decoding BIFF globals) for every sheet.
+    Use it as a context manager or call :meth:`close` when done.
+
+    Examples:
+        >>> with open_workbook("data.xlsx") as session:
+        ...     for name in session.sheet_names:
+        ...         data = session.read(name)
+    """
+
+    def __init__(self, file_path: str, reader: BaseReader):
+        """
+        Open workbook with the given reader.
+
+        Args:
+            file_path: Path to the workbook file
+            reader: Reader instance matching the file type
+
+        Raises:
+            ValueError: If the reader does not support multiple sheets
+        """
+        self.file_path = file_path
+        self.reader = reader
+        self.workbook: Any = reader.open_workbook(file_path)
+        self._sheet_names: Optional[List[str]] = None
+        logger.info(f"Opened workbook session: {file_path}")
+
+    def __enter__(self) -> "WorkbookSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """List of sheet names in workbook order."""
+        if self._sheet_names is None:
+            self._sheet_names = self.reader.get_workbook_sheet_names(self.workbook)
+        return self._sheet_names
+
+    def read(
+        self,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Read one sheet of the workbook.
+
+        Args:
+            sheet_name_or_index: Sheet name or index (default: first/active sheet)
+            cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
+
+        Returns:
+            List[List[str]]: Data as list of rows
+
+        Raises:
+            ValueError: If sheet not found or invalid parameters
+        """
+        return self.reader.read_sheet(
+            self.workbook,
+            sheet_name_or_index,
+            cell_range,
+            max_rows,
+            columns,
+            sample,
+            seed,
+        )
+
+    def close(self) -> None:
+        """Close the workbook and release its resources."""
+        if self.workbook is not None:
+            self.reader.close_workbook(self.workbook)
+            self.workbook = None
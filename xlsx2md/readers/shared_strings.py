@@ -0,0 +1,205 @@
+"""
+Lazy shared strings table for large XLSX files.
+"""
+
+import re
+import tempfile
+from array import array
+from collections import OrderedDict
+from typing import Any, List, Optional
+from xml.parsers import expat
+from xml.sax.saxutils import unescape
+import logging
+
+from ..config import SHARED_STRINGS_CACHE_SIZE, SHARED_STRINGS_SPOOL_MB
+
+logger = logging.getLogger(__name__)
+
+INDEX_CHUNK_SIZE = 64 * 1024  # Bytes decompressed per indexing step
+
+# <si><t>plain text</t></si> with optional namespace prefix and attributes
+_SIMPLE_ITEM = re.compile(
+    rb"\s*<(?:\w+:)?si>\s*<(?:\w+:)?t(?:\s[^>]*)?>([^<]*)</(?:\w+:)?t>\s*"
+    rb"</(?:\w+:)?si>\s*"
+)
+_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}
+
+
+def _local_name(name: str) -> str:
+    """Strip namespace prefix from an element name."""
+    return name.rpartition(":")[2]
+
+
+def _parse_item(data: bytes) -> str:
+    """
+    Get plain text of a single ``<si>`` fragment.
+
+    Plain items are decoded with a regular expression; rich text and items
+    with character references go through expat.
+
+    Args:
+        data: Raw bytes of the ``<si>`` element
+
+    Returns:
+        str: Text of the string item
+    """
+    match = _SIMPLE_ITEM.fullmatch(data)
+    if match is not None and b"&#" not in match.group(1):
+        text = unescape(match.group(1).decode("utf-8"), _XML_ENTITIES)
+        return text.replace("x005F_", "")
+
+    snippets: List[str] = []
+    # depth inside <rPh>, collecting text
+    state = [0, False]
+
+    def start(name: str, attrs: Any) -> None:
+        local = _local_name(name)
+        if local == "rPh":
+            state[0] += 1
+        elif local == "t" and not state[0]:
+            state[1] = True
+
+    def end(name: str) -> None:
+        local = _local_name(name)
+        if local == "rPh":
+            state[0] -= 1
+        elif local == "t":
+            state[1] = False
+
+    def characters(text: str) -> None:
+        if state[1]:
+            snippets.append(text)
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    parser.Parse(b"<root>" + data + b"</root>", True)
+    return "".join(snippets).replace("x005F_", "")
+
+
+class SharedStringTable:
+    """
+    Shared strings indexed by byte offsets instead of materialized strings.
+
+    The ``sharedStrings.xml`` part is decompressed into a spooled temporary
+    buffer only as far as the highest index requested so far, while a packed
+    array records where each ``<si>`` item starts. Strings are decoded on
+    access and the most recently used ones are kept in an LRU cache.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        cache_size: int = SHARED_STRINGS_CACHE_SIZE,
+        spool_mb: int = SHARED_STRINGS_SPOOL_MB,
+    ):
+        """
+        Initialize table over a shared strings part.
+
+        Args:
+            stream: Binary stream of the shared strings part
+            cache_size: Number of decoded strings kept in memory
+            spool_mb: Buffer size kept in memory before spilling to disk
+        """
+        self._stream: Optional[Any] = stream
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=spool_mb * 1024 * 1024)
+        self._offsets = array("q")
+        self._items_end: Optional[int] = None
+        self._size = 0
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._cache_size = cache_size
+
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+
+    def _start_element(self, name: str, attrs: Any) -> None:
+        if _local_name(name) == "si":
+            self._offsets.append(self._parser.CurrentByteIndex)
+
+    def _end_element(self, name: str) -> None:
+        if _local_name(name) == "sst":
+            self._items_end = self._parser.CurrentByteIndex
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole part has been indexed."""
+        return self._stream is None
+
+    def _index_more(self) -> bool:
+        """
+        Decompress and index the next chunk of the part.
+
+        Returns:
+            bool: False when the part is exhausted
+        """
+        if self._stream is None:
+            return False
+
+        chunk = self._stream.read(INDEX_CHUNK_SIZE)
+        self._buffer.seek(0, 2)
+        self._buffer.write(chunk)
+        self._size += len(chunk)
+        self._parser.Parse(chunk, not chunk)
+        if not chunk:
+            self._stream.close()
+            self._stream = None
+            if self._items_end is None:
+                self._items_end = self._size
+            return False
+        return True
+
+    def _ensure_indexed(self, count: int) -> None:
+        """Index until at least ``count`` item offsets are known."""
+        while len(self._offsets) < count and self._index_more():
+            pass
+
+    def __len__(self) -> int:
+        """Number of string items (indexes the whole part)."""
+        while self._index_more():
+            pass
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Get string by index, decoding it on first access.
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        cache = self._cache
+        text = cache.get(index)
+        if text is not None:
+            cache.move_to_end(index)
+            return text
+
+        if index < 0:
+            raise IndexError("Shared string index out of range")
+
+        # The next item's offset (or the end of the part) bounds this item
+        self._ensure_indexed(index + 2)
+        offsets = self._offsets
+        if index >= len(offsets):
+            raise IndexError("Shared string index out of range")
+        start = offsets[index]
+        if index + 1 < len(offsets):
+            stop = offsets[index + 1]
+        else:
+            stop = self._items_end if self._items_end is not None else self._size
+
+        self._buffer.seek(start)
+        text = _parse_item(self._buffer.read(stop - start))
+
+        cache[index] = text
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return text
+
+    def close(self) -> None:
+        """Release the part stream and the spooled buffer."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._buffer.close()
+        self._cache.clear()
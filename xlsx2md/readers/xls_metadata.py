@@ -0,0 +1,176 @@
+"""
+Workbook metadata read from the BIFF globals stream of XLS files.
+"""
+
+from struct import unpack
+from typing import Any, List, NamedTuple, Optional, Tuple
+import logging
+import os
+
+from xlrd.biffh import (
+    XL_BOUNDSHEET,
+    XL_CODEPAGE,
+    XL_DIMENSION,
+    XL_EOF,
+    XL_FILEPASS,
+    XL_WORKBOOK_GLOBALS,
+    XL_WORKSHEET,
+)
+from xlrd.book import Book
+
+from .mapped_file import xlrd_source
+
+logger = logging.getLogger(__name__)
+
+# Sheet visibility byte of BOUNDSHEET records, named like XLSX sheet states
+SHEET_STATES = {0: "visible", 1: "hidden", 2: "veryHidden"}
+
+# BIFF versions with a BOUNDSHEET record per sheet in the globals substream
+_BOUNDSHEET_BIFF_VERSIONS = (50, 70, 80)
+
+# Cell records (NUMBER, LABEL, RK, LABELSST, MULRK, BLANK, MULBLANK, FORMULA,
+# BOOLERR); DIMENSIONS always precedes them
+_CELL_RECORDS = frozenset(
+    (0x0203, 0x0204, 0x027E, 0x00FD, 0x00BD, 0x0201, 0x00BE, 0x0006, 0x0205)
+)
+
+
+class XLSSheetEntry(NamedTuple):
+    """Worksheet entry of an XLS workbook."""
+
+    name: str
+    state: str
+
+
+def _load_globals(book: Book, file_path: str, logfile: Any) -> None:
+    """
+    Open workbook stream and read the sheet directory from the globals.
+
+    Only BOUNDSHEET, CODEPAGE and FILEPASS records are decoded; reading
+    stops at the EOF record of the globals substream.
+
+    Args:
+        book: Empty xlrd book
+        file_path: Path to the XLS file
+        logfile: File receiving xlrd diagnostics
+
+    Raises:
+        ValueError: If the file has no BOUNDSHEET records (BIFF 2-4)
+    """
+    book.biff2_8_load(logfile=logfile, **xlrd_source(file_path))
+    biff_version = book.getbof(XL_WORKBOOK_GLOBALS)
+    if biff_version not in _BOUNDSHEET_BIFF_VERSIONS:
+        raise ValueError(f"No sheet directory in BIFF version {biff_version}")
+    book.biff_version = biff_version
+
+    # Record header: 2-byte code and 2-byte length
+    end = book.base + book.stream_len
+    while book._position + 4 <= end:
+        code, _, data = book.get_record_parts()
+        if code == XL_BOUNDSHEET:
+            book.handle_boundsheet(data)
+        elif code == XL_CODEPAGE:
+            book.handle_codepage(data)
+        elif code == XL_FILEPASS:
+            book.handle_filepass(data)
+        elif code == XL_EOF:
+            break
+
+
+def _sheet_entries(book: Book) -> List[XLSSheetEntry]:
+    """Worksheet entries collected from the BOUNDSHEET records."""
+    return [
+        XLSSheetEntry(name, SHEET_STATES.get(visibility, "visible"))
+        for name, visibility in zip(book._sheet_names, book._sheet_visibility)
+    ]
+
+
+def _read_dimension(book: Book, position: int) -> Optional[Tuple[int, int]]:
+    """
+    Read the DIMENSIONS record at the start of a worksheet substream.
+
+    Args:
+        book: Book with loaded globals
+        position: Absolute position of the worksheet BOF record
+
+    Returns:
+        Optional[Tuple[int, int]]: (nrows, ncols), or None if the record is
+        missing
+    """
+    book._position = position
+    book.getbof(XL_WORKSHEET)
+
+    end = book.base + book.stream_len
+    while book._position + 4 <= end:
+        code, length, data = book.get_record_parts()
+        if code == XL_DIMENSION and length:
+            # Last row and last column are stored as "index + 1"
+            if book.biff_version < 80:
+                nrows, ncols = unpack("<HxxH", data[2:8])
+            else:
+                nrows, ncols = unpack("<ixxH", data[4:12])
+            return nrows, ncols
+        if code == XL_EOF or code in _CELL_RECORDS:
+            break
+    return None
+
+
+def read_sheet_entries(file_path: str) -> List[XLSSheetEntry]:
+    """
+    Read worksheet names and visibility without loading the workbook.
+
+    Only the records needed for sheet names are decoded: BOUNDSHEET records
+    and the CODEPAGE record used for pre-BIFF8 names. Shared strings,
+    formats, styles and the worksheets themselves are skipped.
+
+    Args:
+        file_path: Path to the XLS file
+
+    Returns:
+        List[XLSSheetEntry]: Worksheets in workbook order
+
+    Raises:
+        ValueError: If the file has no BOUNDSHEET records (BIFF 2-4)
+        xlrd.XLRDError: If the file is not a readable XLS workbook
+    """
+    book = Book()
+    try:
+        # xlrd reports warnings to its log file, not through logging
+        with open(os.devnull, "w") as devnull:
+            _load_globals(book, file_path, devnull)
+    finally:
+        book.release_resources()
+
+    return _sheet_entries(book)
+
+
+def read_sheet_dimensions(
+    file_path: str,
+) -> List[Tuple[XLSSheetEntry, Optional[Tuple[int, int]]]]:
+    """
+    Read row and column counts of all worksheets in one pass.
+
+    For every worksheet only the records up to its DIMENSIONS record are
+    read; cell records are never decoded.
+
+    Args:
+        file_path: Path to the XLS file
+
+    Returns:
+        List[Tuple[XLSSheetEntry, Optional[Tuple[int, int]]]]: Worksheets in
+        workbook order with (nrows, ncols), None where the record is missing
+
+    Raises:
+        ValueError: If the file has no BOUNDSHEET records (BIFF 2-4)
+        xlrd.XLRDError: If the file is not a readable XLS workbook
+    """
+    book = Book()
+    try:
+        # xlrd reports warnings to its log file, not through logging
+        with open(os.devnull, "w") as devnull:
+            _load_globals(book, file_path, devnull)
+            dimensions = [_read_dimension(book, posn) for posn in book._sh_abs_posn]
+    finally:
+        book.release_resources()
+
+    return list(zip(_sheet_entries(book), dimensions))
@@ -2,21 +2,141 @@
 XLS file reader implementation.
 """
 
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import functools
 import logging
+import weakref
 
 import xlrd
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH, from_excel
 
-from .base import BaseReader
+from .base import BaseReader, UsedRange
+from .mapped_file import xlrd_source
+from .projection import ColumnProjection, ColumnSpec
+from .sampling import RowSampler
+from .xls_metadata import SHEET_STATES, read_sheet_dimensions, read_sheet_entries
 
+from ..utils import parse_cell_range
 from ..config import ERROR_MESSAGES
 
 logger = logging.getLogger(__name__)
 
 
+def _number(value: float) -> Any:
+    """Return integer-valued floats as int, as openpyxl does for XLSX."""
+    return int(value) if value.is_integer() else value
+
+
+def _error(code: int) -> str:
+    return str(xlrd.error_text_from_code.get(code, "#ERR!"))
+
+
+@functools.lru_cache(maxsize=None)
+def _cell_converters(datemode: int) -> Tuple[Optional[Callable[[Any], Any]], ...]:
+    """
+    Build value converters indexed by xlrd cell type (``XL_CELL_*``).
+
+    xlrd already resolves each cell's XF index to a cell type through its
+    cached XF-to-type map, so date-formatted numbers arrive as
+    ``XL_CELL_DATE`` and converting a cell is a single tuple lookup. Values
+    are converted to what openpyxl returns for the same XLSX cell; text and
+    blank cells (None entries) are kept as they are.
+
+    Args:
+        datemode: Workbook date mode (0 for 1900-based, 1 for 1904-based)
+
+    Returns:
+        Tuple[Optional[Callable[[Any], Any]], ...]: Converter for each cell
+        type, None if values of the type need no conversion
+    """
+    epoch = CALENDAR_MAC_1904 if datemode else WINDOWS_EPOCH
+
+    def date(value: float) -> Any:
+        try:
+            return from_excel(value, epoch)
+        except (OverflowError, ValueError):
+            logger.warning(
+                f"Cell is marked as a date but the serial value {value} "
+                "is outside the limits for dates"
+            )
+            return "#VALUE!"
+
+    converters = {
+        xlrd.XL_CELL_EMPTY: None,
+        xlrd.XL_CELL_TEXT: None,
+        xlrd.XL_CELL_NUMBER: _number,
+        xlrd.XL_CELL_DATE: date,
+        xlrd.XL_CELL_BOOLEAN: bool,
+        xlrd.XL_CELL_ERROR: _error,
+        xlrd.XL_CELL_BLANK: None,
+    }
+    return tuple(converters[cell_type] for cell_type in range(len(converters)))
+
+
+def _row_values(
+    sheet, row_num: int, start: int, end: int, convert: Sequence[Optional[Callable]]
+) -> List[Any]:
+    """
+    Copy columns [start, end) of a row as typed values.
+
+    Args:
+        sheet: XLRD sheet object
+        row_num: Row index (0-based)
+        start: First column (0-based)
+        end: Column after the last one
+        convert: Converters from :func:`_cell_converters`
+
+    Returns:
+        List[Any]: Cell values
+    """
+    values: List[Any] = sheet.row_values(row_num, start, end)
+    for column, cell_type in enumerate(sheet.row_types(row_num, start, end)):
+        converter = convert[cell_type]
+        if converter is not None:
+            values[column] = converter(values[column])
+    return values
+
+
+def _used_row_values(
+    sheet, row_num: int, ncols: int, convert: Sequence[Optional[Callable]]
+) -> List[Any]:
+    """
+    Copy the first ncols values of a row without its trailing blank cells.
+
+    xlrd stores empty and blank cells as "", so the trailing ones are cut
+    off with plain comparisons while the row slice is taken; a row without
+    values comes back empty.
+
+    Args:
+        sheet: XLRD sheet object
+        row_num: Row index (0-based)
+        ncols: Number of columns to copy
+        convert: Converters from :func:`_cell_converters`
+
+    Returns:
+        List[Any]: Cell values up to the last non-blank cell
+    """
+    values = _row_values(sheet, row_num, 0, ncols, convert)
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    del values[end:]
+    return values
+
+
 class XLSReader(BaseReader):
     """Reader for XLS files."""
 
+    def __init__(self):
+        """Initialize XLS reader."""
+        super().__init__()
+        # Used ranges keyed by workbook, then sheet index: sheets of on-demand
+        # workbooks are unloaded after each read, so a reloaded sheet is a new
+        # object and cannot be the key
+        self._sheet_used_ranges: (
+            "weakref.WeakKeyDictionary[Any, Dict[int, UsedRange]]"
+        ) = weakref.WeakKeyDictionary()
+
     def read(
         self,
         file_path: str,
@@ -24,6 +144,9 @@ class XLSReader(BaseReader):
         cell_range: Optional[str] = None,
         encoding: Optional[str] = None,
         max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> List[List[str]]:
         """
         Read data from XLS file.
@@ -34,6 +157,10 @@ class XLSReader(BaseReader):
             cell_range: Cell range in A1:B10 format
             encoding: Not used for XLS files
             max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
 
         Returns:
             List[List[str]]: Data as list of rows
@@ -45,26 +172,19 @@ class XLSReader(BaseReader):
         try:
             logger.info(f"Reading XLS file: {file_path}")
 
-            # Open workbook
-            workbook = xlrd.open_workbook(file_path)
-
-            # Get sheet
-            if sheet_name_or_index is None:
-                sheet = workbook.sheet_by_index(0)
-                logger.info(f"Using first sheet: {sheet.name}")
-            else:
-                sheet = self._get_sheet(workbook, sheet_name_or_index)
-                logger.info(f"Using sheet: {sheet.name}")
-
-            # Read data
-            data = self._read_sheet_data(sheet, cell_range, max_rows)
-
-            # Clean and normalize data
-            data = self._clean_data(data)
-            data = self._normalize_data(data)
-
-            # Validate data
-            self._validate_data(data)
+            workbook = self.open_workbook(file_path)
+            try:
+                data = self._read_sheet(
+                    workbook,
+                    sheet_name_or_index,
+                    cell_range,
+                    max_rows,
+                    columns,
+                    sample,
+                    seed,
+                )
+            finally:
+                self.close_workbook(workbook)
 
             logger.info(f"Successfully read {len(data)} rows from XLS file")
             return data
@@ -77,6 +197,130 @@ class XLSReader(BaseReader):
             logger.error(f"Error reading XLS file {file_path}: {e}")
             raise ValueError(f"Failed to read XLS file: {e}")
 
+    def open_workbook(self, file_path: str):
+        """
+        Open workbook for reading cell values.
+
+        The workbook is opened on demand: only the globals (sheet list,
+        shared strings, formats) are decoded here and each sheet is decoded
+        when it is read.
+
+        Args:
+            file_path: Path to the XLS file
+
+        Returns:
+            XLRD workbook object
+        """
+        return xlrd.open_workbook(on_demand=True, **xlrd_source(file_path))
+
+    def close_workbook(self, workbook) -> None:
+        """
+        Release resources of a workbook opened with open_workbook.
+
+        Args:
+            workbook: XLRD workbook object
+        """
+        workbook.release_resources()
+
+    def get_workbook_sheet_names(self, workbook) -> List[str]:
+        """
+        Get sheet names of an opened workbook.
+
+        Args:
+            workbook: XLRD workbook object
+
+        Returns:
+            List[str]: List of sheet names
+        """
+        return list(workbook.sheet_names())
+
+    def read_sheet(
+        self,
+        workbook,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Read one sheet of an opened workbook.
+
+        Args:
+            workbook: Workbook returned by open_workbook
+            sheet_name_or_index: Sheet name or index (default: first sheet)
+            cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
+
+        Returns:
+            List[List[str]]: Data as list of rows
+
+        Raises:
+            ValueError: If sheet not found or invalid parameters
+        """
+        try:
+            return self._read_sheet(
+                workbook,
+                sheet_name_or_index,
+                cell_range,
+                max_rows,
+                columns,
+                sample,
+                seed,
+            )
+        except Exception as e:
+            logger.error(f"Error reading XLS sheet {sheet_name_or_index}: {e}")
+            raise ValueError(f"Failed to read XLS file: {e}")
+
+    def _read_sheet(
+        self,
+        workbook,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Read, clean and validate one sheet of an opened workbook.
+
+        The sheet is unloaded once its values have been read, so that reading
+        all sheets of a workbook only ever holds one decoded sheet.
+        """
+        # Get sheet
+        if sheet_name_or_index is None:
+            sheet = workbook.sheet_by_index(0)
+            logger.info(f"Using first sheet: {sheet.name}")
+        else:
+            sheet = self._get_sheet(workbook, sheet_name_or_index)
+            logger.info(f"Using sheet: {sheet.name}")
+
+        # Read data
+        projection = ColumnProjection(columns) if columns else None
+        sampler = RowSampler(sample, seed) if sample else None
+        try:
+            data = self._read_sheet_data(
+                sheet, cell_range, max_rows, projection, sampler
+            )
+        finally:
+            if workbook.on_demand:
+                workbook.unload_sheet(sheet.number)
+
+        # Clean and normalize data
+        data = self._clean_data(data)
+        data = self._normalize_data(data)
+
+        # Validate data
+        self._validate_data(data)
+
+        return data
+
     def _get_sheet(self, workbook, sheet_name_or_index: Union[str, int]):
         """
         Get sheet by name or index.
@@ -102,8 +346,8 @@ class XLSReader(BaseReader):
             return workbook.sheet_by_name(sheet_name_or_index)
         except xlrd.biffh.XLRDError:
             # Try case-insensitive search
-            for i in range(workbook.nsheets):
-                if workbook.sheet_name(i).lower() == sheet_name_or_index.lower():
+            for i, name in enumerate(workbook.sheet_names()):
+                if name.lower() == sheet_name_or_index.lower():
                     return workbook.sheet_by_index(i)
 
             raise ValueError(
@@ -111,7 +355,12 @@ class XLSReader(BaseReader):
             )
 
     def _read_sheet_data(
-        self, sheet, cell_range: Optional[str] = None, max_rows: Optional[int] = None
+        self,
+        sheet,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
     ) -> List[List[str]]:
         """
         Read data from worksheet.
@@ -120,83 +369,161 @@ class XLSReader(BaseReader):
             sheet: XLRD sheet object
             cell_range: Cell range in A1:B10 format
             max_rows: Maximum number of rows to read
+            projection: Columns to keep
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: Raw data from sheet
         """
         # Determine range to read
         if cell_range:
-            data = self._read_cell_range(sheet, cell_range)
+            data = self._read_cell_range(
+                sheet, cell_range, max_rows, projection, sampler
+            )
         else:
-            data = self._read_all_data(sheet, max_rows)
+            data = self._read_all_data(sheet, max_rows, projection, sampler)
 
         return data
 
-    def _read_cell_range(self, sheet, cell_range: str) -> List[List[str]]:
+    def _read_cell_range(
+        self,
+        sheet,
+        cell_range: str,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> List[List[str]]:
         """
         Read data from specific cell range.
 
         Args:
             sheet: XLRD sheet object
             cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of non-empty rows to read
+            projection: Columns to keep (must lie within the range)
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: Data from specified range
-        """
-        try:
-            # Parse range
-            from ..utils import parse_cell_range
-
-            (start_row, start_col), (end_row, end_col) = parse_cell_range(cell_range)
-
-            data = []
-            for row_num in range(start_row, end_row + 1):
-                if row_num < sheet.nrows:
-                    row_data = []
-                    for col_num in range(start_col, end_col + 1):
-                        if col_num < sheet.ncols:
-                            cell_value = sheet.cell_value(row_num, col_num)
-                            row_data.append(cell_value)
-                        else:
-                            row_data.append("")
-                    data.append(row_data)
 
-            return data
-
-        except Exception as e:
-            logger.warning(f"Failed to read cell range {cell_range}: {e}")
-            return self._read_all_data(sheet)
+        Raises:
+            ValueError: If the cell range or column selection is invalid
+        """
+        (start_row, start_col), (end_row, end_col) = parse_cell_range(cell_range)
+        if start_row < 0 or start_col < 0 or end_row < start_row or end_col < start_col:
+            raise ValueError(
+                ERROR_MESSAGES["invalid_range"].format(range_str=cell_range)
+            )
 
-    def _read_all_data(self, sheet, max_rows: Optional[int] = None) -> List[List[str]]:
+        # Narrow the column window to the projected columns
+        if projection is not None and projection.bounds is not None:
+            first, last = projection.bounds
+            if first < start_col or last > end_col:
+                raise ValueError(
+                    ERROR_MESSAGES["column_not_found"].format(
+                        column=", ".join(str(c) for c in projection.columns)
+                    )
+                )
+            start_col, end_col = first, last
+
+        width = end_col - start_col + 1
+        convert = _cell_converters(sheet.book.datemode)
+
+        def rows():
+            # Columns past the end of the sheet are padded with blanks
+            for row_num in range(start_row, min(end_row + 1, sheet.nrows)):
+                values = _row_values(sheet, row_num, start_col, end_col + 1, convert)
+                if len(values) < width:
+                    values.extend([""] * (width - len(values)))
+                yield values
+
+        return self._collect_rows(
+            rows(),
+            max_rows,
+            skip_empty=False,
+            projection=projection,
+            offset=start_col,
+            sampler=sampler,
+        )
+
+    def _read_all_data(
+        self,
+        sheet,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> List[List[str]]:
         """
         Read all data from worksheet.
 
+        Empty rows are skipped and reading stops once ``max_rows`` non-empty
+        rows have been read. Columns selected by letter or index bound the
+        cells that are read.
+
+        Rows are copied with bulk ``row_values`` slices bounded by the used
+        range or the projected columns. Without a projection, trailing blank
+        cells are cut off in the same pass (see :func:`_used_row_values`), so
+        rows hold only the cells up to the last value and empty rows are
+        empty lists. The used range found by a complete read is cached per
+        sheet (by workbook and sheet index, so it survives unloading the sheet)
+        and bounds later reads.
+
         Args:
             sheet: XLRD sheet object
-            max_rows: Maximum number of rows to read
+            max_rows: Maximum number of non-empty rows to read
+            projection: Columns to keep
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: All data from sheet
         """
-        data = []
+        used_range = self._sheet_used_ranges.get(sheet.book, {}).get(sheet.number)
+        nrows = used_range.nrows if used_range else sheet.nrows
+        convert = _cell_converters(sheet.book.datemode)
+
+        if projection is None:
+            ncols = used_range.ncols if used_range else sheet.ncols
+
+            def used_rows():
+                for row_num in range(nrows):
+                    yield _used_row_values(sheet, row_num, ncols, convert)
+
+            data, detected = self._collect_used_rows(used_rows(), max_rows, sampler)
+            if detected is not None:
+                self._sheet_used_ranges.setdefault(sheet.book, {})[
+                    sheet.number
+                ] = detected
+            return data
 
-        # Determine number of rows to read
-        nrows = sheet.nrows
-        if max_rows:
-            nrows = min(nrows, max_rows)
+        bounds = projection.bounds
+        first_col, last_col = bounds if bounds else (0, sheet.ncols - 1)
 
-        # Read data row by row
-        for row_num in range(nrows):
-            row_data = []
-            for col_num in range(sheet.ncols):
-                cell_value = sheet.cell_value(row_num, col_num)
-                row_data.append(cell_value)
+        def rows():
+            for row_num in range(nrows):
+                yield _row_values(sheet, row_num, first_col, last_col + 1, convert)
 
-            # Skip empty rows
-            if any(cell is not None and str(cell).strip() for cell in row_data):
-                data.append(row_data)
+        return self._collect_rows(
+            rows(), max_rows, projection=projection, offset=first_col, sampler=sampler
+        )
 
-        return data
+    def get_sheet_list(self, file_path: str) -> List[dict]:
+        """
+        Get sheet names, order and visibility from BOUNDSHEET records.
+
+        Only the workbook globals are scanned; shared strings, formats and
+        worksheets are not decoded.
+
+        Args:
+            file_path: Path to the XLS file
+
+        Returns:
+            List[dict]: Sheets in workbook order with index, name and state
+            ("visible", "hidden" or "veryHidden")
+        """
+        return [
+            {"index": i, "name": entry.name, "state": entry.state}
+            for i, entry in enumerate(read_sheet_entries(file_path))
+        ]
 
     def get_sheet_names(self, file_path: str) -> List[str]:
         """
@@ -209,12 +536,72 @@ class XLSReader(BaseReader):
             List[str]: List of sheet names
         """
         try:
-            workbook = xlrd.open_workbook(file_path)
-            return [workbook.sheet_name(i) for i in range(workbook.nsheets)]
+            return [sheet["name"] for sheet in self.get_sheet_list(file_path)]
+        except Exception as e:
+            logger.warning(f"Failed to read sheet list from metadata: {e}")
+
+        try:
+            workbook = self.open_workbook(file_path)
+            try:
+                return self.get_workbook_sheet_names(workbook)
+            finally:
+                self.close_workbook(workbook)
         except Exception as e:
             logger.error(f"Error getting sheet names from {file_path}: {e}")
             return []
 
+    def get_workbook_info(self, file_path: str) -> List[dict]:
+        """
+        Get dimensions of every sheet in one pass over the file.
+
+        Row and column counts are taken from each worksheet's DIMENSIONS
+        record. Sheets without one, and BIFF 2-4 files without a sheet
+        directory, are measured by loading them one at a time.
+
+        Args:
+            file_path: Path to the XLS file
+
+        Returns:
+            List[dict]: Sheet information in workbook order
+        """
+        try:
+            sheets = read_sheet_dimensions(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to read sheet dimensions from metadata: {e}")
+            sheets = []
+
+        info = []
+        for index, (entry, dims) in enumerate(sheets):
+            if dims is None:
+                break
+            nrows, ncols = dims
+            info.append(
+                self._make_sheet_info(
+                    index, entry.name, nrows, ncols, state=entry.state
+                )
+            )
+        if sheets and len(info) == len(sheets):
+            return info
+
+        info = []
+        workbook = self.open_workbook(file_path)
+        try:
+            for index in range(workbook.nsheets):
+                sheet = workbook.sheet_by_index(index)
+                info.append(
+                    self._make_sheet_info(
+                        index,
+                        sheet.name,
+                        sheet.nrows,
+                        sheet.ncols,
+                        state=SHEET_STATES.get(sheet.visibility, "visible"),
+                    )
+                )
+                workbook.unload_sheet(index)
+        finally:
+            self.close_workbook(workbook)
+        return info
+
     def get_sheet_info(
         self, file_path: str, sheet_name_or_index: Optional[Union[str, int]] = None
     ) -> dict:
@@ -229,21 +616,22 @@ class XLSReader(BaseReader):
             dict: Sheet information
         """
         try:
-            workbook = xlrd.open_workbook(file_path)
-
-            if sheet_name_or_index is None:
-                sheet = workbook.sheet_by_index(0)
-            else:
-                sheet = self._get_sheet(workbook, sheet_name_or_index)
-
-            info = {
-                "name": sheet.name,
-                "nrows": sheet.nrows,
-                "ncols": sheet.ncols,
-                "dimensions": f"A1:{self._column_letter(sheet.ncols-1)}{sheet.nrows}",
-            }
-
-            return info
+            workbook = self.open_workbook(file_path)
+            try:
+                if sheet_name_or_index is None:
+                    sheet = workbook.sheet_by_index(0)
+                else:
+                    sheet = self._get_sheet(workbook, sheet_name_or_index)
+
+                column = self._column_letter(sheet.ncols - 1)
+                return {
+                    "name": sheet.name,
+                    "nrows": sheet.nrows,
+                    "ncols": sheet.ncols,
+                    "dimensions": f"A1:{column}{sheet.nrows}",
+                }
+            finally:
+                self.close_workbook(workbook)
 
         except Exception as e:
             logger.error(f"Error getting sheet info from {file_path}: {e}")
@@ -0,0 +1,43 @@
+"""
+Native XLSX file reader implementation.
+"""
+
+import logging
+
+from .xlsx_reader import XLSXReader
+from .xlsx_package import XLSXPackage
+
+logger = logging.getLogger(__name__)
+
+
+class NativeXLSXReader(XLSXReader):
+    """
+    Reader for XLSX files that streams worksheet XML directly.
+
+    Produces the same data as :class:`XLSXReader` but bypasses the openpyxl
+    object model: worksheets are parsed incrementally from the zip archive
+    and only plain cell values are built. With ``pipelined=True`` worksheet
+    data is inflated on a background thread while the main thread parses it.
+    """
+
+    def __init__(self, pipelined: bool = False):
+        """
+        Initialize reader.
+
+        Args:
+            pipelined: Inflate and parse worksheets on separate threads
+        """
+        super().__init__()
+        self.pipelined = pipelined
+
+    def open_workbook(self, file_path: str) -> XLSXPackage:
+        """
+        Open XLSX package for streaming.
+
+        Args:
+            file_path: Path to the XLSX file
+
+        Returns:
+            XLSXPackage: Opened package
+        """
+        return XLSXPackage(file_path, pipelined=self.pipelined)
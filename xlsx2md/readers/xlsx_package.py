@@ -0,0 +1,847 @@
+"""
+Direct access to XLSX (Office Open XML) packages without the openpyxl object model.
+
+The classes in this module mimic the small subset of the read-only openpyxl
+workbook API that the readers use (``sheetnames``, ``worksheets``, ``active``,
+``iter_rows``), but they stream worksheet XML straight from the zip archive
+and only ever produce plain cell values.
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import logging
+
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    WINDOWS_EPOCH,
+    from_excel,
+    from_ISO8601,
+)
+
+from .mapped_file import map_file
+from .prefetch import PrefetchStream
+from .shared_strings import SharedStringTable
+from ..utils import column_to_index
+from ..config import SHARED_STRINGS_LAZY_MB
+
+logger = logging.getLogger(__name__)
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+OFFICE_DOCUMENT_REL = REL_NS + "/officeDocument"
+SHARED_STRINGS_REL = REL_NS + "/sharedStrings"
+STYLES_REL = REL_NS + "/styles"
+
+SHEET_TAG = f"{{{SHEET_MAIN_NS}}}sheet"
+WORKBOOK_PR_TAG = f"{{{SHEET_MAIN_NS}}}workbookPr"
+WORKBOOK_VIEW_TAG = f"{{{SHEET_MAIN_NS}}}workbookView"
+SHEET_DATA_TAG = f"{{{SHEET_MAIN_NS}}}sheetData"
+DIMENSION_TAG = f"{{{SHEET_MAIN_NS}}}dimension"
+ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
+VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+INLINE_STRING_TAG = f"{{{SHEET_MAIN_NS}}}is"
+TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+RUN_TAG = f"{{{SHEET_MAIN_NS}}}r"
+PHONETIC_RUN_TAG = f"{{{SHEET_MAIN_NS}}}rPh"
+STRING_ITEM_TAG = f"{{{SHEET_MAIN_NS}}}si"
+NUM_FMT_TAG = f"{{{SHEET_MAIN_NS}}}numFmt"
+CELL_XFS_TAG = f"{{{SHEET_MAIN_NS}}}cellXfs"
+XF_TAG = f"{{{SHEET_MAIN_NS}}}xf"
+RELATIONSHIP_TAG = f"{{{PKG_REL_NS}}}Relationship"
+REL_ID_ATTR = f"{{{REL_NS}}}id"
+
+# Element names as reported by expat (namespace and local name joined by "}")
+_EXPAT_DIMENSION_TAG = DIMENSION_TAG[1:]
+_EXPAT_ROW_TAG = ROW_TAG[1:]
+_EXPAT_CELL_TAG = CELL_TAG[1:]
+_EXPAT_VALUE_TAG = VALUE_TAG[1:]
+_EXPAT_INLINE_STRING_TAG = INLINE_STRING_TAG[1:]
+_EXPAT_TEXT_TAG = TEXT_TAG[1:]
+_EXPAT_PHONETIC_RUN_TAG = PHONETIC_RUN_TAG[1:]
+
+XML_CHUNK_SIZE = 64 * 1024  # Bytes fed to the XML parser at once
+
+_DIGITS = "0123456789"
+
+
+class SheetEntry(NamedTuple):
+    """Sheet as declared in ``xl/workbook.xml``."""
+
+    name: str
+    sheet_id: str
+    rel_id: str
+    state: str
+    path: str
+
+
+def _cast_number(value: str) -> Any:
+    """Convert a numeric cell value to int or float (as openpyxl does)."""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _text_content(node: ET.Element) -> str:
+    """
+    Get plain text of a string item (``<si>`` or ``<is>``).
+
+    Concatenates the plain ``<t>`` element and all rich text runs, ignoring
+    phonetic runs, the same way openpyxl does.
+    """
+    snippets = []
+    plain = node.find(TEXT_TAG)
+    if plain is not None and plain.text:
+        snippets.append(plain.text)
+    for run in node.iterfind(RUN_TAG):
+        text = run.find(TEXT_TAG)
+        if text is not None and text.text:
+            snippets.append(text.text)
+    return "".join(snippets)
+
+
+def _join_part_path(base_part: str, target: str) -> str:
+    """
+    Resolve relationship target against the part that declares it.
+
+    Args:
+        base_part: Part name owning the relationship (e.g. 'xl/workbook.xml')
+        target: Relationship target, relative or absolute
+
+    Returns:
+        str: Zip member name of the target part
+    """
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _rels_path(part: str) -> str:
+    """Get relationships part name for a package part."""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+# Events reported by ET.XMLPullParser
+XMLEvent = Literal["start", "end", "comment", "pi", "start-ns", "end-ns"]
+
+
+def iter_xml_events(stream: Any, events: Sequence[XMLEvent] = ("end",)) -> Iterator:
+    """
+    Incrementally parse XML from a binary stream.
+
+    Args:
+        stream: Binary file-like object
+        events: Parser events to report
+
+    Yields:
+        Tuple[str, Element]: Parser events as produced by XMLPullParser
+    """
+    parser: ET.XMLPullParser[Any] = ET.XMLPullParser(events=events)
+    read = stream.read
+    while True:
+        chunk = read(XML_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+class XLSXPackage:
+    """
+    XLSX workbook opened directly from its zip archive.
+
+    Provides ``sheetnames``, ``worksheets`` and ``active`` like a read-only
+    openpyxl workbook. Shared strings and date styles are parsed on first use.
+    """
+
+    def __init__(self, file_path: str, pipelined: bool = False):
+        """
+        Open XLSX package and read workbook metadata.
+
+        Args:
+            file_path: Path to the XLSX file
+            pipelined: Inflate worksheet data on a background thread while
+                the XML is being parsed
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the file is not a valid XLSX package
+        """
+        self.file_path = file_path
+        self.pipelined = pipelined
+        self._mapped = map_file(file_path)
+        try:
+            self._archive = zipfile.ZipFile(self._mapped or file_path)
+        except zipfile.BadZipFile as e:
+            self._close_mapping()
+            raise ValueError(f"File is not a valid XLSX package: {e}") from e
+        except Exception:
+            self._close_mapping()
+            raise
+
+        try:
+            self.workbook_path = self._find_workbook_path()
+            self._workbook_rels = self._read_relationships(self.workbook_path)
+            self.epoch = WINDOWS_EPOCH
+            self.active_index = 0
+            self.sheets = self._read_workbook()
+        except Exception:
+            self._archive.close()
+            self._close_mapping()
+            raise
+
+        self._shared_strings: Optional[Union[List[str], SharedStringTable]] = None
+        self._date_styles: Optional[Tuple[Set[int], Set[int]]] = None
+        self.worksheets = [XLSXWorksheet(self, entry) for entry in self.sheets]
+
+    def __enter__(self) -> "XLSXPackage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close underlying zip archive and the shared strings table."""
+        if isinstance(self._shared_strings, SharedStringTable):
+            self._shared_strings.close()
+        self._archive.close()
+        self._close_mapping()
+
+    def _close_mapping(self) -> None:
+        """Unmap the file if it was memory-mapped."""
+        if self._mapped is not None:
+            self._mapped.close()
+
+    @property
+    def sheetnames(self) -> List[str]:
+        """List of sheet names in workbook order."""
+        return [entry.name for entry in self.sheets]
+
+    @property
+    def active(self) -> Optional["XLSXWorksheet"]:
+        """Active sheet as stored in the first workbook view."""
+        if 0 <= self.active_index < len(self.worksheets):
+            return self.worksheets[self.active_index]
+        return None
+
+    def open_part(self, part: str) -> Any:
+        """Open package part as a binary stream."""
+        return self._archive.open(part)
+
+    def open_sheet_data(self, part: str) -> Any:
+        """
+        Open worksheet part for streaming into the XML parser.
+
+        Args:
+            part: Worksheet part name
+
+        Returns:
+            Any: Binary stream, read ahead on a thread if the package is
+            pipelined
+        """
+        stream = self.open_part(part)
+        if self.pipelined:
+            return PrefetchStream(stream, XML_CHUNK_SIZE)
+        return stream
+
+    def _part_fingerprint(self, part: Optional[str]) -> str:
+        """CRC32 and uncompressed size of a part from the central directory."""
+        info = self._archive.NameToInfo.get(part) if part else None
+        if info is None:
+            return "-"
+        return f"{info.CRC:08x}:{info.file_size}"
+
+    def sheet_fingerprints(self) -> List[str]:
+        """
+        Fingerprint the content of every sheet without reading any part data.
+
+        A fingerprint combines the sheet name, the CRC32 and size of its
+        worksheet part and of the shared strings and styles parts (all taken
+        from the zip central directory) and the date epoch. It changes
+        whenever the values read from the sheet may have changed.
+
+        Returns:
+            List[str]: Fingerprints in workbook order
+        """
+        shared = ";".join(
+            [
+                self._part_fingerprint(self._find_part(SHARED_STRINGS_REL)),
+                self._part_fingerprint(self._find_part(STYLES_REL)),
+                str(self.epoch.year),
+            ]
+        )
+        return [
+            f"{entry.name};{self._part_fingerprint(entry.path)};{shared}"
+            for entry in self.sheets
+        ]
+
+    def _read_xml(self, part: str) -> ET.Element:
+        """Read and parse a (small) XML part."""
+        return ET.fromstring(self._archive.read(part))
+
+    def _read_relationships(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """
+        Read relationships of a package part.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: Relationship id -> (type, target part)
+        """
+        rels_part = _rels_path(part)
+        if rels_part not in self._archive.NameToInfo:
+            return {}
+
+        rels = {}
+        for rel in self._read_xml(rels_part).iter(RELATIONSHIP_TAG):
+            target = _join_part_path(part, rel.get("Target", ""))
+            rels[rel.get("Id", "")] = (rel.get("Type", ""), target)
+        return rels
+
+    def _find_workbook_path(self) -> str:
+        """Locate main workbook part through the package relationships."""
+        root = self._read_relationships("")
+        for rel_type, target in root.values():
+            if rel_type == OFFICE_DOCUMENT_REL:
+                return target
+        return "xl/workbook.xml"
+
+    def _find_part(self, rel_type: str) -> Optional[str]:
+        """Find workbook-level part by relationship type."""
+        for part_type, target in self._workbook_rels.values():
+            if part_type == rel_type and target in self._archive.NameToInfo:
+                return target
+        return None
+
+    def _read_workbook(self) -> List[SheetEntry]:
+        """Parse ``xl/workbook.xml`` into sheet entries and workbook settings."""
+        root = self._read_xml(self.workbook_path)
+
+        properties = root.find(WORKBOOK_PR_TAG)
+        if properties is not None:
+            if properties.get("date1904", "").lower() in ("1", "true"):
+                self.epoch = CALENDAR_MAC_1904
+
+        view = root.find(f".//{WORKBOOK_VIEW_TAG}")
+        if view is not None:
+            self.active_index = int(view.get("activeTab", 0))
+
+        sheets = []
+        for sheet in root.iter(SHEET_TAG):
+            rel_id = sheet.get(REL_ID_ATTR, "")
+            _, path = self._workbook_rels.get(rel_id, ("", ""))
+            sheets.append(
+                SheetEntry(
+                    name=sheet.get("name", ""),
+                    sheet_id=sheet.get("sheetId", ""),
+                    rel_id=rel_id,
+                    state=sheet.get("state", "visible"),
+                    path=path,
+                )
+            )
+        return sheets
+
+    @property
+    def shared_strings(self) -> Union[List[str], SharedStringTable]:
+        """
+        Shared strings table (loaded on first access).
+
+        Small tables are read into a list; tables larger than
+        SHARED_STRINGS_LAZY_MB are indexed lazily by :class:`SharedStringTable`.
+        """
+        if self._shared_strings is None:
+            part = self._find_part(SHARED_STRINGS_REL)
+            if part is None:
+                self._shared_strings = []
+            elif self._archive.getinfo(part).file_size > (
+                SHARED_STRINGS_LAZY_MB * 1024 * 1024
+            ):
+                logger.info("Indexing shared strings lazily")
+                self._shared_strings = SharedStringTable(self.open_part(part))
+            else:
+                self._shared_strings = self._read_shared_strings(part)
+        return self._shared_strings
+
+    def _read_shared_strings(self, part: str) -> List[str]:
+        """Read all entries of the shared strings part."""
+        strings = []
+        with self.open_part(part) as stream:
+            for _, node in iter_xml_events(stream):
+                if node.tag == STRING_ITEM_TAG:
+                    strings.append(_text_content(node).replace("x005F_", ""))
+                    node.clear()
+        return strings
+
+    @property
+    def date_styles(self) -> Tuple[Set[int], Set[int]]:
+        """Indexes of cell styles that format dates and timedeltas."""
+        if self._date_styles is None:
+            self._date_styles = self._read_date_styles()
+        return self._date_styles
+
+    def _read_date_styles(self) -> Tuple[Set[int], Set[int]]:
+        """Find cell formats (``cellXfs``) that use date or timedelta formats."""
+        date_formats: Set[int] = set()
+        timedelta_formats: Set[int] = set()
+
+        part = self._find_part(STYLES_REL)
+        if part is None:
+            return date_formats, timedelta_formats
+
+        root = self._read_xml(part)
+        custom = {
+            int(fmt.get("numFmtId", -1)): fmt.get("formatCode", "")
+            for fmt in root.iter(NUM_FMT_TAG)
+        }
+        cell_xfs = root.find(CELL_XFS_TAG)
+        if cell_xfs is None:
+            return date_formats, timedelta_formats
+
+        for idx, xf in enumerate(cell_xfs.iterfind(XF_TAG)):
+            num_fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+            if fmt is None:
+                continue
+            if is_date_format(fmt):
+                date_formats.add(idx)
+            if is_timedelta_format(fmt):
+                timedelta_formats.add(idx)
+        return date_formats, timedelta_formats
+
+
+class XLSXWorksheet:
+    """Worksheet of an :class:`XLSXPackage` streamed row by row."""
+
+    def __init__(self, package: XLSXPackage, entry: SheetEntry):
+        self.package = package
+        self.entry = entry
+        self.title = entry.name
+        self.sheet_state = entry.state
+        self._dimensions: Optional[Tuple[int, int, int, int]] = None
+        self._dimensions_read = False
+        self._dimensions_trusted = True
+
+    @property
+    def dimensions_boundaries(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Sheet boundaries from the ``<dimension>`` element, if present.
+
+        Returns:
+            Optional[Tuple[int, int, int, int]]: (min_col, min_row, max_col,
+            max_row), 1-based
+        """
+        if not self._dimensions_read:
+            self._dimensions = self._read_dimensions()
+            self._dimensions_read = True
+        return self._dimensions
+
+    @property
+    def max_row(self) -> Optional[int]:
+        """Last row according to sheet dimensions."""
+        bounds = self.dimensions_boundaries
+        return bounds[3] if bounds else None
+
+    @property
+    def max_column(self) -> Optional[int]:
+        """Last column according to sheet dimensions."""
+        bounds = self.dimensions_boundaries
+        return bounds[2] if bounds else None
+
+    def reset_dimensions(self) -> None:
+        """
+        Ignore the ``<dimension>`` element, e.g. when it is inflated.
+
+        Rows produced by :meth:`iter_rows` without explicit bounds then end
+        at their last cell instead of being padded to the sheet dimensions.
+        """
+        self._dimensions = None
+        self._dimensions_read = True
+        self._dimensions_trusted = False
+
+    def _read_dimensions(self) -> Optional[Tuple[int, int, int, int]]:
+        """Read ``<dimension>`` element stopping at the start of sheet data."""
+        with self.package.open_part(self.entry.path) as stream:
+            for event, node in iter_xml_events(stream, ("start", "end")):
+                if node.tag == SHEET_DATA_TAG:
+                    return None
+                if event == "end" and node.tag == DIMENSION_TAG:
+                    return self._parse_dimension(node)
+        return None
+
+    def scan_dimensions(self, max_rows: int) -> Tuple[int, int, bool]:
+        """
+        Find the last used row and column by scanning sheet data.
+
+        Used when the sheet has no ``<dimension>`` element. Cell values are
+        not converted and the scan stops after ``max_rows`` rows.
+
+        Args:
+            max_rows: Maximum number of rows to scan
+
+        Returns:
+            Tuple[int, int, bool]: Last row, last column (1-based) and whether
+            the whole sheet was scanned
+        """
+        last_row = last_col = scanned = 0
+        with self.package.open_part(self.entry.path) as stream:
+            for row_idx, cells in _SheetParser(stream).rows():
+                if scanned >= max_rows:
+                    return last_row, last_col, False
+                scanned += 1
+                if cells:
+                    last_row = row_idx
+                    last_col = max(last_col, cells[-1][0])
+        return last_row, last_col, True
+
+    @staticmethod
+    def _parse_dimension(node: ET.Element) -> Optional[Tuple[int, int, int, int]]:
+        """Convert ``<dimension ref="A1:D10">`` to boundaries."""
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(node.get("ref", ""))
+        except (TypeError, ValueError):
+            return None
+        return min_col, min_row, max_col, max_row
+
+    def iter_rows(
+        self,
+        min_row: Optional[int] = None,
+        max_row: Optional[int] = None,
+        min_col: Optional[int] = None,
+        max_col: Optional[int] = None,
+        values_only: bool = True,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Stream rows of cell values.
+
+        Mirrors read-only openpyxl semantics: missing rows inside the requested
+        window are produced as empty rows and the row width follows the sheet
+        dimensions (or the last cell of the row when dimensions are absent).
+
+        Args:
+            min_row: First row to produce (1-based)
+            max_row: Last row to produce (1-based)
+            min_col: First column to produce (1-based)
+            max_col: Last column to produce (1-based)
+            values_only: Only values are supported; kept for API compatibility
+
+        Yields:
+            Tuple[Any, ...]: Cell values of one row
+        """
+        min_row = min_row or 1
+        min_col = min_col or 1
+
+        package = self.package
+        shared_strings = None
+        date_formats, timedelta_formats = package.date_styles
+        epoch = package.epoch
+
+        empty_row: Tuple[Any, ...] = ()
+        if max_col is not None:
+            empty_row = (None,) * (max_col + 1 - min_col)
+
+        counter = min_row
+        row_idx = 0
+        dimension_checked = False
+
+        with package.open_sheet_data(self.entry.path) as stream:
+            parser = _SheetParser(stream, min_row, max_row, min_col, max_col)
+            for row_idx, cells in parser.rows():
+                if not dimension_checked:
+                    dimension_checked = True
+                    bounds = parser.dimension if self._dimensions_trusted else None
+                    if bounds is not None:
+                        if max_col is None:
+                            max_col = bounds[2]
+                            empty_row = (None,) * (max_col + 1 - min_col)
+                        if max_row is None:
+                            max_row = bounds[3]
+
+                if max_row is not None and row_idx > max_row:
+                    break
+
+                # Some rows are missing
+                while counter < row_idx:
+                    counter += 1
+                    yield empty_row
+
+                if counter > row_idx:
+                    continue
+
+                counter += 1
+                if not cells and max_col is None:
+                    yield ()
+                    continue
+
+                width = max_col or cells[-1][0]
+                values: List[Any] = [None] * (width + 1 - min_col)
+                for col_idx, data_type, style_id, text in cells:
+                    if min_col <= col_idx <= width and text is not None:
+                        if data_type == "s" and shared_strings is None:
+                            shared_strings = package.shared_strings
+                        values[col_idx - min_col] = _cell_value(
+                            data_type,
+                            style_id,
+                            text,
+                            shared_strings,
+                            date_formats,
+                            timedelta_formats,
+                            epoch,
+                        )
+                yield tuple(values)
+
+        if max_row is not None and max_row < row_idx:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+
+class _ParseState:
+    """Mutable state shared by the expat callbacks of :class:`_SheetParser`."""
+
+    __slots__ = (
+        "row",
+        "column",
+        "cell_type",
+        "style",
+        "collecting",
+        "inline_seen",
+        "in_phonetic",
+        "row_in_window",
+        "cell_in_window",
+        "past_window",
+    )
+
+    def __init__(self) -> None:
+        self.row = 0
+        self.column = 0
+        self.cell_type = "n"
+        self.style = 0
+        # Character data is collected into the cell text
+        self.collecting = False
+        # An <is> element was seen in the current inline string cell
+        self.inline_seen = False
+        # Inside a phonetic run, whose text is not part of the value
+        self.in_phonetic = False
+        self.row_in_window = False
+        self.cell_in_window = False
+        self.past_window = False
+
+
+class _SheetParser:
+    """
+    Event-driven (expat) parser of worksheet ``<sheetData>``.
+
+    No element tree is built: rows are collected as lists of raw cell tuples
+    ``(column, type, style, text)`` and handed out after every fed chunk, so
+    memory use is bounded by the chunk size rather than the sheet size.
+    The first row after the window is handed out without cells to mark the
+    end of the window.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+        min_col: int = 1,
+        max_col: Optional[int] = None,
+    ):
+        """
+        Initialize parser over a worksheet stream.
+
+        Rows and cells outside of the window are parsed but never collected,
+        and parsing stops at the end of the chunk containing the first row
+        after ``max_row``.
+
+        Args:
+            stream: Binary stream of the worksheet part
+            min_row: First row to collect (1-based)
+            max_row: Last row to collect (1-based), None for all
+            min_col: First column to collect (1-based)
+            max_col: Last column to collect (1-based), None for all
+        """
+        self.stream = stream
+        self.min_row = min_row
+        self.max_row = max_row
+        self.min_col = min_col
+        self.max_col = max_col
+        self.dimension: Optional[Tuple[int, int, int, int]] = None
+
+    def rows(self) -> Iterator[Tuple[int, List[Tuple[int, str, int, Any]]]]:
+        """
+        Parse the stream and yield rows.
+
+        Yields:
+            Tuple[int, List]: 1-based row index and its raw cells
+        """
+        ready: List[Tuple[int, List[Tuple[int, str, int, Any]]]] = []
+        cells: List[Tuple[int, str, int, Any]] = []
+        text: List[str] = []
+        column_cache: Dict[str, int] = {}
+        min_row = self.min_row
+        max_row = self.max_row if self.max_row is not None else float("inf")
+        min_col = self.min_col
+        max_col = self.max_col if self.max_col is not None else float("inf")
+        state = _ParseState()
+
+        def start(name: str, attrs: Dict[str, str]) -> None:
+            if state.past_window:
+                return
+            if name == _EXPAT_CELL_TAG:
+                coordinate = attrs.get("r")
+                if coordinate:
+                    letters = coordinate.rstrip(_DIGITS)
+                    col_idx = column_cache.get(letters)
+                    if col_idx is None:
+                        col_idx = column_to_index(letters) + 1
+                        column_cache[letters] = col_idx
+                    state.column = col_idx
+                else:
+                    state.column += 1
+                state.cell_in_window = (
+                    state.row_in_window and min_col <= state.column <= max_col
+                )
+                if not state.cell_in_window:
+                    return
+                state.cell_type = attrs.get("t", "n")
+                style = attrs.get("s")
+                state.style = int(style) if style else 0
+                state.inline_seen = False
+                text.clear()
+            elif name == _EXPAT_ROW_TAG:
+                ref = attrs.get("r")
+                state.row = int(float(ref)) if ref else state.row + 1
+                state.column = 0
+                if state.row > max_row:
+                    state.past_window = True
+                    ready.append((state.row, []))
+                    return
+                state.row_in_window = state.row >= min_row
+                cells.clear()
+            elif state.cell_in_window:
+                if name == _EXPAT_VALUE_TAG:
+                    state.collecting = state.cell_type != "inlineStr"
+                elif name == _EXPAT_TEXT_TAG:
+                    state.collecting = (
+                        state.cell_type == "inlineStr" and not state.in_phonetic
+                    )
+                elif name == _EXPAT_INLINE_STRING_TAG:
+                    state.inline_seen = True
+                elif name == _EXPAT_PHONETIC_RUN_TAG:
+                    state.in_phonetic = True
+            elif name == _EXPAT_DIMENSION_TAG:
+                try:
+                    self.dimension = range_boundaries(attrs.get("ref", ""))
+                except (TypeError, ValueError):
+                    self.dimension = None
+
+        def end(name: str) -> None:
+            if not state.cell_in_window:
+                if (
+                    name == _EXPAT_ROW_TAG
+                    and state.row_in_window
+                    and not state.past_window
+                ):
+                    ready.append((state.row, cells[:]))
+                return
+            if name == _EXPAT_CELL_TAG:
+                if state.cell_type == "inlineStr":
+                    value = "".join(text) if state.inline_seen else None
+                else:
+                    value = "".join(text) or None
+                cells.append((state.column, state.cell_type, state.style, value))
+                state.cell_in_window = False
+            elif name == _EXPAT_VALUE_TAG or name == _EXPAT_TEXT_TAG:
+                state.collecting = False
+            elif name == _EXPAT_PHONETIC_RUN_TAG:
+                state.in_phonetic = False
+
+        def characters(data: str) -> None:
+            if state.collecting:
+                text.append(data)
+
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+
+        read = self.stream.read
+        while True:
+            chunk = read(XML_CHUNK_SIZE)
+            parser.Parse(chunk, not chunk)
+            if ready:
+                yield from ready
+                ready.clear()
+            if not chunk or state.past_window:
+                break
+
+
+def _cell_value(
+    data_type: str,
+    style_id: int,
+    value: str,
+    shared_strings: Optional[Union[List[str], SharedStringTable]],
+    date_formats: Set[int],
+    timedelta_formats: Set[int],
+    epoch: Any,
+) -> Any:
+    """
+    Convert raw cell text to a Python value (cached values only).
+
+    Args:
+        data_type: Cell type attribute (``t``)
+        style_id: Cell style index (``s``)
+        value: Cell text (``<v>`` or inline string)
+        shared_strings: Shared strings table
+        date_formats: Style indexes formatted as dates
+        timedelta_formats: Style indexes formatted as timedeltas
+        epoch: Workbook date epoch
+
+    Returns:
+        Any: Cell value as openpyxl would return it with ``data_only=True``
+    """
+    if data_type == "n":
+        number = _cast_number(value)
+        if style_id in date_formats:
+            try:
+                return from_excel(
+                    number, epoch, timedelta=style_id in timedelta_formats
+                )
+            except (OverflowError, ValueError):
+                logger.warning(
+                    f"Cell is marked as a date but the serial value {number} "
+                    "is outside the limits for dates"
+                )
+                return "#VALUE!"
+        return number
+    if data_type == "s":
+        return shared_strings[int(value)] if shared_strings is not None else None
+    if data_type == "b":
+        return bool(int(value))
+    if data_type == "d":
+        return from_ISO8601(value)
+    return value
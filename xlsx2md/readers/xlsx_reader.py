@@ -2,15 +2,20 @@
 XLSX file reader implementation.
 """
 
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 import logging
+import weakref
 
 import openpyxl
 from openpyxl.utils import get_column_letter
 
 from .base import BaseReader
-from ..utils import find_sheet_by_name_or_index
-from ..config import ERROR_MESSAGES
+from .mapped_file import map_file, MappedFile
+from .projection import ColumnProjection, ColumnSpec
+from .sampling import RowSampler
+from .xlsx_package import XLSXPackage
+from ..utils import find_sheet_by_name_or_index, parse_cell_range
+from ..config import ERROR_MESSAGES, INFO_SCAN_MAX_ROWS
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,14 @@ logger = logging.getLogger(__name__)
 class XLSXReader(BaseReader):
     """Reader for XLSX files."""
 
+    def __init__(self):
+        """Initialize reader."""
+        super().__init__()
+        # Memory maps backing open workbooks, closed by close_workbook
+        self._mapped_files: "weakref.WeakKeyDictionary[object, MappedFile]" = (
+            weakref.WeakKeyDictionary()
+        )
+
     def read(
         self,
         file_path: str,
@@ -25,6 +38,9 @@ class XLSXReader(BaseReader):
         cell_range: Optional[str] = None,
         encoding: Optional[str] = None,
         max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> List[List[str]]:
         """
         Read data from XLSX file.
@@ -35,6 +51,10 @@ class XLSXReader(BaseReader):
             cell_range: Cell range in A1:B10 format
             encoding: Not used for XLSX files
             max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
 
         Returns:
             List[List[str]]: Data as list of rows
@@ -46,35 +66,19 @@ class XLSXReader(BaseReader):
         try:
             logger.info(f"Reading XLSX file: {file_path}")
 
-            # Load workbook
-            workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
-
-            # Get sheet
-            if sheet_name_or_index is None:
-                sheet = workbook.active
-                # Handle case when active sheet is None (corrupted file)
-                if sheet is None:
-                    if not workbook.sheetnames:
-                        raise ValueError(
-                            "File appears to be corrupted or empty - "
-                            "no sheets found in workbook"
-                        )
-                    sheet = workbook.worksheets[0]
-                    logger.warning("Active sheet is None, using first available sheet")
-                logger.info(f"Using sheet: {sheet.title}")
-            else:
-                sheet = find_sheet_by_name_or_index(workbook, sheet_name_or_index)
-                logger.info(f"Using sheet: {sheet.title}")
-
-            # Read data
-            data = self._read_sheet_data(sheet, cell_range, max_rows)
-
-            # Clean and normalize data
-            data = self._clean_data(data)
-            data = self._normalize_data(data)
-
-            # Validate data
-            self._validate_data(data)
+            workbook = self.open_workbook(file_path)
+            try:
+                data = self._read_sheet(
+                    workbook,
+                    sheet_name_or_index,
+                    cell_range,
+                    max_rows,
+                    columns,
+                    sample,
+                    seed,
+                )
+            finally:
+                self.close_workbook(workbook)
 
             logger.info(f"Successfully read {len(data)} rows from XLSX file")
             return data
@@ -87,8 +91,164 @@ class XLSXReader(BaseReader):
             logger.error(f"Error reading XLSX file {file_path}: {e}")
             raise ValueError(f"Failed to read XLSX file: {e}")
 
+    def open_workbook(self, file_path: str):
+        """
+        Open workbook for reading cell values.
+
+        The file is memory-mapped when possible so that zip members are read
+        from the page cache.
+
+        Args:
+            file_path: Path to the XLSX file
+
+        Returns:
+            Read-only OpenPyXL workbook
+        """
+        mapped = map_file(file_path)
+        try:
+            workbook = openpyxl.load_workbook(
+                mapped or file_path, data_only=True, read_only=True
+            )
+        except Exception:
+            if mapped is not None:
+                mapped.close()
+            raise
+        if mapped is not None:
+            self._mapped_files[workbook] = mapped
+        return workbook
+
+    def close_workbook(self, workbook) -> None:
+        """
+        Close workbook opened with open_workbook.
+
+        Args:
+            workbook: Workbook returned by open_workbook
+        """
+        workbook.close()
+        mapped = self._mapped_files.pop(workbook, None)
+        if mapped is not None:
+            mapped.close()
+
+    def get_workbook_sheet_names(self, workbook) -> List[str]:
+        """
+        Get sheet names of an opened workbook.
+
+        Args:
+            workbook: Workbook returned by open_workbook
+
+        Returns:
+            List[str]: List of sheet names
+        """
+        return list(workbook.sheetnames)
+
+    def read_sheet(
+        self,
+        workbook,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Read one sheet of an opened workbook.
+
+        Args:
+            workbook: Workbook returned by open_workbook
+            sheet_name_or_index: Sheet name or index (default: active sheet)
+            cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of rows to read
+            columns: Column letters, 0-based indices or header names to keep
+            sample: Keep the header and a uniform random sample of this many
+                of the following rows (None for all rows)
+            seed: Random seed for a reproducible sample
+
+        Returns:
+            List[List[str]]: Data as list of rows
+
+        Raises:
+            ValueError: If sheet not found or invalid parameters
+        """
+        try:
+            return self._read_sheet(
+                workbook,
+                sheet_name_or_index,
+                cell_range,
+                max_rows,
+                columns,
+                sample,
+                seed,
+            )
+        except Exception as e:
+            logger.error(f"Error reading XLSX sheet {sheet_name_or_index}: {e}")
+            raise ValueError(f"Failed to read XLSX file: {e}")
+
+    def _read_sheet(
+        self,
+        workbook,
+        sheet_name_or_index: Optional[Union[str, int]] = None,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        columns: Optional[Sequence[ColumnSpec]] = None,
+        sample: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> List[List[str]]:
+        """Read, clean and validate one sheet of an opened workbook."""
+        # Get sheet
+        sheet = self._get_sheet(workbook, sheet_name_or_index)
+        logger.info(f"Using sheet: {sheet.title}")
+
+        # Read data
+        projection = ColumnProjection(columns) if columns else None
+        sampler = RowSampler(sample, seed) if sample else None
+        data = self._read_sheet_data(sheet, cell_range, max_rows, projection, sampler)
+
+        # Clean and normalize data
+        data = self._clean_data(data)
+        data = self._normalize_data(data)
+
+        # Validate data
+        self._validate_data(data)
+
+        return data
+
+    def _get_sheet(self, workbook, sheet_name_or_index: Optional[Union[str, int]]):
+        """
+        Get sheet by name or index, falling back to the active sheet.
+
+        Args:
+            workbook: Workbook returned by open_workbook
+            sheet_name_or_index: Sheet name or index (None for active sheet)
+
+        Returns:
+            Worksheet object
+
+        Raises:
+            ValueError: If sheet not found or workbook has no sheets
+        """
+        if sheet_name_or_index is not None:
+            return find_sheet_by_name_or_index(workbook, sheet_name_or_index)
+
+        sheet = workbook.active
+        # Handle case when active sheet is None (corrupted file)
+        if sheet is None:
+            if not workbook.sheetnames:
+                raise ValueError(
+                    "File appears to be corrupted or empty - "
+                    "no sheets found in workbook"
+                )
+            sheet = workbook.worksheets[0]
+            logger.warning("Active sheet is None, using first available sheet")
+        return sheet
+
     def _read_sheet_data(
-        self, sheet, cell_range: Optional[str] = None, max_rows: Optional[int] = None
+        self,
+        sheet,
+        cell_range: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
     ) -> List[List[str]]:
         """
         Read data from worksheet.
@@ -97,87 +257,163 @@ class XLSXReader(BaseReader):
             sheet: OpenPyXL worksheet object
             cell_range: Cell range in A1:B10 format
             max_rows: Maximum number of rows to read
+            projection: Columns to keep
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: Raw data from sheet
         """
         # Determine range to read
         if cell_range:
-            data = self._read_cell_range(sheet, cell_range)
+            data = self._read_cell_range(
+                sheet, cell_range, max_rows, projection, sampler
+            )
         else:
-            data = self._read_all_data(sheet, max_rows)
+            data = self._read_all_data(sheet, max_rows, projection, sampler)
 
         return data
 
-    def _read_cell_range(self, sheet, cell_range: str) -> List[List[str]]:
+    def _read_cell_range(
+        self,
+        sheet,
+        cell_range: str,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> List[List[str]]:
         """
         Read data from specific cell range.
 
+        The range bounds are handed to ``iter_rows`` so that rows and columns
+        outside of the range are never materialized and the worksheet stream
+        is closed once the last row of the range has been read.
+
         Args:
             sheet: OpenPyXL worksheet object
             cell_range: Cell range in A1:B10 format
+            max_rows: Maximum number of non-empty rows to read
+            projection: Columns to keep (must lie within the range)
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: Data from specified range
-        """
-        try:
-            # Parse range
-            from ..utils import parse_cell_range
-
-            (start_row, start_col), (end_row, end_col) = parse_cell_range(cell_range)
 
-            # Convert to 1-based indexing for OpenPyXL
-            start_row += 1
-            start_col += 1
-            end_row += 1
-            end_col += 1
-
-            data = []
-            for row_num in range(start_row, end_row + 1):
-                row_data = []
-                for col_num in range(start_col, end_col + 1):
-                    cell = sheet.cell(row=row_num, column=col_num)
-                    row_data.append(cell.value)
-                data.append(row_data)
-
-            return data
-
-        except Exception as e:
-            logger.warning(f"Failed to read cell range {cell_range}: {e}")
-            return self._read_all_data(sheet)
+        Raises:
+            ValueError: If the cell range or column selection is invalid
+        """
+        (start_row, start_col), (end_row, end_col) = parse_cell_range(cell_range)
+        if start_row < 0 or start_col < 0 or end_row < start_row or end_col < start_col:
+            raise ValueError(
+                ERROR_MESSAGES["invalid_range"].format(range_str=cell_range)
+            )
 
-    def _read_all_data(self, sheet, max_rows: Optional[int] = None) -> List[List[str]]:
+        # Narrow the column window to the projected columns
+        if projection is not None and projection.bounds is not None:
+            first, last = projection.bounds
+            if first < start_col or last > end_col:
+                raise ValueError(
+                    ERROR_MESSAGES["column_not_found"].format(
+                        column=", ".join(str(c) for c in projection.columns)
+                    )
+                )
+            start_col, end_col = first, last
+
+        # Convert to 1-based indexing for OpenPyXL
+        rows = sheet.iter_rows(
+            min_row=start_row + 1,
+            max_row=end_row + 1,
+            min_col=start_col + 1,
+            max_col=end_col + 1,
+            values_only=True,
+        )
+
+        return self._collect_rows(
+            rows,
+            max_rows,
+            skip_empty=False,
+            projection=projection,
+            offset=start_col,
+            sampler=sampler,
+        )
+
+    def _read_all_data(
+        self,
+        sheet,
+        max_rows: Optional[int] = None,
+        projection: Optional[ColumnProjection] = None,
+        sampler: Optional[RowSampler] = None,
+    ) -> List[List[str]]:
         """
         Read all data from worksheet.
 
+        Rows are consumed in a single forward pass as value tuples; empty
+        rows are dropped as they are produced and reading stops (closing the
+        worksheet stream) once ``max_rows`` non-empty rows have been read.
+        Columns selected by letter or index bound the columns that are read.
+
+        Without a projection, rows are trimmed to the cells that hold values
+        rather than the (possibly inflated) sheet dimensions. The used range
+        found by a complete read is cached per sheet object and bounds later
+        reads of the same loaded workbook; it is not kept across sessions.
+
         Args:
             sheet: OpenPyXL worksheet object
-            max_rows: Maximum number of rows to read
+            max_rows: Maximum number of non-empty rows to read
+            projection: Columns to keep
+            sampler: Row sampler
 
         Returns:
             List[List[str]]: All data from sheet
         """
-        data = []
-
-        # Get dimensions
-        max_row = sheet.max_row
-        max_col = sheet.max_column
+        used_range = self._used_ranges.get(sheet)
+        if used_range is not None and not used_range.nrows:
+            return []
+        max_row = used_range.nrows if used_range else None
+        max_col = used_range.ncols if used_range else None
+
+        if projection is None:
+            if used_range is None:
+                # Rows are trimmed while reading, so padding them to possibly
+                # inflated sheet dimensions would only waste time
+                sheet.reset_dimensions()
+            rows = sheet.iter_rows(max_row=max_row, max_col=max_col, values_only=True)
+            data, detected = self._collect_used_rows(rows, max_rows, sampler)
+            if detected is not None:
+                logger.info(f"Used range of {sheet.title}: {detected}")
+                self._used_ranges[sheet] = detected
+            return data
 
-        if max_rows:
-            max_row = min(max_row, max_rows)
+        min_col = 1
+        bounds = projection.bounds
+        if bounds is not None:
+            min_col, max_col = bounds[0] + 1, bounds[1] + 1
+        rows = sheet.iter_rows(
+            max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+        )
+        return self._collect_rows(
+            rows, max_rows, projection=projection, offset=min_col - 1, sampler=sampler
+        )
+
+    def get_sheet_list(self, file_path: str) -> List[dict]:
+        """
+        Get sheet names, order and visibility from workbook metadata.
 
-        # Read data row by row
-        for row_num in range(1, max_row + 1):
-            row_data = []
-            for col_num in range(1, max_col + 1):
-                cell = sheet.cell(row=row_num, column=col_num)
-                row_data.append(cell.value)
+        Only the zip central directory, the relationships and
+        ``xl/workbook.xml`` are read; worksheets, shared strings and styles
+        are not loaded.
 
-            # Skip empty rows
-            if any(cell is not None and str(cell).strip() for cell in row_data):
-                data.append(row_data)
+        Args:
+            file_path: Path to the XLSX file
 
-        return data
+        Returns:
+            List[dict]: Sheets in workbook order with index, name and state
+            ("visible", "hidden" or "veryHidden")
+        """
+        with XLSXPackage(file_path) as package:
+            return [
+                {"index": i, "name": entry.name, "state": entry.state}
+                for i, entry in enumerate(package.sheets)
+            ]
 
     def get_sheet_names(self, file_path: str) -> List[str]:
         """
@@ -190,12 +426,56 @@ class XLSXReader(BaseReader):
             List[str]: List of sheet names
         """
         try:
-            workbook = openpyxl.load_workbook(file_path, read_only=True)
-            return list(workbook.sheetnames)
+            return [sheet["name"] for sheet in self.get_sheet_list(file_path)]
+        except Exception as e:
+            logger.warning(f"Failed to read sheet list from metadata: {e}")
+
+        try:
+            workbook = self.open_workbook(file_path)
+            try:
+                return self.get_workbook_sheet_names(workbook)
+            finally:
+                self.close_workbook(workbook)
         except Exception as e:
             logger.error(f"Error getting sheet names from {file_path}: {e}")
             return []
 
+    def get_workbook_info(self, file_path: str) -> List[dict]:
+        """
+        Get dimensions of every sheet with one package open.
+
+        Dimensions come from each worksheet's ``<dimension>`` element, which
+        precedes the cell data. Sheets without it are scanned, up to
+        INFO_SCAN_MAX_ROWS rows, for their last used row and column; cell
+        values, shared strings and styles are never loaded.
+
+        Args:
+            file_path: Path to the XLSX file
+
+        Returns:
+            List[dict]: Sheet information in workbook order
+        """
+        info = []
+        with XLSXPackage(file_path) as package:
+            for index, worksheet in enumerate(package.worksheets):
+                bounds = worksheet.dimensions_boundaries
+                if bounds is not None:
+                    nrows, ncols, exact = bounds[3], bounds[2], True
+                else:
+                    logger.info(f"No dimension in sheet {worksheet.title}, scanning")
+                    nrows, ncols, exact = worksheet.scan_dimensions(INFO_SCAN_MAX_ROWS)
+                info.append(
+                    self._make_sheet_info(
+                        index,
+                        worksheet.title,
+                        nrows,
+                        ncols,
+                        state=worksheet.sheet_state,
+                        exact=exact,
+                    )
+                )
+        return info
+
     def get_sheet_info(
         self, file_path: str, sheet_name_or_index: Optional[Union[str, int]] = None
     ) -> dict:
@@ -210,26 +490,30 @@ class XLSXReader(BaseReader):
             dict: Sheet information
         """
         try:
-            workbook = openpyxl.load_workbook(file_path, read_only=True)
-
-            if sheet_name_or_index is None:
-                sheet = workbook.active
-                # Handle case when active sheet is None (corrupted file)
-                if sheet is None:
-                    if not workbook.sheetnames:
-                        return {}
-                    sheet = workbook.worksheets[0]
-            else:
-                sheet = find_sheet_by_name_or_index(workbook, sheet_name_or_index)
-
-            info = {
-                "name": sheet.title,
-                "max_row": sheet.max_row,
-                "max_column": sheet.max_column,
-                "dimensions": (
-                    f"A1:{get_column_letter(sheet.max_column)}{sheet.max_row}"
-                ),
-            }
+            workbook = self.open_workbook(file_path)
+            try:
+                if sheet_name_or_index is None:
+                    sheet = workbook.active
+                    # Handle case when active sheet is None (corrupted file)
+                    if sheet is None:
+                        if not workbook.sheetnames:
+                            return {}
+                        sheet = workbook.worksheets[0]
+                else:
+                    sheet = find_sheet_by_name_or_index(workbook, sheet_name_or_index)
+
+                info = {
+                    "name": sheet.title,
+                    "nrows": sheet.max_row,
+                    "ncols": sheet.max_column,
+                    "max_row": sheet.max_row,
+                    "max_column": sheet.max_column,
+                    "dimensions": (
+                        f"A1:{get_column_letter(sheet.max_column)}{sheet.max_row}"
+                    ),
+                }
+            finally:
+                self.close_workbook(workbook)
 
             return info
 
@@ -0,0 +1,123 @@
+"""
+Cache of rendered sheets for incremental re-conversion of XLSX workbooks.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from .config import VERSION
+from .readers.xlsx_package import XLSXPackage
+
+logger = logging.getLogger(__name__)
+
+
+def sheet_fingerprints(file_path: str) -> List[Tuple[str, str]]:
+    """
+    Get name and content fingerprint of every sheet of an XLSX workbook.
+
+    Only the zip central directory, the relationships and
+    ``xl/workbook.xml`` are read; see :meth:`XLSXPackage.sheet_fingerprints`.
+
+    Args:
+        file_path: Path to the XLSX file
+
+    Returns:
+        List[Tuple[str, str]]: (sheet name, fingerprint) in workbook order
+
+    Raises:
+        ValueError: If the file is not a valid XLSX package
+    """
+    with XLSXPackage(file_path) as package:
+        return list(zip(package.sheetnames, package.sheet_fingerprints()))
+
+
+class RenderCache:
+    """
+    Rendered Markdown of the sheets of one workbook, keyed by fingerprint.
+
+    Each workbook has its own JSON file in the cache directory, tagged with
+    the conversion options and the xlsx2md version; a file written with
+    different options or by another version is ignored. Entries that were
+    not looked up or stored since loading are dropped on :meth:`save`.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], file_path: str, options: Dict[str, Any]
+    ):
+        """
+        Load cached sheets of a workbook.
+
+        Args:
+            cache_dir: Cache directory (created on save)
+            file_path: Path to the workbook
+            options: Conversion options that affect the rendered Markdown
+        """
+        key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        self.path = Path(cache_dir) / f"{key}.json"
+        self.options = json.loads(json.dumps(options))
+        self._entries = self._load()
+        self._kept: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, str]:
+        """Read the cache file, ignoring missing, stale or broken files."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                content = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable render cache {self.path}: {e}")
+            return {}
+
+        if not isinstance(content, dict) or not isinstance(
+            content.get("sheets", {}), dict
+        ):
+            logger.warning(f"Ignoring malformed render cache {self.path}")
+            return {}
+        if content.get("version") != VERSION or content.get("options") != self.options:
+            logger.info("Render cache was written with other options, ignoring it")
+            return {}
+        return dict(content.get("sheets", {}))
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """
+        Get rendered sheet by fingerprint.
+
+        Args:
+            fingerprint: Sheet fingerprint
+
+        Returns:
+            Optional[str]: Cached Markdown, or None if the sheet is not cached
+        """
+        body = self._entries.get(fingerprint)
+        if body is not None:
+            self._kept[fingerprint] = body
+        return body
+
+    def put(self, fingerprint: str, body: str) -> None:
+        """
+        Store rendered sheet.
+
+        Args:
+            fingerprint: Sheet fingerprint
+            body: Rendered Markdown
+        """
+        self._entries[fingerprint] = body
+        self._kept[fingerprint] = body
+
+    def save(self) -> None:
+        """Write the cache file atomically; failures are only logged."""
+        content = {"version": VERSION, "options": self.options, "sheets": self._kept}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(content, file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write render cache {self.path}: {e}")
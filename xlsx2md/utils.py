@@ -6,10 +6,17 @@ import os
 import re
 from pathlib import Path
 from typing import List, Tuple, Optional, Union, Any
+import codecs
+import functools
 import logging
 import contextlib
 
-from .config import SUPPORTED_FORMATS, ERROR_MESSAGES
+from .config import (
+    ENCODING_DETECT_CHUNK_KB,
+    ENCODING_DETECT_WINDOW_KB,
+    ERROR_MESSAGES,
+    SUPPORTED_FORMATS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +186,32 @@ def index_to_column(index: int) -> str:
     return result
 
 
+def parse_column_list(columns: str) -> List[Union[str, int]]:
+    """
+    Parse comma-separated column selection.
+
+    Numbers become 0-based column indices; everything else (column letters
+    or header names) is kept as a string.
+
+    Args:
+        columns: Column selection, e.g. "A,C,5,Price"
+
+    Returns:
+        List[Union[str, int]]: Parsed column specifications
+
+    Examples:
+        >>> parse_column_list("A, 2, 'Unit Price'")
+        ['A', 2, 'Unit Price']
+    """
+    result: List[Union[str, int]] = []
+    for item in columns.split(","):
+        item = item.strip().strip("\"'")
+        if not item:
+            continue
+        result.append(int(item) if item.isdigit() else item)
+    return result
+
+
 def normalize_sheet_name(sheet_name: str) -> str:
     """
     Normalize sheet name for case-insensitive search.
@@ -333,20 +366,89 @@ def format_cell_content(content: str, width: int, alignment: str = "left") -> st
         return content.ljust(width)
 
 
-def detect_csv_encoding(file_path: str) -> str:
-    """Detects CSV file encoding."""
-    import chardet
+# UTF-32 marks start with the UTF-16 ones, so they are checked first
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_csv_encoding(file_path: str, window_kb: Optional[int] = None) -> str:
+    """
+    Detects CSV file encoding.
 
+    Detection stops at the first step that decides:
+
+    1. A byte order mark selects the matching BOM-stripping codec.
+    2. If the first ``window_kb`` KB are valid UTF-8 (including pure ASCII),
+       the file is taken to be UTF-8.
+    3. Otherwise chunks holding non-ASCII bytes are fed to chardet's
+       incremental detector until it is confident or the window ends.
+
+    The result is cached per path, size and modification time, so repeated
+    reads of an unchanged file skip detection.
+
+    Args:
+        file_path: Path to the CSV file
+        window_kb: Bytes inspected, in KB (default: ENCODING_DETECT_WINDOW_KB)
+
+    Returns:
+        str: Encoding name, "utf-8" if detection fails
+    """
     try:
-        with open(file_path, "rb") as f:
-            raw_data = f.read(10000)  # Read first 10KB to detect encoding
-            result = chardet.detect(raw_data)
-            return result["encoding"] or "utf-8"
+        stat = os.stat(file_path)
+        return _detect_encoding(
+            os.path.abspath(file_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            (window_kb or ENCODING_DETECT_WINDOW_KB) * 1024,
+        )
     except Exception as e:
         logger.warning(f"Failed to detect encoding for file {file_path}: {e}")
         return "utf-8"
 
 
+@functools.lru_cache(maxsize=128)
+def _detect_encoding(file_path: str, size: int, mtime_ns: int, window: int) -> str:
+    """Detect encoding of an unchanged file; see detect_csv_encoding."""
+    with open(file_path, "rb") as f:
+        head = f.read(window)
+
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            logger.info(f"Detected {encoding} byte order mark")
+            return encoding
+
+    try:
+        # A multibyte character may be cut at the end of a partial window
+        codecs.getincrementaldecoder("utf-8")().decode(head, len(head) >= size)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    from chardet import UniversalDetector
+
+    detector = UniversalDetector()
+    chunk_size = ENCODING_DETECT_CHUNK_KB * 1024
+    for start in range(0, len(head), chunk_size):
+        chunk = head[start : start + chunk_size]
+        if chunk.isascii():
+            continue
+        detector.feed(chunk)
+        if detector.done:
+            break
+    detector.close()
+    result = detector.result
+    logger.info(
+        f"chardet detected {result['encoding']} "
+        f"(confidence {result['confidence']:.2f})"
+    )
+    return result["encoding"] or "utf-8"
+
+
 def ensure_output_directory(output_path: str) -> None:
     """Creates output directory if it doesn't exist."""
     output_dir = os.path.dirname(output_path)